@@ -0,0 +1,13 @@
+import os
+import sys
+from pathlib import Path
+
+
+def setup_django() -> None:
+    """Configure Django with the test settings so services can be used."""
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "src.config.test_settings")
+
+    import django
+
+    django.setup()
@@ -0,0 +1,74 @@
+"""
+Wall time of balances and transactions, account by account vs fanned out.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_account_fanout --accounts 1,5,10,20
+
+For each number of accounts the stand-in (``--latency`` seconds per call)
+is extracted with ``OFDA_EXTRACTION_CONCURRENCY=1`` and with
+``--concurrency``. Sequential time grows with the number of accounts;
+fanned out it should stay close to one account's time until the
+concurrency cap is reached.
+"""
+
+import argparse
+import time
+
+from benchmarks._django import setup_django
+from benchmarks.ofda_standin import OFDAStandIn
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--accounts", default="1,5,10,20")
+    parser.add_argument("--pages", type=int, default=2)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--concurrency", type=int, default=40)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.conf import settings
+
+    from src.financial.services.dtos.consent import ConsentData
+    from src.financial.services.extraction_service import ExtractionService
+
+    settings.OFDA_CONDITIONAL_GET = False
+    settings.OFDA_BULKHEAD_LIMITS = []
+    settings.OFDA_ROUTE_POLICIES = ["TransactionsRoute.page_size=10"]
+    consent = ConsentData(
+        id="consent-1",
+        dynamic_client_id="client-1",
+        status="APPROVED",
+        token="consent-token",
+    )
+
+    for accounts in (int(count) for count in args.accounts.split(",")):
+        with OFDAStandIn(
+            accounts=accounts,
+            transaction_pages=args.pages,
+            latency=args.latency,
+        ) as standin:
+            settings.OFDA_API_BASE_URL = standin.url
+            account_data = [{"id": a} for a in standin.account_ids()]
+            row = {"accounts": accounts}
+            for concurrency in (1, args.concurrency):
+                settings.OFDA_EXTRACTION_CONCURRENCY = concurrency
+                service = ExtractionService()
+                started = time.perf_counter()
+                balances, transactions = service._extract_account_data(
+                    "bench", consent, account_data
+                )
+                elapsed = time.perf_counter() - started
+                assert [b["account_id"] for b in balances] == [  # noqa: S101
+                    a["id"] for a in account_data
+                ]
+                key = "sequential" if concurrency == 1 else "fanout"
+                row[f"{key}_ms"] = round(elapsed * 1000, 1)
+                row[f"{key}_transactions"] = len(transactions)
+            print(row)
+
+
+if __name__ == "__main__":
+    main()
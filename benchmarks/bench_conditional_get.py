@@ -0,0 +1,97 @@
+"""
+Bytes moved by a re-extraction with and without the validator cache.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_conditional_get --accounts 5 --pages 10
+
+Each mode extracts the same user twice against the stand-in (which sends
+ETags) and reports what the second, warm extraction cost. Like in
+production, every extraction runs with a new consent token.
+"""
+
+import argparse
+
+from benchmarks._django import setup_django
+from benchmarks.ofda_standin import OFDAStandIn
+
+
+def extract(service: object, consent: object) -> None:
+    from src.integration.services.rate_limiter_service import (
+        rate_limit_scope,
+    )
+
+    with rate_limit_scope("bench"):
+        _extract(service, consent)
+
+
+def _extract(service: object, consent: object) -> None:
+    accounts = service._extract_accounts("bench", consent)
+    service._extract_balances("bench", consent, accounts)
+    service._extract_transactions("bench", consent, accounts)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--accounts", type=int, default=5)
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--items", type=int, default=100)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.conf import settings
+    from django.core.cache import cache
+
+    from src.financial.services.dtos.consent import ConsentData
+    from src.financial.services.extraction_service import ExtractionService
+    from src.integration.services.validator_cache_service import (
+        validator_cache,
+    )
+
+    settings.CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "bench-conditional-get",
+        }
+    }
+
+    def consent(run: int) -> ConsentData:
+        return ConsentData(
+            id=f"consent-{run}",
+            dynamic_client_id="client-1",
+            status="APPROVED",
+            token=f"consent-token-{run}",
+        )
+
+    with OFDAStandIn(
+        accounts=args.accounts,
+        transaction_pages=args.pages,
+        items_per_page=args.items,
+    ) as standin:
+        settings.OFDA_API_BASE_URL = standin.url
+        # A page size that changed between the two extractions would
+        # change the URLs and defeat the validators.
+        settings.OFDA_ROUTE_POLICIES = [
+            f"TransactionsRoute.page_size={args.items}"
+        ]
+        for enabled in (False, True):
+            settings.OFDA_CONDITIONAL_GET = enabled
+            cache.clear()
+            service = ExtractionService()
+            extract(service, consent(1))
+            standin.reset_counters()
+            extract(service, consent(2))
+            print(
+                {
+                    "conditional_get": enabled,
+                    "requests": standin.request_count,
+                    "not_modified": standin.not_modified_count,
+                    "body_bytes_sent": standin.bytes_sent,
+                }
+            )
+        print({"validator_cache": validator_cache.stats()})
+
+
+if __name__ == "__main__":
+    main()
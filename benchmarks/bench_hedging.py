@@ -0,0 +1,87 @@
+"""
+Tail latency of balance GETs with and without request hedging.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_hedging --calls 1000 --tail-ratio 0.02
+
+The stand-in answers most requests after ``--latency`` seconds and a
+``--tail-ratio`` share of them ``--tail-latency`` seconds later, the way a
+slow OFDA node or a lost packet would. Hedging should bring p99 close to
+p95 while sending at most ``OFDA_HEDGE_MAX_RATIO`` extra requests.
+"""
+
+import argparse
+import statistics
+import time
+from unittest.mock import patch
+
+from benchmarks._django import setup_django
+from benchmarks.ofda_standin import OFDAStandIn
+
+
+def percentile(samples: list[float], value: float) -> float:
+    ordered = sorted(samples)
+    return ordered[round(value / 100 * (len(ordered) - 1))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.005)
+    parser.add_argument("--tail-ratio", type=float, default=0.02)
+    parser.add_argument("--tail-latency", type=float, default=0.2)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.conf import settings
+
+    from src.financial.routes.balances import BalancesRoute
+    from src.integration.enums import RouteMethod
+    from src.integration.services.hedging_service import HedgingService
+
+    settings.OFDA_CONDITIONAL_GET = False
+    settings.OFDA_HEDGE_MAX_RATIO = 0.05
+
+    for hedged in (False, True):
+        settings.OFDA_HEDGING = hedged
+        service = HedgingService()
+        with (
+            OFDAStandIn(
+                latency=args.latency,
+                tail_ratio=args.tail_ratio,
+                tail_latency=args.tail_latency,
+            ) as standin,
+            patch("src.integration.routes.base.hedging", service),
+        ):
+            settings.OFDA_API_BASE_URL = standin.url
+            samples = []
+            for _ in range(args.calls):
+                route = BalancesRoute(
+                    data={
+                        "token": "consent-token",
+                        "account_id": "account-0",
+                        "operation": RouteMethod.GET,
+                    }
+                )
+                started = time.perf_counter()
+                route.integrate()
+                samples.append(time.perf_counter() - started)
+            stats = service.stats().get("BalancesRoute", {})
+            print(
+                {
+                    "hedging": hedged,
+                    "p50_ms": round(statistics.median(samples) * 1000, 1),
+                    "p95_ms": round(percentile(samples, 95) * 1000, 1),
+                    "p99_ms": round(percentile(samples, 99) * 1000, 1),
+                    "max_ms": round(max(samples) * 1000, 1),
+                    "requests": standin.request_count,
+                    "hedged": stats.get("hedged", 0),
+                    "hedge_wins": stats.get("hedge_wins", 0),
+                }
+            )
+
+
+if __name__ == "__main__":
+    main()
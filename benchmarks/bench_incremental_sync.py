@@ -0,0 +1,95 @@
+"""
+OFDA calls and wall time of a refresh, full vs incremental.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_incremental_sync --accounts 3 --pages 50 --new 0,5,25
+
+Each account starts with ``--pages`` pages of transactions. After a first
+extraction, every count in ``--new`` adds that many newer transactions to
+each account and the transactions are refreshed, once from page 1 and
+once with ``OFDA_INCREMENTAL_SYNC``, which stops at the snapshot's
+high-water mark.
+"""
+
+import argparse
+import time
+
+from benchmarks._django import setup_django
+from benchmarks.ofda_standin import OFDAStandIn
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--accounts", type=int, default=3)
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--items", type=int, default=10)
+    parser.add_argument("--new", default="0,5,25")
+    parser.add_argument("--latency", type=float, default=0.01)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.conf import settings
+
+    from src.financial.services.dtos.consent import ConsentData
+    from src.financial.services.extraction_service import ExtractionService
+
+    settings.CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "bench-incremental-sync",
+        }
+    }
+    settings.OFDA_CONDITIONAL_GET = False
+    settings.OFDA_PAGINATION_MAX_PAGES = args.pages * 2
+    settings.OFDA_ROUTE_POLICIES = [
+        f"TransactionsRoute.page_size={args.items}"
+    ]
+    consent = ConsentData(
+        id="consent-1",
+        dynamic_client_id="client-1",
+        status="APPROVED",
+        token="consent-token",
+    )
+
+    with OFDAStandIn(
+        accounts=args.accounts,
+        transaction_pages=args.pages,
+        items_per_page=args.items,
+        latency=args.latency,
+    ) as standin:
+        settings.OFDA_API_BASE_URL = standin.url
+        accounts = [{"id": a} for a in standin.account_ids()]
+
+        def refresh(incremental: bool) -> dict:
+            settings.OFDA_INCREMENTAL_SYNC = incremental
+            standin.reset_counters()
+            started = time.perf_counter()
+            transactions = ExtractionService()._extract_transactions(
+                "bench", consent, accounts
+            )
+            elapsed = time.perf_counter() - started
+            expected = args.accounts * (
+                args.pages * args.items + standin.new_transactions
+            )
+            assert len(transactions) == expected  # noqa: S101
+            return {
+                "ms": round(elapsed * 1000, 1),
+                "requests": standin.request_count,
+            }
+
+        first = refresh(incremental=True)
+        print({"first_extraction": first})
+        for new in (int(count) for count in args.new.split(",")):
+            standin.new_transactions += new
+            row = {"new_per_account": new}
+            for incremental in (False, True):
+                key = "incremental" if incremental else "full"
+                for name, value in refresh(incremental).items():
+                    row[f"{key}_{name}"] = value
+            print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Calls and latency over several OFDA endpoints, round-robin vs balanced.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_load_balancing --calls 600 --workers 8
+
+Three stand-ins serve the same API: a fast one, one ``--slow-latency``
+seconds slow and one that answers 503 to ``--error-ratio`` of the calls.
+Round-robin sends each a third of the calls; the balancer should send most
+of them to the fast endpoint, eject the failing one and keep p99 close to
+the fast endpoint's latency.
+"""
+
+import argparse
+import itertools
+import logging
+import statistics
+import threading
+import time
+from unittest.mock import patch
+
+from benchmarks._django import setup_django
+from benchmarks.ofda_standin import OFDAStandIn
+
+
+def percentile(samples: list[float], value: float) -> float:
+    ordered = sorted(samples)
+    return ordered[round(value / 100 * (len(ordered) - 1))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=600)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.005)
+    parser.add_argument("--slow-latency", type=float, default=0.05)
+    parser.add_argument("--error-ratio", type=float, default=0.5)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.conf import settings
+    from requests import HTTPError
+
+    from src.financial.routes.balances import BalancesRoute
+    from src.integration.enums import RouteMethod
+    from src.integration.services.load_balancer_service import (
+        LoadBalancerService,
+    )
+
+    settings.OFDA_CONDITIONAL_GET = False
+    # Every 503 is logged by the route; only the totals matter here.
+    logging.getLogger("core").setLevel(logging.CRITICAL)
+
+    for balanced in (False, True):
+        balancer = LoadBalancerService()
+        with (
+            OFDAStandIn(latency=args.latency) as fast,
+            OFDAStandIn(latency=args.slow_latency) as slow,
+            OFDAStandIn(
+                latency=args.latency, error_ratio=args.error_ratio
+            ) as failing,
+            patch("src.integration.routes.base.load_balancer", balancer),
+        ):
+            standins = {"fast": fast, "slow": slow, "failing": failing}
+            settings.OFDA_API_BASE_URLS = [s.url for s in standins.values()]
+            if not balanced:
+                rotation = itertools.cycle(settings.OFDA_API_BASE_URLS)
+                lock = threading.Lock()
+
+                def round_robin(available=None, rotation=rotation, lock=lock):
+                    with lock:
+                        return next(rotation)
+
+                balancer.choose = round_robin
+
+            samples: list[float] = []
+            errors = 0
+            counter_lock = threading.Lock()
+
+            def worker(
+                calls: int,
+                samples: list[float] = samples,
+                counter_lock: threading.Lock = counter_lock,
+            ) -> None:
+                nonlocal errors
+                for _ in range(calls):
+                    route = BalancesRoute(
+                        data={
+                            "token": "consent-token",
+                            "account_id": "account-0",
+                            "operation": RouteMethod.GET,
+                        }
+                    )
+                    started = time.perf_counter()
+                    try:
+                        route.integrate()
+                    except HTTPError:
+                        with counter_lock:
+                            errors += 1
+                    with counter_lock:
+                        samples.append(time.perf_counter() - started)
+
+            threads = [
+                threading.Thread(
+                    target=worker, args=(args.calls // args.workers,)
+                )
+                for _ in range(args.workers)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            print(
+                {
+                    "strategy": "balanced" if balanced else "round_robin",
+                    "p50_ms": round(statistics.median(samples) * 1000, 1),
+                    "p99_ms": round(percentile(samples, 99) * 1000, 1),
+                    "errors": errors,
+                    **{
+                        f"{name}_calls": standin.request_count
+                        for name, standin in standins.items()
+                    },
+                }
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+Logging cost per extraction with synchronous vs background handlers.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_logging --accounts 10 --pages 10 --runs 5
+
+The "core" loggers write to a log file and to the console (sent to
+/dev/null here) at DEBUG, as in development. Each mode runs the same
+extraction against the stand-in and reports the time the extracting
+thread spent inside ``Logger.handle`` (filters, formatting and handler
+I/O), next to the extraction wall time.
+"""
+
+import argparse
+import logging
+import logging.config
+import os
+import statistics
+import tempfile
+import threading
+import time
+
+from benchmarks._django import setup_django
+from benchmarks.ofda_standin import OFDAStandIn
+
+
+def configure_logging(log_file: str, sample_rate: float) -> None:
+    logging.config.dictConfig(
+        {
+            "version": 1,
+            "disable_existing_loggers": False,
+            "filters": {
+                "hot_path_sampling": {
+                    "()": "src.config.logging.SamplingFilter",
+                    "rate": sample_rate,
+                },
+            },
+            "formatters": {
+                "verbose": {
+                    "format": "{levelname} {asctime} {module} {process:d} "
+                    "{thread:d} {message}",
+                    "style": "{",
+                },
+            },
+            "handlers": {
+                "console": {
+                    "class": "logging.FileHandler",
+                    "filename": os.devnull,
+                    "formatter": "verbose",
+                },
+                "file": {
+                    "class": "logging.FileHandler",
+                    "filename": log_file,
+                    "formatter": "verbose",
+                },
+            },
+            "loggers": {
+                "core": {
+                    "handlers": ["console", "file"],
+                    "level": "DEBUG",
+                    "propagate": False,
+                },
+                "core.hot_path": {"filters": ["hot_path_sampling"]},
+            },
+        }
+    )
+
+
+class HandleTimer:
+    """Accumulates time spent in ``Logger.handle`` by the calling thread."""
+
+    def __init__(self) -> None:
+        self.seconds = 0.0
+        self._thread = threading.get_ident()
+        self._handle = logging.Logger.handle
+
+    def __enter__(self) -> "HandleTimer":
+        timer = self
+
+        def handle(logger: logging.Logger, record: logging.LogRecord) -> None:
+            if threading.get_ident() != timer._thread:
+                return timer._handle(logger, record)
+            started = time.perf_counter()
+            try:
+                return timer._handle(logger, record)
+            finally:
+                timer.seconds += time.perf_counter() - started
+
+        logging.Logger.handle = handle
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        logging.Logger.handle = self._handle
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--accounts", type=int, default=10)
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--sample-rate", type=float, default=0.1)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.conf import settings
+
+    from src.config.logging import background_logging
+    from src.financial.services.dtos.consent import ConsentData
+    from src.financial.services.extraction_service import ExtractionService
+
+    consent = ConsentData(
+        id="consent-1",
+        dynamic_client_id="client-1",
+        status="APPROVED",
+        token="consent-token",
+    )
+
+    def extract() -> tuple[float, float]:
+        service = ExtractionService()
+        with HandleTimer() as timer:
+            started = time.perf_counter()
+            accounts = service._extract_accounts("bench", consent)
+            service._extract_balances("bench", consent, accounts)
+            service._extract_transactions("bench", consent, accounts)
+            elapsed = time.perf_counter() - started
+        return elapsed, timer.seconds
+
+    modes = [
+        ("disabled", False, 1.0),
+        ("sync", False, 1.0),
+        ("background", True, 1.0),
+        ("background+sampled", True, args.sample_rate),
+    ]
+    with (
+        OFDAStandIn(
+            accounts=args.accounts, transaction_pages=args.pages
+        ) as standin,
+        tempfile.TemporaryDirectory() as directory,
+    ):
+        settings.OFDA_API_BASE_URL = standin.url
+        settings.OFDA_CONDITIONAL_GET = False
+        settings.OFDA_ROUTE_POLICIES = [
+            f"TransactionsRoute.page_size={standin.items_per_page}"
+        ]
+        extract()
+
+        for mode, background, sample_rate in modes:
+            log_file = os.path.join(directory, f"{mode}.log")
+            configure_logging(log_file, sample_rate)
+            logging.disable(logging.CRITICAL if mode == "disabled" else 0)
+            if background:
+                background_logging.start()
+            timings = [extract() for _ in range(args.runs)]
+            background_logging.stop()
+            logging.disable(logging.NOTSET)
+
+            with open(log_file) as lines:
+                records = sum(1 for _ in lines) // args.runs
+            print(
+                {
+                    "mode": mode,
+                    "records_per_extraction": records,
+                    "logging_ms": round(
+                        statistics.median(t[1] for t in timings) * 1000, 2
+                    ),
+                    "extraction_ms": round(
+                        statistics.median(t[0] for t in timings) * 1000, 1
+                    ),
+                }
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Wall time of a long transaction stream with and without page prefetching.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_page_prefetch --pages 60 --windows 0,2,4,8
+
+One account with ``--pages`` transaction pages is read from the stand-in
+(``--latency`` seconds per call) with each ``OFDA_PAGE_PREFETCH`` window.
+Requests above ``--pages`` are speculative pages requested past the end
+and dropped.
+"""
+
+import argparse
+import time
+
+from benchmarks._django import setup_django
+from benchmarks.ofda_standin import OFDAStandIn
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=60)
+    parser.add_argument("--items", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--windows", default="0,2,4,8")
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.conf import settings
+
+    from src.financial.routes.transactions import TransactionsRoute
+    from src.financial.services.extraction_service import ExtractionService
+    from src.integration.enums import RouteMethod
+
+    settings.OFDA_CONDITIONAL_GET = False
+    settings.OFDA_PAGINATION_MAX_PAGES = args.pages * 2
+    settings.OFDA_ROUTE_POLICIES = [
+        f"TransactionsRoute.page_size={args.items}"
+    ]
+
+    with OFDAStandIn(
+        accounts=1,
+        transaction_pages=args.pages,
+        items_per_page=args.items,
+        latency=args.latency,
+    ) as standin:
+        settings.OFDA_API_BASE_URL = standin.url
+        for window in (int(value) for value in args.windows.split(",")):
+            settings.OFDA_PAGE_PREFETCH = window
+            service = ExtractionService()
+            standin.reset_counters()
+            started = time.perf_counter()
+            items = service._fetch_paginated_data(
+                TransactionsRoute,
+                {
+                    "token": "consent-token",
+                    "account_id": "account-0",
+                    "operation": RouteMethod.GET,
+                },
+            )
+            elapsed = time.perf_counter() - started
+            assert len(items) == args.pages * args.items  # noqa: S101
+            print(
+                {
+                    "prefetch_window": window,
+                    "wall_ms": round(elapsed * 1000, 1),
+                    "requests": standin.request_count,
+                }
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Wall time and round trips of a long transaction history per page size.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_page_size --transactions 2000 --sizes 10,50,100,200,500
+
+The stand-in answers each call after ``--latency`` seconds plus
+``--item-latency`` seconds per transaction returned. Each size in
+``--sizes`` is pinned through ``OFDA_ROUTE_POLICIES`` and the history of
+one account is read once; then the adaptive sizing starts from
+``OFDA_PAGE_SIZE=10`` and reads it ``--runs`` times in a row.
+"""
+
+import argparse
+import time
+
+from benchmarks._django import setup_django
+from benchmarks.ofda_standin import OFDAStandIn
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--transactions", type=int, default=2000)
+    parser.add_argument("--sizes", default="10,50,100,200,500")
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--item-latency", type=float, default=0.0002)
+    parser.add_argument("--target-seconds", type=float, default=1.0)
+    parser.add_argument("--runs", type=int, default=4)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.conf import settings
+
+    from src.financial.services.dtos.consent import ConsentData
+    from src.financial.services.extraction_service import ExtractionService
+    from src.integration.services.page_size_service import page_sizes
+
+    settings.OFDA_CONDITIONAL_GET = False
+    settings.OFDA_PAGINATION_MAX_PAGES = args.transactions
+    settings.OFDA_PAGE_TARGET_SECONDS = args.target_seconds
+    consent = ConsentData(
+        id="consent-1",
+        dynamic_client_id="client-1",
+        status="APPROVED",
+        token="consent-token",
+    )
+
+    def read_history(standin: OFDAStandIn) -> dict:
+        standin.reset_counters()
+        started = time.perf_counter()
+        transactions = ExtractionService()._extract_transactions(
+            "bench", consent, [{"id": "account-0"}]
+        )
+        elapsed = time.perf_counter() - started
+        assert len(transactions) == args.transactions  # noqa: S101
+        return {
+            "wall_ms": round(elapsed * 1000, 1),
+            "requests": standin.request_count,
+            "body_kb": round(standin.bytes_sent / 1024, 1),
+        }
+
+    with OFDAStandIn(
+        accounts=1,
+        transaction_pages=args.transactions // 10,
+        items_per_page=10,
+        latency=args.latency,
+        item_latency=args.item_latency,
+    ) as standin:
+        settings.OFDA_API_BASE_URL = standin.url
+        for size in (int(value) for value in args.sizes.split(",")):
+            settings.OFDA_ROUTE_POLICIES = [
+                f"TransactionsRoute.page_size={size}"
+            ]
+            print({"page_size": size, **read_history(standin)})
+
+        settings.OFDA_ROUTE_POLICIES = []
+        settings.OFDA_PAGE_SIZE = 10
+        for run in range(1, args.runs + 1):
+            size = page_sizes.size("TransactionsRoute")
+            print(
+                {
+                    "adaptive_run": run,
+                    "page_size": size,
+                    **read_history(standin),
+                }
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+First-request latency of a fresh worker with and without prewarming.
+
+Run from the repository root (needs ``cryptography``):
+
+    python -m benchmarks.bench_prewarm --rounds 5
+
+Each round boots a new process, as gunicorn does for every worker, and
+times the first and the second account extraction against an HTTPS
+stand-in. With prewarming, the hot-path imports and the TLS connections
+are paid at boot, so the first extraction should cost the same as the
+second one.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.ofda_standin import (
+    OFDAStandIn,
+    self_signed_certificate,
+    server_tls,
+)
+
+
+def measure(url: str, prewarm: bool) -> dict:
+    from benchmarks._django import setup_django
+
+    setup_django()
+
+    from django.conf import settings
+
+    from src.core.services.prewarm_service import PrewarmService
+
+    settings.OFDA_API_BASE_URL = url
+    settings.OFDA_PREWARM_CONNECTIONS = 2 if prewarm else 0
+
+    started = time.perf_counter()
+    PrewarmService().prewarm()
+    boot = time.perf_counter() - started
+
+    def extract() -> float:
+        started = time.perf_counter()
+        from src.financial.services.dtos.consent import ConsentData
+        from src.financial.services.extraction_service import (
+            ExtractionService,
+        )
+
+        consent = ConsentData(
+            id="consent-1",
+            dynamic_client_id="client-1",
+            status="APPROVED",
+            token="consent-token",
+        )
+        ExtractionService()._extract_accounts("bench", consent)
+        return time.perf_counter() - started
+
+    first = extract()
+    second = extract()
+    return {"boot": boot, "first": first, "second": second}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--child-mode", choices=["cold", "prewarmed"])
+    parser.add_argument("--url")
+    args = parser.parse_args()
+
+    if args.child_mode:
+        result = measure(args.url, args.child_mode == "prewarmed")
+        print(json.dumps(result))
+        return
+
+    cert_path, key_path = self_signed_certificate()
+    env = os.environ | {"REQUESTS_CA_BUNDLE": cert_path}
+    with OFDAStandIn(tls=server_tls(cert_path, key_path)) as standin:
+        for mode in ("cold", "prewarmed"):
+            results = []
+            for _ in range(args.rounds):
+                output = subprocess.run(
+                    [
+                        sys.executable,
+                        "-m",
+                        "benchmarks.bench_prewarm",
+                        "--child-mode",
+                        mode,
+                        "--url",
+                        standin.url,
+                    ],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                    env=env,
+                ).stdout
+                results.append(json.loads(output.strip().splitlines()[-1]))
+            print(
+                {
+                    "mode": mode,
+                    **{
+                        f"{phase}_ms": round(
+                            statistics.median(r[phase] for r in results)
+                            * 1000,
+                            1,
+                        )
+                        for phase in ("boot", "first", "second")
+                    },
+                }
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+OFDA calls and wall time of concurrent extraction requests for one user.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_single_flight --requests 1,4,16
+
+For each number of requests, that many threads post the same
+``user_document`` to the extraction endpoint at once, with and without
+``OFDA_SINGLE_FLIGHT``, against the stand-in (``--latency`` seconds per
+call). The leases live in a local-memory cache here, so the threads stand
+in for workers sharing Redis.
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks._django import setup_django
+from benchmarks.ofda_standin import OFDAStandIn
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", default="1,4,16")
+    parser.add_argument("--accounts", type=int, default=3)
+    parser.add_argument("--pages", type=int, default=2)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.conf import settings
+    from django.core.cache import cache
+    from django.test import RequestFactory
+
+    from src.core.services.single_flight_service import single_flight
+    from src.financial.controllers.extract_financial_data import (
+        extract_financial_data,
+    )
+    from src.financial.schemas.schemas import ExtractionRequestSchema
+
+    settings.CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "bench-single-flight",
+        }
+    }
+    settings.OFDA_CONDITIONAL_GET = False
+    settings.OFDA_ROUTE_POLICIES = ["TransactionsRoute.page_size=10"]
+    request = RequestFactory().post("/api/v1/extract-financial-data")
+    data = ExtractionRequestSchema(user_document="12345678901")
+
+    with OFDAStandIn(
+        accounts=args.accounts,
+        transaction_pages=args.pages,
+        latency=args.latency,
+    ) as standin:
+        settings.OFDA_API_BASE_URL = standin.url
+        for requests in (int(count) for count in args.requests.split(",")):
+            row = {"requests": requests}
+            for enabled in (False, True):
+                settings.OFDA_SINGLE_FLIGHT = enabled
+                cache.clear()
+                standin.reset_counters()
+                started = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=requests) as pool:
+                    responses = list(
+                        pool.map(
+                            lambda _: extract_financial_data(request, data),
+                            range(requests),
+                        )
+                    )
+                elapsed = time.perf_counter() - started
+                assert all(  # noqa: S101
+                    r.summary.total_transactions
+                    == responses[0].summary.total_transactions
+                    for r in responses
+                )
+                key = "single_flight" if enabled else "independent"
+                row[f"{key}_ms"] = round(elapsed * 1000, 1)
+                row[f"{key}_ofda_calls"] = standin.request_count
+            print(row)
+        print({"single_flight": single_flight.stats()})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Peak memory of transaction extraction with buffered vs streaming decode.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_streaming_decode --pages 5 --items 5000
+
+The stand-in server runs in this process and each decode mode is measured
+in a fresh child process so the results do not share heap or RSS.
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from benchmarks.ofda_standin import OFDAStandIn
+
+
+def measure(url: str, streaming: bool, items: int) -> dict:
+    from benchmarks._django import setup_django
+
+    setup_django()
+
+    from django.conf import settings
+
+    from src.financial.services.dtos.consent import ConsentData
+    from src.financial.services.extraction_service import ExtractionService
+
+    settings.OFDA_API_BASE_URL = url
+    settings.OFDA_STREAMING_DECODE = streaming
+    # Pages as large as the stand-in's, whatever the adaptive page size.
+    settings.OFDA_ROUTE_POLICIES = [f"TransactionsRoute.page_size={items}"]
+    service = ExtractionService()
+    consent = ConsentData(
+        id="consent-1",
+        dynamic_client_id="client-1",
+        status="APPROVED",
+        token="consent-token",
+    )
+
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    started = time.perf_counter()
+    transactions = service._extract_transactions(
+        "bench", consent, [{"id": "account-0"}]
+    )
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    return {
+        "mode": "streaming" if streaming else "buffered",
+        "transactions": len(transactions),
+        "seconds": round(elapsed, 3),
+        "heap_peak_mb": round(peak / 1024 / 1024, 1),
+        "rss_growth_mb": round((rss_after - rss_before) / 1024, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--description-size", type=int, default=400)
+    parser.add_argument("--child-mode", choices=["buffered", "streaming"])
+    parser.add_argument("--url")
+    args = parser.parse_args()
+
+    if args.child_mode:
+        result = measure(args.url, args.child_mode == "streaming", args.items)
+        print(json.dumps(result))
+        return
+
+    with OFDAStandIn(
+        accounts=1,
+        transaction_pages=args.pages,
+        items_per_page=args.items,
+        description_size=args.description_size,
+    ) as standin:
+        page_bytes = len(json.dumps(standin.transactions_page("account-0", 1)))
+        print(
+            f"{args.pages} pages of {args.items} items "
+            f"({page_bytes / 1024 / 1024:.1f} MB per page)"
+        )
+        for mode in ("buffered", "streaming"):
+            output = subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "benchmarks.bench_streaming_decode",
+                    "--child-mode",
+                    mode,
+                    "--url",
+                    standin.url,
+                    "--items",
+                    str(args.items),
+                ],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            print(json.loads(output.strip().splitlines()[-1]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+"""
+Local stand-in for the OFDA API used by the benchmarks.
+
+It implements the endpoints the integration layer calls (dynamic client,
+consent, accounts, balances and paginated transactions) on a threaded
+HTTP/1.1 server with keep-alive, and can inject latency per request and
+per item returned (``item_latency``), plus a slow tail (``tail_ratio`` of the requests take ``tail_latency`` longer)
+and failures (``error_ratio`` of the requests get a 503).
+Transactions are listed newest first, and raising ``new_transactions``
+puts that many newer ones on top of every account's history.
+GET responses carry an ``ETag`` and honour ``If-None-Match`` unless
+``validators`` is disabled. Given an ``ssl.SSLContext`` it serves HTTPS.
+"""
+
+import datetime
+import hashlib
+import ipaddress
+import json
+import random
+import re
+import ssl
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+ACCOUNT_PATH = re.compile(
+    r"^/account/(?P<account_id>[^/]+)/(?P<resource>\w+)$"
+)
+
+
+class _StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Concurrent fan-outs open many connections at once; the default
+    # backlog of 5 would add SYN retransmits to the measured latency.
+    request_queue_size = 128
+
+
+class OFDAStandIn:
+    def __init__(
+        self,
+        accounts: int = 2,
+        transaction_pages: int = 3,
+        items_per_page: int = 10,
+        latency: float = 0.0,
+        description_size: int = 32,
+        validators: bool = True,
+        tls: ssl.SSLContext | None = None,
+        tail_ratio: float = 0.0,
+        tail_latency: float = 0.0,
+        error_ratio: float = 0.0,
+        item_latency: float = 0.0,
+    ) -> None:
+        self.accounts = accounts
+        self.transaction_pages = transaction_pages
+        self.items_per_page = items_per_page
+        self.latency = latency
+        self.tail_ratio = tail_ratio
+        self.tail_latency = tail_latency
+        self.error_ratio = error_ratio
+        self.item_latency = item_latency
+        self.new_transactions = 0
+        self._random = random.Random(0)  # noqa: S311 - reproducible tail
+        self.description_size = description_size
+        self.validators = validators
+        self.tls = tls
+        self.request_count = 0
+        self.connection_count = 0
+        self.not_modified_count = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._server = _StandInServer(("127.0.0.1", 0), self._build_handler())
+        if tls is not None:
+            self._server.socket = tls.wrap_socket(
+                self._server.socket, server_side=True
+            )
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, args=(0.05,), daemon=True
+        )
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        scheme = "http" if self.tls is None else "https"
+        return f"{scheme}://{host}:{port}"
+
+    def __enter__(self) -> "OFDAStandIn":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset_counters(self) -> None:
+        with self._lock:
+            self.request_count = 0
+            self.connection_count = 0
+            self.not_modified_count = 0
+            self.bytes_sent = 0
+
+    def request_latency(self) -> float:
+        with self._lock:
+            slow = self._random.random() < self.tail_ratio
+        return self.latency + (self.tail_latency if slow else 0.0)
+
+    def account_ids(self) -> list[str]:
+        return [f"account-{index}" for index in range(self.accounts)]
+
+    def transactions_page(
+        self, account_id: str, page: int, limit: int | None = None
+    ) -> dict:
+        """Page ``page`` of ``limit`` items (``items_per_page`` by default).
+
+        Every account has ``transaction_pages * items_per_page`` plus
+        ``new_transactions`` transactions whatever the page size, each
+        numbered and dated after the ones below it.
+        """
+        total = (
+            self.transaction_pages * self.items_per_page
+            + self.new_transactions
+        )
+        size = limit or self.items_per_page
+        start = (page - 1) * size
+        oldest = datetime.datetime(2025, 1, 1, tzinfo=datetime.UTC)
+        items = [
+            {
+                "id": f"{account_id}-tx-{total - 1 - start - index}",
+                "transaction_type": "transfer",
+                "transaction_status": "completed",
+                "transaction_amount": round(10 + index * 0.5, 2),
+                "transaction_direction": "in" if index % 2 else "out",
+                "transaction_description": "x" * self.description_size,
+                "transaction_date": (
+                    oldest
+                    + datetime.timedelta(minutes=total - 1 - start - index)
+                ).isoformat(),
+            }
+            for index in range(max(min(size, total - start), 0))
+        ]
+        return {"items": items, "has_next": start + size < total}
+
+    def handle(
+        self, method: str, path: str, query: dict
+    ) -> tuple[int, object]:
+        page = int(query.get("page", ["1"])[0])
+        if path.startswith("/dynamic-client/") and method == "POST":
+            return 201, {
+                "id": "client-1",
+                "name": "Belvo_Client",
+                "token": "client-token",
+                "organization_name": "Belvo",
+                "organization_type": "INDIVIDUAL",
+            }
+        if path.startswith("/consent/"):
+            if method == "GET":
+                return 200, []
+            return 201, {
+                "id": "consent-1",
+                "dynamic_client_id": "client-1",
+                "status": "APPROVED",
+                "token": "consent-token",
+            }
+        if path in ("/account", "/account/"):
+            items = [
+                {
+                    "id": account_id,
+                    "account_type": "checking",
+                    "account_status": "active",
+                }
+                for account_id in self.account_ids()
+            ]
+            return 200, {"items": items, "has_next": False}
+        match = ACCOUNT_PATH.match(path)
+        if match and match["resource"] == "balance":
+            return 200, {"balance": 1500.75, "currency": "BRL"}
+        if match and match["resource"] == "transactions":
+            limit = query.get("limit")
+            document = self.transactions_page(
+                match["account_id"], page, int(limit[0]) if limit else None
+            )
+            if self.item_latency:
+                # Only used over HTTP/1.1, where each request has a thread.
+                time.sleep(self.item_latency * len(document["items"]))
+            return 200, document
+        return 404, {"detail": "not found"}
+
+    def respond(
+        self, method: str, target: str, if_none_match: str | None
+    ) -> tuple[int, list[tuple[str, str]], bytes]:
+        with self._lock:
+            self.request_count += 1
+            failed = (
+                self.error_ratio > 0
+                and self._random.random() < self.error_ratio
+            )
+        if failed:
+            body = b'{"detail": "unavailable"}'
+            return (
+                503,
+                [
+                    ("Content-Type", "application/json"),
+                    ("Content-Length", str(len(body))),
+                ],
+                body,
+            )
+        parts = urlsplit(target)
+        status, document = self.handle(
+            method, parts.path, parse_qs(parts.query)
+        )
+        body = json.dumps(document).encode()
+        etag = None
+        if method == "GET" and status == 200 and self.validators:
+            etag = f'"{hashlib.sha1(body).hexdigest()}"'  # noqa: S324
+            if if_none_match == etag:
+                status, body = 304, b""
+                with self._lock:
+                    self.not_modified_count += 1
+        with self._lock:
+            self.bytes_sent += len(body)
+        headers = [
+            ("Content-Type", "application/json"),
+            ("Content-Length", str(len(body))),
+        ]
+        if etag:
+            headers.append(("ETag", etag))
+        return status, headers, body
+
+    def _build_handler(self) -> type[BaseHTTPRequestHandler]:
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately; without TCP_NODELAY
+            # every response waits for the client's delayed ACK.
+            disable_nagle_algorithm = True
+
+            def setup(self) -> None:
+                super().setup()
+                with standin._lock:
+                    standin.connection_count += 1
+
+            def do_GET(self) -> None:
+                self._dispatch("GET")
+
+            def do_POST(self) -> None:
+                self._dispatch("POST")
+
+            def _dispatch(self, method: str) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                latency = standin.request_latency()
+                if latency:
+                    time.sleep(latency)
+                status, headers, body = standin.respond(
+                    method, self.path, self.headers.get("If-None-Match")
+                )
+                self.send_response(status)
+                for name, value in headers:
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        return Handler
+
+
+def self_signed_certificate(directory: str | None = None) -> tuple[str, str]:
+    """Certificate and key for 127.0.0.1; the certificate is its own CA."""
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "127.0.0.1")])
+    now = datetime.datetime.now(datetime.UTC)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=5))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName(
+                [x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]
+            ),
+            critical=False,
+        )
+        .add_extension(
+            x509.BasicConstraints(ca=True, path_length=None), critical=True
+        )
+        .sign(key, hashes.SHA256())
+    )
+
+    directory = Path(directory or tempfile.mkdtemp(prefix="ofda-standin-"))
+    cert_path = directory / "standin.pem"
+    key_path = directory / "standin.key"
+    cert_path.write_bytes(certificate.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    return str(cert_path), str(key_path)
+
+
+def server_tls(cert_path: str, key_path: str) -> ssl.SSLContext:
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(cert_path, key_path)
+    return context
@@ -1,3 +1,129 @@
+import atexit
 import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
 
 logger = logging.getLogger("core")
+
+# Per-request and per-page events of the extraction. Child of "core", so it
+# reaches the same handlers, but it can be sampled on its own.
+hot_path_logger = logging.getLogger("core.hot_path")
+
+
+class SamplingFilter(logging.Filter):
+    """Lets through ``rate`` of the records below ``WARNING``.
+
+    Sampling is deterministic (with ``rate=0.1`` every tenth record passes)
+    so the output stays representative under bursts. Warnings and errors
+    are never dropped.
+    """
+
+    def __init__(self, rate: float = 1.0, name: str = "") -> None:
+        super().__init__(name)
+        self.rate = rate
+        self._seen = 0
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or self.rate >= 1:
+            return True
+        if self.rate <= 0:
+            return False
+        with self._lock:
+            self._seen += 1
+            seen = self._seen
+        return int(seen * self.rate) != int((seen - 1) * self.rate)
+
+
+class _DeferredFormatQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Only interpolate on the calling thread, since the arguments may
+        # change after the call returns. Timestamps, the verbose format and
+        # tracebacks are rendered by the handlers on the listener thread.
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class BackgroundLogging:
+    """Moves handler I/O of the configured loggers to listener threads.
+
+    Every logger that has handlers gets a single ``QueueHandler`` instead,
+    and a ``QueueListener`` feeds its original handlers from a background
+    thread. The request thread only interpolates the message; formatting
+    and writing to the console or ``financial_api.log`` happen off the hot
+    path.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._listeners: list[tuple[QueueHandler, QueueListener]] = []
+        self._fork_hook_registered = False
+
+    @property
+    def running(self) -> bool:
+        return bool(self._listeners)
+
+    def start(self) -> None:
+        with self._lock:
+            if self._listeners:
+                return
+            listeners: dict[tuple[logging.Handler, ...], QueueHandler] = {}
+            for target in self._configured_loggers():
+                handlers = tuple(target.handlers)
+                queue_handler = listeners.get(handlers)
+                if queue_handler is None:
+                    queue_handler = _DeferredFormatQueueHandler(
+                        queue.SimpleQueue()
+                    )
+                    listener = QueueListener(
+                        queue_handler.queue,
+                        *handlers,
+                        respect_handler_level=True,
+                    )
+                    listener.start()
+                    listeners[handlers] = queue_handler
+                    self._listeners.append((queue_handler, listener))
+                target.handlers = [queue_handler]
+
+            if not self._fork_hook_registered:
+                os.register_at_fork(after_in_child=self._restart_in_child)
+                atexit.register(self.stop)
+                self._fork_hook_registered = True
+
+    def stop(self) -> None:
+        """Flush queued records and give the handlers back to the loggers."""
+        with self._lock:
+            listeners, self._listeners = self._listeners, []
+        for queue_handler, listener in listeners:
+            listener.stop()
+            for target in self._configured_loggers():
+                if target.handlers == [queue_handler]:
+                    target.handlers = list(listener.handlers)
+
+    def _restart_in_child(self) -> None:
+        # Listener threads do not survive a fork; a worker forked from a
+        # preloaded master needs its own.
+        self._lock = threading.Lock()
+        for index, (queue_handler, listener) in enumerate(self._listeners):
+            queue_handler.queue = queue.SimpleQueue()
+            replacement = QueueListener(
+                queue_handler.queue,
+                *listener.handlers,
+                respect_handler_level=True,
+            )
+            replacement.start()
+            self._listeners[index] = (queue_handler, replacement)
+
+    @staticmethod
+    def _configured_loggers() -> list[logging.Logger]:
+        loggers = [logging.getLogger()]
+        for candidate in list(logging.Logger.manager.loggerDict.values()):
+            if isinstance(candidate, logging.Logger) and candidate.handlers:
+                loggers.append(candidate)
+        return [target for target in loggers if target.handlers]
+
+
+background_logging = BackgroundLogging()
@@ -155,9 +155,22 @@ X_FRAME_OPTIONS = "DENY"
 CORS_ALLOW_ALL_ORIGINS = DEBUG
 CORS_ALLOWED_ORIGINS = config("CORS_ALLOWED_ORIGINS", default="", cast=Csv())
 
+LOG_BACKGROUND_HANDLERS = config(
+    "LOG_BACKGROUND_HANDLERS", default=True, cast=bool
+)
+LOG_HOT_PATH_SAMPLE_RATE = config(
+    "LOG_HOT_PATH_SAMPLE_RATE", default=1.0, cast=float
+)
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
+    "filters": {
+        "hot_path_sampling": {
+            "()": "src.config.logging.SamplingFilter",
+            "rate": LOG_HOT_PATH_SAMPLE_RATE,
+        },
+    },
     "formatters": {
         "verbose": {
             "format": "{levelname} {asctime} {module} {process:d} {thread:d} {message}",
@@ -199,6 +212,9 @@ LOGGING = {
             "level": "DEBUG" if DEBUG else "INFO",
             "propagate": False,
         },
+        "core.hot_path": {
+            "filters": ["hot_path_sampling"],
+        },
     },
 }
 
@@ -211,7 +227,125 @@ HEALTH_CHECK = {
 OFDA_API_BASE_URL = config(
     "OFDA_API_BASE_URL", default="http://localhost:8000"
 )
+OFDA_API_BASE_URLS = config("OFDA_API_BASE_URLS", default="", cast=Csv())
+OFDA_LB_EJECT_FAILURES = config("OFDA_LB_EJECT_FAILURES", default=3, cast=int)
+OFDA_LB_EJECT_SECONDS = config("OFDA_LB_EJECT_SECONDS", default=30, cast=float)
+OFDA_LB_SLOW_START_SECONDS = config(
+    "OFDA_LB_SLOW_START_SECONDS", default=30, cast=float
+)
 OFDA_API_TIMEOUT = config("OFDA_API_TIMEOUT", default=30, cast=int)
 OFDA_API_RETRY_ATTEMPTS = config(
     "OFDA_API_RETRY_ATTEMPTS", default=5, cast=int
 )
+OFDA_RETRY_BUDGET = config("OFDA_RETRY_BUDGET", default=10, cast=int)
+OFDA_CIRCUIT_BREAKER = config("OFDA_CIRCUIT_BREAKER", default=True, cast=bool)
+OFDA_CIRCUIT_FAILURE_THRESHOLD = config(
+    "OFDA_CIRCUIT_FAILURE_THRESHOLD", default=5, cast=int
+)
+OFDA_CIRCUIT_FAILURE_WINDOW = config(
+    "OFDA_CIRCUIT_FAILURE_WINDOW", default=30, cast=int
+)
+OFDA_CIRCUIT_OPEN_SECONDS = config(
+    "OFDA_CIRCUIT_OPEN_SECONDS", default=30, cast=int
+)
+OFDA_CIRCUIT_STALE_TIMEOUT = config(
+    "OFDA_CIRCUIT_STALE_TIMEOUT", default=86400, cast=int
+)
+OFDA_RETRY_AFTER_COOLDOWN = config(
+    "OFDA_RETRY_AFTER_COOLDOWN", default=True, cast=bool
+)
+OFDA_COOLDOWN_MAX_SECONDS = config(
+    "OFDA_COOLDOWN_MAX_SECONDS", default=300, cast=float
+)
+OFDA_COOLDOWN_MAX_WAIT = config(
+    "OFDA_COOLDOWN_MAX_WAIT", default=30, cast=float
+)
+OFDA_RATE_LIMIT = config("OFDA_RATE_LIMIT", default=0, cast=float)
+OFDA_RATE_LIMITS = config("OFDA_RATE_LIMITS", default="", cast=Csv())
+OFDA_RATE_LIMIT_BURST = config("OFDA_RATE_LIMIT_BURST", default=0, cast=float)
+OFDA_RATE_LIMIT_RESERVATION = config(
+    "OFDA_RATE_LIMIT_RESERVATION", default=5, cast=int
+)
+OFDA_RATE_LIMIT_MAX_WAIT = config(
+    "OFDA_RATE_LIMIT_MAX_WAIT", default=30, cast=float
+)
+OFDA_HEDGING = config("OFDA_HEDGING", default=False, cast=bool)
+OFDA_HEDGE_PERCENTILE = config("OFDA_HEDGE_PERCENTILE", default=95, cast=float)
+OFDA_HEDGE_MAX_RATIO = config("OFDA_HEDGE_MAX_RATIO", default=0.05, cast=float)
+OFDA_HEDGE_MAX_WORKERS = config("OFDA_HEDGE_MAX_WORKERS", default=32, cast=int)
+OFDA_ADAPTIVE_CONCURRENCY = config(
+    "OFDA_ADAPTIVE_CONCURRENCY", default=True, cast=bool
+)
+OFDA_CONCURRENCY_INITIAL_LIMIT = config(
+    "OFDA_CONCURRENCY_INITIAL_LIMIT", default=20, cast=int
+)
+OFDA_CONCURRENCY_MIN_LIMIT = config(
+    "OFDA_CONCURRENCY_MIN_LIMIT", default=1, cast=int
+)
+OFDA_CONCURRENCY_MAX_LIMIT = config(
+    "OFDA_CONCURRENCY_MAX_LIMIT", default=100, cast=int
+)
+OFDA_CONCURRENCY_LATENCY_TOLERANCE = config(
+    "OFDA_CONCURRENCY_LATENCY_TOLERANCE", default=2.0, cast=float
+)
+OFDA_BULKHEAD_LIMITS = config(
+    "OFDA_BULKHEAD_LIMITS",
+    default="client=4,consent=4,accounts=8,balances=16,transactions=16",
+    cast=Csv(),
+)
+OFDA_BULKHEAD_QUEUE_TIMEOUTS = config(
+    "OFDA_BULKHEAD_QUEUE_TIMEOUTS",
+    default="client=5,consent=5,accounts=10,balances=10,transactions=30",
+    cast=Csv(),
+)
+OFDA_ROUTE_POLICIES = config("OFDA_ROUTE_POLICIES", default="", cast=Csv())
+OFDA_HTTP_POOL_MAXSIZE = config("OFDA_HTTP_POOL_MAXSIZE", default=10, cast=int)
+OFDA_HTTP_POOL_BLOCK = config("OFDA_HTTP_POOL_BLOCK", default=False, cast=bool)
+OFDA_PREWARM_CONNECTIONS = config(
+    "OFDA_PREWARM_CONNECTIONS", default=0, cast=int
+)
+OFDA_EXTRACTION_DEADLINE = config(
+    "OFDA_EXTRACTION_DEADLINE", default=100, cast=int
+)
+OFDA_EXTRACTION_CONCURRENCY = config(
+    "OFDA_EXTRACTION_CONCURRENCY", default=16, cast=int
+)
+OFDA_SINGLE_FLIGHT = config("OFDA_SINGLE_FLIGHT", default=True, cast=bool)
+OFDA_SINGLE_FLIGHT_LEASE_SECONDS = config(
+    "OFDA_SINGLE_FLIGHT_LEASE_SECONDS", default=15, cast=float
+)
+OFDA_SINGLE_FLIGHT_MAX_WAIT = config(
+    "OFDA_SINGLE_FLIGHT_MAX_WAIT", default=100, cast=float
+)
+OFDA_STREAMING_DECODE = config(
+    "OFDA_STREAMING_DECODE", default=False, cast=bool
+)
+OFDA_PAGINATION_MAX_PAGES = config(
+    "OFDA_PAGINATION_MAX_PAGES", default=100, cast=int
+)
+OFDA_PAGE_MAX_ATTEMPTS = config("OFDA_PAGE_MAX_ATTEMPTS", default=2, cast=int)
+OFDA_PAGE_PREFETCH = config("OFDA_PAGE_PREFETCH", default=0, cast=int)
+OFDA_PAGE_SIZE = config("OFDA_PAGE_SIZE", default=100, cast=int)
+OFDA_PAGE_SIZE_MIN = config("OFDA_PAGE_SIZE_MIN", default=10, cast=int)
+OFDA_PAGE_SIZE_MAX = config("OFDA_PAGE_SIZE_MAX", default=500, cast=int)
+OFDA_PAGE_TARGET_SECONDS = config(
+    "OFDA_PAGE_TARGET_SECONDS", default=1.0, cast=float
+)
+OFDA_PAGE_MAX_BYTES = config("OFDA_PAGE_MAX_BYTES", default=1048576, cast=int)
+OFDA_PAGINATION_CHECKPOINT_TIMEOUT = config(
+    "OFDA_PAGINATION_CHECKPOINT_TIMEOUT", default=3600, cast=int
+)
+OFDA_INCREMENTAL_SYNC = config(
+    "OFDA_INCREMENTAL_SYNC", default=False, cast=bool
+)
+OFDA_INCREMENTAL_SYNC_TIMEOUT = config(
+    "OFDA_INCREMENTAL_SYNC_TIMEOUT", default=604800, cast=int
+)
+OFDA_JSON_CODEC = config("OFDA_JSON_CODEC", default="auto")
+OFDA_ACCEPT_ENCODINGS = config(
+    "OFDA_ACCEPT_ENCODINGS", default="zstd,br,gzip,deflate", cast=Csv()
+)
+OFDA_CONDITIONAL_GET = config("OFDA_CONDITIONAL_GET", default=True, cast=bool)
+OFDA_CONDITIONAL_GET_TTL = config(
+    "OFDA_CONDITIONAL_GET_TTL", default=86400, cast=int
+)
@@ -2,10 +2,35 @@
 Core app configuration.
 """
 
+import sys
+from pathlib import Path
+
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class CoreConfig(AppConfig):
     default_auto_field: str = "django.db.models.BigAutoField"
     name = "src.core"
     verbose_name = "Core"
+
+    def ready(self) -> None:
+        if getattr(settings, "LOG_BACKGROUND_HANDLERS", False):
+            from src.config.logging import background_logging
+
+            background_logging.start()
+
+        # Gunicorn loads the application in every worker after the fork, so
+        # connections opened here belong to the worker that uses them.
+        if self._is_management_command():
+            return
+
+        from src.core.services.prewarm_service import PrewarmService
+
+        PrewarmService().prewarm()
+
+    @staticmethod
+    def _is_management_command() -> bool:
+        return Path(sys.argv[0]).name == "manage.py" and sys.argv[1:2] != [
+            "runserver"
+        ]
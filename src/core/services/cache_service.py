@@ -58,7 +58,13 @@ class CacheService:
             self.logger.error(f"Failed to delete cache key {key}: {str(e)}")
             return False
 
-    def cache_data(self, prefix: str, identifier: str, data: dict) -> bool:
+    def cache_data(
+        self,
+        prefix: str,
+        identifier: str,
+        data: dict,
+        timeout: int | None = None,
+    ) -> bool:
         cache_key = self._generate_cache_key(prefix, identifier)
         cache_data = {
             "data": data,
@@ -66,7 +72,7 @@ class CacheService:
             "identifier": identifier,
         }
 
-        return self.set(cache_key, cache_data)
+        return self.set(cache_key, cache_data, timeout)
 
     def get_cached_data(self, prefix: str, identifier: str) -> dict | None:
         cache_key = self._generate_cache_key(prefix, identifier)
@@ -86,6 +92,33 @@ class CacheService:
             return obj.isoformat()
         raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
 
+    def prewarm_connections(self, connections: int) -> int:
+        """Open up to ``connections`` Redis connections in the cache pool."""
+        try:
+            from django_redis import get_redis_connection
+
+            pool = get_redis_connection("default").connection_pool
+        except (ImportError, NotImplementedError):
+            # Not a django-redis cache, nothing to prewarm.
+            return 0
+
+        opened = []
+        try:
+            for _ in range(connections):
+                try:
+                    connection = pool.get_connection()
+                except TypeError:  # redis < 5.3 requires the command name
+                    connection = pool.get_connection("PING")
+                opened.append(connection)
+                connection.send_command("PING")
+                connection.read_response()
+        except Exception as e:
+            self.logger.warning(f"Failed to prewarm Redis connections: {e}")
+        finally:
+            for connection in opened:
+                pool.release(connection)
+        return len(opened)
+
     def clear_all_cache(self) -> bool:
         try:
             cache.clear()
@@ -0,0 +1,80 @@
+import importlib
+import time
+
+from django.conf import settings
+
+from src.config.logging import logger
+from src.core.services.cache_service import CacheService
+
+HOT_PATH_MODULES = (
+    "src.financial.controllers.extract_financial_data",
+    "src.financial.services.extraction_service",
+    "src.integration.services.router_service",
+    "src.integration.decoders",
+)
+
+
+class PrewarmService:
+    """Pays the first-request costs of a worker at boot.
+
+    Imports the modules on the extraction hot path and opens
+    ``OFDA_PREWARM_CONNECTIONS`` pooled connections to the OFDA API and to
+    Redis, so the first extraction served by a fresh worker does not pay
+    for imports, DNS resolution or connection setup.
+    """
+
+    def __init__(self) -> None:
+        self.logger = logger
+        self.cache_service = CacheService()
+
+    @property
+    def connections(self) -> int:
+        return getattr(settings, "OFDA_PREWARM_CONNECTIONS", 0)
+
+    def prewarm(self) -> dict[str, int]:
+        if self.connections <= 0:
+            return {}
+
+        started = time.perf_counter()
+        result = {
+            "modules": self._import_hot_path(),
+            "ofda_connections": self._prewarm_ofda(),
+            "redis_connections": self.cache_service.prewarm_connections(
+                self.connections
+            ),
+        }
+        elapsed = time.perf_counter() - started
+        self.logger.info(f"Worker prewarmed in {elapsed:.3f}s: {result}")
+        return result
+
+    def _import_hot_path(self) -> int:
+        imported = 0
+        for module in HOT_PATH_MODULES:
+            try:
+                importlib.import_module(module)
+                imported += 1
+            except Exception as e:
+                self.logger.warning(f"Failed to prewarm import {module}: {e}")
+        return imported
+
+    def _prewarm_ofda(self) -> int:
+        from src.integration.services.bulkhead_service import bulkheads
+        from src.integration.services.connection_pool_service import (
+            connection_pool,
+        )
+        from src.integration.services.load_balancer_service import (
+            load_balancer,
+        )
+
+        # Every endpoint and every bulkhead has a pool of its own, and the
+        # first extractions go through all of them.
+        traffic_classes = list(bulkheads.limits)
+        opened = 0
+        for base_url in filter(None, load_balancer.urls):
+            if not traffic_classes:
+                opened += connection_pool.prewarm(base_url, self.connections)
+            for traffic_class in traffic_classes:
+                opened += connection_pool.prewarm(
+                    base_url, self.connections, traffic_class
+                )
+        return opened
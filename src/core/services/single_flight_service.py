@@ -0,0 +1,360 @@
+import hashlib
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any, TypeVar
+
+from django.conf import settings
+from django.core.cache import cache
+
+from src.config.logging import logger
+from src.core.services.cache_service import CacheService
+from src.core.utils.deadline import current_deadline
+
+T = TypeVar("T")
+
+# Both scripts act only while the lease still holds the caller's token, so
+# an owner that stalled past its lease never extends or drops the lease of
+# the caller that took over.
+RENEW_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class SingleFlightService:
+    """Runs the work for one key once at a time across workers and nodes.
+
+    The first caller for a key takes a lease on it (``SET NX PX`` in
+    Redis) and runs the work, renewing the lease every third of
+    ``OFDA_SINGLE_FLIGHT_LEASE_SECONDS`` while it runs. Callers that find
+    the lease taken wait for the owner's pub/sub notification and return
+    the result it stored instead of running the work again. An owner that
+    dies stops renewing, its lease expires, and one of the waiters takes
+    over. Waiters give up after ``OFDA_SINGLE_FLIGHT_MAX_WAIT`` and run the
+    work themselves, and waiting past the request deadline raises
+    ``DeadlineExceededError``. Without a django-redis cache the lease is
+    kept in the Django cache and waiters in other processes poll it.
+    """
+
+    key_prefix = "single_flight"
+
+    def __init__(self) -> None:
+        self.logger = logger
+        self.cache_service = CacheService()
+        self._lock = threading.Lock()
+        self._finished = threading.Condition()
+        self._redis: Any = None
+        self._redis_available: bool | None = None
+        self._scripts: dict[str, Any] = {}
+        self._owned: dict[str, str] = {}
+        self._renewer: threading.Thread | None = None
+        self._stats: dict[str, dict[str, float]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return getattr(settings, "OFDA_SINGLE_FLIGHT", True)
+
+    @property
+    def lease_seconds(self) -> float:
+        return max(
+            getattr(settings, "OFDA_SINGLE_FLIGHT_LEASE_SECONDS", 15), 1
+        )
+
+    @property
+    def max_wait(self) -> float:
+        return getattr(settings, "OFDA_SINGLE_FLIGHT_MAX_WAIT", 100)
+
+    @property
+    def poll_interval(self) -> float:
+        return min(self.lease_seconds / 3, 1.0)
+
+    def run(
+        self,
+        name: str,
+        identifier: str,
+        func: Callable[[], T],
+        dump: Callable[[T], Any],
+        load: Callable[[Any], T],
+    ) -> T:
+        """Return ``func()``, or the result of the same call in flight.
+
+        ``dump`` turns the result into JSON-serializable data for the
+        waiters, which get it back through ``load``.
+        """
+        if not self.enabled:
+            return func()
+        key = self._key(name, identifier)
+        token = uuid.uuid4().hex
+        if self._acquire(key, token):
+            self._count(name, "leads")
+            return self._lead(key, token, func, dump)
+
+        started = time.monotonic()
+        with self._subscription(key) as wait:
+            data, owned = self._follow(key, token, wait, started)
+        waited = time.monotonic() - started
+        if owned:
+            self.logger.warning(
+                "Single-flight %s owner went away, taking over", name
+            )
+            self._count(name, "takeovers", waited)
+            return self._lead(key, token, func, dump)
+        if data is None:
+            self.logger.warning(
+                "Single-flight %s still running after %.1fs, running alone",
+                name,
+                waited,
+            )
+            self._count(name, "timeouts", waited)
+            return func()
+        self.logger.info(
+            "Single-flight %s coalesced with the call in flight after %.3fs",
+            name,
+            waited,
+        )
+        self._count(name, "coalesced", waited)
+        return load(data)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            stats = {
+                name: dict(flight_stats)
+                for name, flight_stats in self._stats.items()
+            }
+        for flight_stats in stats.values():
+            flight_stats["waited_seconds"] = round(
+                flight_stats["waited_seconds"], 3
+            )
+        return stats
+
+    def _lead(
+        self,
+        key: str,
+        token: str,
+        func: Callable[[], T],
+        dump: Callable[[T], Any],
+    ) -> T:
+        self._hold(key, token)
+        try:
+            result = func()
+            self.cache_service.set(
+                self._result_key(key, token),
+                dump(result),
+                int(self.lease_seconds) + 1,
+            )
+            return result
+        finally:
+            with self._lock:
+                if self._owned.get(key) == token:
+                    del self._owned[key]
+            self._release(key, token)
+            self._notify(key, token)
+
+    def _follow(
+        self,
+        key: str,
+        token: str,
+        wait: Callable[[float], None],
+        started: float,
+    ) -> tuple[Any, bool]:
+        """Wait for the owner of ``key``: (its result, whether we own it)."""
+        previous = None
+        while True:
+            owner = self._owner(key)
+            # The owner stores its result before it releases the lease.
+            for flight in dict.fromkeys((previous, owner)):
+                if flight is None:
+                    continue
+                data = self.cache_service.get(self._result_key(key, flight))
+                if data is not None:
+                    return data, False
+            if owner is None:
+                # The owner failed or its lease expired.
+                if self._acquire(key, token):
+                    return None, True
+                continue
+            previous = owner
+            remaining = self.max_wait - (time.monotonic() - started)
+            if remaining <= 0:
+                return None, False
+            deadline = current_deadline()
+            if deadline is not None:
+                deadline.check()
+                remaining = min(remaining, deadline.remaining())
+            wait(min(self.poll_interval, remaining))
+
+    def _hold(self, key: str, token: str) -> None:
+        with self._lock:
+            self._owned[key] = token
+            # A forked worker does not inherit the renewer thread.
+            if self._renewer is None or not self._renewer.is_alive():
+                self._renewer = threading.Thread(
+                    target=self._renew_leases,
+                    name="single-flight-renewer",
+                    daemon=True,
+                )
+                self._renewer.start()
+
+    def _renew_leases(self) -> None:
+        while True:
+            time.sleep(self.lease_seconds / 3)
+            with self._lock:
+                owned = list(self._owned.items())
+            for key, token in owned:
+                self._renew(key, token)
+
+    @contextmanager
+    def _subscription(self, key: str) -> Iterator[Callable[[float], None]]:
+        """Yield a function that waits for the owner of ``key`` to finish.
+
+        Subscribing comes before the first look at the lease, so a
+        notification sent in between is not missed.
+        """
+        redis = self._redis_client()
+        pubsub = None
+        if redis is not None:
+            try:
+                pubsub = redis.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self._channel(key))
+            except Exception as e:
+                self.logger.debug("Single-flight subscribe failed: %s", e)
+                pubsub = None
+
+        def wait(timeout: float) -> None:
+            if pubsub is None:
+                with self._finished:
+                    self._finished.wait(timeout)
+                return
+            try:
+                pubsub.get_message(timeout=timeout)
+            except Exception as e:
+                self.logger.debug("Single-flight notification failed: %s", e)
+                time.sleep(timeout)
+
+        try:
+            yield wait
+        finally:
+            if pubsub is not None:
+                pubsub.close()
+
+    def _acquire(self, key: str, token: str) -> bool:
+        redis = self._redis_client()
+        try:
+            if redis is None:
+                return cache.add(key, token, self.lease_seconds)
+            return bool(
+                redis.set(
+                    key, token, nx=True, px=int(self.lease_seconds * 1000)
+                )
+            )
+        except Exception as e:
+            # Fail open: without the lease store every caller runs alone.
+            self.logger.warning("Single-flight lease failed: %s", e)
+            return True
+
+    def _owner(self, key: str) -> str | None:
+        redis = self._redis_client()
+        try:
+            if redis is None:
+                return cache.get(key)
+            owner = redis.get(key)
+        except Exception as e:
+            self.logger.debug("Single-flight lease read failed: %s", e)
+            return None
+        return owner.decode() if isinstance(owner, bytes) else owner
+
+    def _renew(self, key: str, token: str) -> None:
+        try:
+            script = self._script(RENEW_SCRIPT)
+            if script is not None:
+                script(
+                    keys=[key], args=[token, int(self.lease_seconds * 1000)]
+                )
+            elif cache.get(key) == token:
+                cache.touch(key, self.lease_seconds)
+        except Exception as e:
+            self.logger.debug("Single-flight lease renewal failed: %s", e)
+
+    def _release(self, key: str, token: str) -> None:
+        try:
+            script = self._script(RELEASE_SCRIPT)
+            if script is not None:
+                script(keys=[key], args=[token])
+            elif cache.get(key) == token:
+                cache.delete(key)
+        except Exception as e:
+            # The lease expires on its own.
+            self.logger.debug("Single-flight lease release failed: %s", e)
+
+    def _notify(self, key: str, token: str) -> None:
+        with self._finished:
+            self._finished.notify_all()
+        redis = self._redis_client()
+        if redis is None:
+            return
+        try:
+            redis.publish(self._channel(key), token)
+        except Exception as e:
+            # Waiters still see the released lease on their next poll.
+            self.logger.debug("Single-flight notification failed: %s", e)
+
+    def _redis_client(self) -> Any:
+        if self._redis_available is None:
+            try:
+                from django_redis import get_redis_connection
+
+                self._redis = get_redis_connection("default")
+                self._redis_available = True
+            except (ImportError, NotImplementedError):
+                # Not a django-redis cache: keep leases in the Django cache.
+                self._redis_available = False
+        return self._redis
+
+    def _script(self, source: str) -> Any:
+        redis = self._redis_client()
+        if redis is None:
+            return None
+        with self._lock:
+            if source not in self._scripts:
+                self._scripts[source] = redis.register_script(source)
+            return self._scripts[source]
+
+    def _count(self, name: str, event: str, waited: float = 0.0) -> None:
+        with self._lock:
+            flight_stats = self._stats.setdefault(
+                name,
+                {
+                    "leads": 0,
+                    "coalesced": 0,
+                    "takeovers": 0,
+                    "timeouts": 0,
+                    "waited_seconds": 0.0,
+                },
+            )
+            flight_stats[event] += 1
+            flight_stats["waited_seconds"] += waited
+
+    def _key(self, name: str, identifier: str) -> str:
+        digest = hashlib.sha256(f"{name}:{identifier}".encode()).hexdigest()
+        return f"{self.key_prefix}:{name}:{digest}"
+
+    def _result_key(self, key: str, token: str) -> str:
+        return f"{key}:result:{token}"
+
+    def _channel(self, key: str) -> str:
+        return f"{key}:done"
+
+
+single_flight = SingleFlightService()
@@ -0,0 +1,55 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+class DeadlineExceededError(TimeoutError):
+    pass
+
+
+class Deadline:
+    """Absolute time budget shared by every outbound call of a request."""
+
+    def __init__(self, budget_seconds: float) -> None:
+        self.budget_seconds = budget_seconds
+        self.expires_at = time.monotonic() + budget_seconds
+
+    def remaining(self) -> float:
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def check(self) -> None:
+        if self.expired:
+            raise DeadlineExceededError(
+                f"Request deadline of {self.budget_seconds}s exceeded"
+            )
+
+    def timeout(self, cap: float | None = None) -> float:
+        self.check()
+        remaining = self.remaining()
+        if cap is not None:
+            return min(remaining, cap)
+        return remaining
+
+
+_current_deadline: ContextVar[Deadline | None] = ContextVar(
+    "current_deadline", default=None
+)
+
+
+def current_deadline() -> Deadline | None:
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(budget_seconds: float) -> Iterator[Deadline]:
+    deadline = Deadline(budget_seconds)
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
@@ -0,0 +1,19 @@
+from collections.abc import Callable, Iterable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+def parse_mapping(
+    entries: Iterable[str], cast: Callable[[str], T] = float
+) -> dict[str, T]:
+    """Parse ``name=value`` settings entries, e.g. from a ``Csv()`` setting.
+
+    Entries without a value are ignored.
+    """
+    mapping = {}
+    for entry in entries:
+        name, _, value = entry.partition("=")
+        if value.strip():
+            mapping[name.strip()] = cast(value.strip())
+    return mapping
@@ -1,42 +1,245 @@
 import logging
+import random
+import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from functools import wraps
-from typing import Any
+from typing import Any, TypeVar
+
+import requests
+
+from src.core.utils.deadline import DeadlineExceededError, current_deadline
+
+T = TypeVar("T")
+
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429})
+
+# Statuses whose Retry-After asks the client to back off (RFC 9110, 6585).
+RETRY_AFTER_STATUS_CODES = frozenset({429, 503})
+
+RETRYABLE_EXCEPTIONS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+    ConnectionError,
+    TimeoutError,
+)
+
+
+def _status_code(exc: BaseException) -> int | None:
+    response = getattr(exc, "response", None)
+    status_code = getattr(response, "status_code", None)
+    return status_code if isinstance(status_code, int) else None
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Retry server errors, throttling and transport failures only.
+
+    Client errors such as 400, 401 or 404 fail the same way on every
+    attempt, and so do programming errors, so they are raised at once.
+    """
+    if isinstance(exc, DeadlineExceededError):
+        return False
+    status_code = _status_code(exc)
+    if status_code is not None:
+        return status_code >= 500 or status_code in RETRYABLE_STATUS_CODES
+    return isinstance(exc, RETRYABLE_EXCEPTIONS)
+
+
+def retry_after(exc: BaseException) -> float | None:
+    """Seconds a 429 or 503 response asked to wait before the next call.
+
+    ``Retry-After`` is either a number of seconds or an HTTP date; a
+    missing or malformed header gives None.
+    """
+    if _status_code(exc) not in RETRY_AFTER_STATUS_CODES:
+        return None
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    value = headers.get("Retry-After") if headers is not None else None
+    if not isinstance(value, str):
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class RetryBudget:
+    """Retries shared by every outbound call of one extraction."""
+
+    def __init__(self, max_retries: int) -> None:
+        self.max_retries = max_retries
+        self.used = 0
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self) -> int:
+        return max(self.max_retries - self.used, 0)
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self.used >= self.max_retries:
+                return False
+            self.used += 1
+            return True
+
+
+_current_retry_budget: ContextVar[RetryBudget | None] = ContextVar(
+    "current_retry_budget", default=None
+)
+
+
+def current_retry_budget() -> RetryBudget | None:
+    return _current_retry_budget.get()
+
+
+@contextmanager
+def retry_budget_scope(max_retries: int) -> Iterator[RetryBudget]:
+    budget = RetryBudget(max_retries)
+    token = _current_retry_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _current_retry_budget.reset(token)
+
+
+class RetryPolicy:
+    """Jittered exponential backoff with status classification.
+
+    The delay before retry ``n`` is drawn from ``[0, min(max_delay,
+    base_delay * 2**n)]`` ("full jitter"), so clients that failed together
+    do not come back together, and never shorter than the ``Retry-After``
+    of a 429 or 503. A retry is skipped when the error is not retryable,
+    when the extraction's retry budget is spent or when the request
+    deadline cannot cover the delay.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        classifier: Callable[[BaseException], bool] = is_retryable,
+    ) -> None:
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.classifier = classifier
+
+    def backoff(self, attempt: int) -> float:
+        cap = min(self.max_delay, self.base_delay * 2**attempt)
+        return random.uniform(0, cap)  # noqa: S311 - jitter, not crypto
+
+    def next_delay(
+        self,
+        attempt: int,
+        exc: BaseException,
+        name: str,
+        logger: logging.Logger,
+    ) -> float | None:
+        """Delay before the next attempt, or None to raise ``exc``."""
+        if not self.classifier(exc):
+            logger.error("Non-retryable error in %s: %s", name, exc)
+            return None
+        if attempt >= self.max_retries:
+            logger.error(
+                "Max retries (%s) exceeded for %s. Final error: %s",
+                self.max_retries,
+                name,
+                exc,
+            )
+            return None
+
+        delay = max(self.backoff(attempt), retry_after(exc) or 0.0)
+        deadline = current_deadline()
+        if deadline is not None and deadline.remaining() <= delay:
+            logger.error(
+                "Deadline budget exhausted for %s, not retrying. "
+                "Final error: %s",
+                name,
+                exc,
+            )
+            return None
+        budget = current_retry_budget()
+        if budget is not None and not budget.try_acquire():
+            logger.error(
+                "Retry budget of %s exhausted for %s, not retrying. "
+                "Final error: %s",
+                budget.max_retries,
+                name,
+                exc,
+            )
+            return None
+
+        logger.warning(
+            "Attempt %s/%s failed for %s. Retrying in %.2f seconds. Error: %s",
+            attempt + 1,
+            self.max_retries + 1,
+            name,
+            delay,
+            exc,
+        )
+        return delay
+
+
+def _resolve_logger(
+    logger: logging.Logger | None, args: tuple[Any, ...]
+) -> logging.Logger:
+    if logger is None and args and hasattr(args[0], "_logger"):
+        logger = args[0]._logger
+    if logger is None:
+        logger = logging.getLogger(__name__)
+    return logger
+
+
+def call_with_retry(
+    func: Callable[[], T],
+    policy: RetryPolicy,
+    name: str,
+    logger: logging.Logger,
+) -> T:
+    """Call ``func`` until it succeeds or ``policy`` stops retrying."""
+    attempt = 0
+    while True:
+        try:
+            return func()
+        except Exception as e:
+            delay = policy.next_delay(attempt, e, name, logger)
+            if delay is None:
+                raise
+        time.sleep(delay)
+        attempt += 1
 
 
 def retry_with_backoff(
     max_retries: int = 3,
-    backoff_increment: int = 5,
+    base_delay: float = 0.5,
+    max_delay: float = 8.0,
     logger: logging.Logger | None = None,
+    classifier: Callable[[BaseException], bool] = is_retryable,
 ) -> Callable[[Callable], Callable]:
+    policy = RetryPolicy(max_retries, base_delay, max_delay, classifier)
+
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            nonlocal logger
-            if logger is None and args and hasattr(args[0], "_logger"):
-                logger = args[0]._logger
-            if logger is None:
-                logger = logging.getLogger(__name__)
-
-            for attempt in range(max_retries + 1):
-                try:
-                    return func(*args, **kwargs)
-                except Exception as e:
-                    if attempt < max_retries:
-                        delay = backoff_increment * (attempt + 1)
-                        logger.warning(
-                            f"Attempt {attempt + 1}/{max_retries + 1} failed for {func.__name__}. "
-                            f"Retrying in {delay} seconds. Error: {e}"
-                        )
-                        time.sleep(delay)
-                        continue
-                    else:
-                        logger.error(
-                            f"Max retries ({max_retries}) exceeded for {func.__name__}. "
-                            f"Final error: {e}"
-                        )
-                        raise
+            return call_with_retry(
+                lambda: func(*args, **kwargs),
+                policy,
+                func.__name__,
+                _resolve_logger(logger, args),
+            )
 
         return wrapper
 
@@ -1,17 +1,43 @@
 from datetime import datetime
 
+from django.conf import settings
 from django.http import HttpRequest
 from ninja import Router
 from ninja.errors import HttpError
 
 from src.config.logging import logger
+from src.core.services.single_flight_service import single_flight
+from src.core.utils.deadline import DeadlineExceededError, deadline_scope
+from src.core.utils.retry import retry_budget_scope
 from src.financial.schemas.schemas import (
     ExtractionRequestSchema,
     FinancialDataResponseSchema,
     HealthCheckSchema,
+    IntegrationStatsSchema,
 )
 from src.financial.services.client_service import DynamicClientService
 from src.financial.services.extraction_service import ExtractionService
+from src.integration.codecs import (
+    get_accept_encoding,
+    get_json_codec,
+    transfer_stats,
+)
+from src.integration.policies import route_policies
+from src.integration.services.bulkhead_service import bulkheads
+from src.integration.services.circuit_breaker_service import (
+    CircuitState,
+    circuit_breaker,
+)
+from src.integration.services.connection_pool_service import connection_pool
+from src.integration.services.cooldown_service import cooldowns
+from src.integration.services.hedging_service import hedging
+from src.integration.services.load_balancer_service import load_balancer
+from src.integration.services.page_size_service import page_sizes
+from src.integration.services.rate_limiter_service import (
+    rate_limit_scope,
+    rate_limiter,
+)
+from src.integration.services.validator_cache_service import validator_cache
 
 financial_router = Router()
 
@@ -22,32 +48,35 @@ financial_router = Router()
 def extract_financial_data(
     request: HttpRequest, data: ExtractionRequestSchema
 ) -> FinancialDataResponseSchema:
+    deadline_budget = getattr(settings, "OFDA_EXTRACTION_DEADLINE", 100)
+    retry_budget = getattr(settings, "OFDA_RETRY_BUDGET", 10)
     try:
-        logger.info(
-            f"Starting financial data extraction for user_document: {data.user_document}"
-        )
-
-        dynamic_client_data = DynamicClientService().get_or_create_client(
-            data.user_document
-        )
-        logger.info(f"Client obtained: {dynamic_client_data.name}")
-
-        extraction_service = ExtractionService()
-
-        result = extraction_service.extract_financial_data(
-            user_document=data.user_document,
-            dynamic_client_id=dynamic_client_data.id,
-            dynamic_token=dynamic_client_data.token,
-        )
-
-        logger.info(
-            f"Financial data extraction completed successfully for user_document: {data.user_document}"
-        )
-        return result
+        with (
+            deadline_scope(deadline_budget),
+            retry_budget_scope(retry_budget),
+            rate_limit_scope(data.user_document),
+        ):
+            # Concurrent requests for the same user share one extraction,
+            # dynamic client and consent included.
+            return single_flight.run(
+                "extraction",
+                data.user_document,
+                lambda: _extract(data.user_document),
+                dump=FinancialDataResponseSchema.model_dump,
+                load=FinancialDataResponseSchema.model_validate,
+            )
 
     except HttpError:
         raise
 
+    except DeadlineExceededError as e:
+        logger.error(
+            f"Deadline exceeded for user_document: {data.user_document}, Error: {str(e)}"
+        )
+        raise HttpError(
+            504, "Financial data extraction exceeded its deadline"
+        ) from e
+
     except ValueError as e:
         logger.error(
             f"Validation error for user_document: {data.user_document}, Error: {str(e)}"
@@ -64,6 +93,30 @@ def extract_financial_data(
         ) from e
 
 
+def _extract(user_document: str) -> FinancialDataResponseSchema:
+    logger.info(
+        f"Starting financial data extraction for user_document: {user_document}"
+    )
+
+    dynamic_client_data = DynamicClientService().get_or_create_client(
+        user_document
+    )
+    logger.info(f"Client obtained: {dynamic_client_data.name}")
+
+    extraction_service = ExtractionService()
+
+    result = extraction_service.extract_financial_data(
+        user_document=user_document,
+        dynamic_client_id=dynamic_client_data.id,
+        dynamic_token=dynamic_client_data.token,
+    )
+
+    logger.info(
+        f"Financial data extraction completed successfully for user_document: {user_document}"
+    )
+    return result
+
+
 @financial_router.get("/health", response=HealthCheckSchema)
 def health_check(request: HttpRequest) -> HealthCheckSchema:
     try:
@@ -79,6 +132,13 @@ def health_check(request: HttpRequest) -> HealthCheckSchema:
             logger.warning(f"OFDA API health check failed: {str(e)}")
             services_status["ofda_api"] = "unhealthy"
 
+        circuit_breakers = circuit_breaker.states()
+        if services_status["ofda_api"] == "healthy" and any(
+            circuit["state"] != CircuitState.CLOSED
+            for circuit in circuit_breakers.values()
+        ):
+            services_status["ofda_api"] = "degraded"
+
         overall_status = (
             "healthy"
             if all(status == "healthy" for status in services_status.values())
@@ -89,6 +149,7 @@ def health_check(request: HttpRequest) -> HealthCheckSchema:
             status=overall_status,
             timestamp=datetime.now(),
             services=services_status,
+            circuit_breakers=circuit_breakers,
         )
 
     except Exception as e:
@@ -98,3 +159,22 @@ def health_check(request: HttpRequest) -> HealthCheckSchema:
             timestamp=datetime.now(),
             services={"api": "unhealthy", "error": str(e)},
         )
+
+
+@financial_router.get("/integration/stats", response=IntegrationStatsSchema)
+def integration_stats(request: HttpRequest) -> IntegrationStatsSchema:
+    return IntegrationStatsSchema(
+        connection_pools=connection_pool.stats(),
+        endpoints=load_balancer.stats(),
+        json_codec=get_json_codec().name,
+        accept_encoding=get_accept_encoding(),
+        transfer=transfer_stats.snapshot(),
+        conditional_get=validator_cache.stats(),
+        rate_limits=rate_limiter.stats(),
+        cooldowns=cooldowns.stats(),
+        hedging=hedging.stats(),
+        concurrency=bulkheads.stats(),
+        route_policies=route_policies.table(),
+        page_sizes=page_sizes.stats(),
+        single_flight=single_flight.stats(),
+    )
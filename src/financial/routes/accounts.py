@@ -1,11 +1,17 @@
 from typing import Any
 
-from django.conf import settings
-
+from src.integration.enums import PaginationStyle
+from src.integration.policies import RoutePolicy
 from src.integration.routes.base import BaseRoute
 
 
 class AccountsRoute(BaseRoute):
+    policy = RoutePolicy(
+        traffic_class="accounts",
+        hedge=True,
+        pagination=PaginationStyle.PAGE,
+    )
+
     def __init__(self, data: dict[str, Any]) -> None:
         super().__init__()
         self._account_id = data.get("account_id")
@@ -15,7 +21,7 @@ class AccountsRoute(BaseRoute):
         self._limit = data.get("limit", 10)
 
     def get_base_url(self) -> str | None:
-        return settings.OFDA_API_BASE_URL
+        return self.get_endpoint()
 
     def get_resource_path(self) -> str:
         path = "/account/"
@@ -23,6 +29,8 @@ class AccountsRoute(BaseRoute):
             path = path + f"{self._account_id}"
         if self._page:
             path = f"/account?page={self._page}"
+            if self._limit:
+                path += f"&limit={self._limit}"
         return path
 
     def get_authorization_header(self) -> dict[str, str]:
@@ -1,11 +1,12 @@
 from typing import Any
 
-from django.conf import settings
-
+from src.integration.policies import RoutePolicy
 from src.integration.routes.base import BaseRoute
 
 
 class BalancesRoute(BaseRoute):
+    policy = RoutePolicy(traffic_class="balances", hedge=True)
+
     def __init__(self, data: dict[str, Any]) -> None:
         super().__init__()
         self._token = data.get("token")
@@ -13,7 +14,7 @@ class BalancesRoute(BaseRoute):
         self._operation = data.get("operation")
 
     def get_base_url(self) -> str | None:
-        return settings.OFDA_API_BASE_URL
+        return self.get_endpoint()
 
     def get_resource_path(self) -> str:
         return f"/account/{self._account_id}/balance"
@@ -1,11 +1,12 @@
 from typing import Any
 
-from django.conf import settings
-
+from src.integration.policies import RoutePolicy
 from src.integration.routes.base import BaseRoute
 
 
 class ConsentRoute(BaseRoute):
+    policy = RoutePolicy(traffic_class="consent")
+
     def __init__(self, data: dict[str, Any]) -> None:
         super().__init__()
         self._user_document = data.get("user_document")
@@ -15,7 +16,7 @@ class ConsentRoute(BaseRoute):
         self._operation = data.get("operation")
 
     def get_base_url(self) -> str:
-        return settings.OFDA_API_BASE_URL
+        return self.get_endpoint()
 
     def get_resource_path(self) -> str:
         path = "/consent/"
@@ -1,11 +1,12 @@
 from typing import Any
 
-from django.conf import settings
-
+from src.integration.policies import RoutePolicy
 from src.integration.routes.base import BaseRoute
 
 
 class DynamicClientRoute(BaseRoute):
+    policy = RoutePolicy(traffic_class="client")
+
     def __init__(self, data: dict[str, Any]) -> None:
         super().__init__()
         self._name = data.get("name")
@@ -16,7 +17,7 @@ class DynamicClientRoute(BaseRoute):
         self._client_id = data.get("client_id", "")
 
     def get_base_url(self) -> str:
-        return settings.OFDA_API_BASE_URL
+        return self.get_endpoint()
 
     def get_resource_path(self) -> str:
         return f"/dynamic-client/{self._client_id}"
@@ -1,11 +1,17 @@
 from typing import Any
 
-from django.conf import settings
-
+from src.integration.enums import PaginationStyle
+from src.integration.policies import RoutePolicy
 from src.integration.routes.base import BaseRoute
 
 
 class TransactionsRoute(BaseRoute):
+    policy = RoutePolicy(
+        traffic_class="transactions",
+        hedge=True,
+        pagination=PaginationStyle.PAGE,
+    )
+
     def __init__(self, data: dict[str, Any]) -> None:
         super().__init__()
         self._token = data.get("token")
@@ -15,12 +21,14 @@ class TransactionsRoute(BaseRoute):
         self._limit = data.get("limit", 10)
 
     def get_base_url(self) -> str:
-        return settings.OFDA_API_BASE_URL
+        return self.get_endpoint()
 
     def get_resource_path(self) -> str:
         path = f"/account/{self._account_id}/transactions"
         if self._page:
             path = path + f"?page={self._page}"
+            if self._limit:
+                path += f"&limit={self._limit}"
         return path
 
     def get_authorization_header(self) -> dict[str, str]:
@@ -59,6 +59,23 @@ class HealthCheckSchema(Schema):
     status: str
     timestamp: datetime | None = None
     services: dict
+    circuit_breakers: dict | None = None
+
+
+class IntegrationStatsSchema(Schema):
+    connection_pools: dict
+    endpoints: dict
+    json_codec: str
+    accept_encoding: str
+    transfer: dict
+    conditional_get: dict
+    rate_limits: dict
+    cooldowns: dict
+    hedging: dict
+    concurrency: dict
+    route_policies: dict
+    page_sizes: dict
+    single_flight: dict
 
 
 class ExtractionHistorySchema(Schema):
@@ -0,0 +1,57 @@
+from typing import Any
+
+from django.conf import settings
+
+from src.config.logging import logger
+from src.core.services.cache_service import CacheService
+
+
+class PaginationCheckpointService:
+    """Where an interrupted paginated extraction stopped.
+
+    A checkpoint holds the next page to fetch, the page size it was
+    counted with and the items of the pages fetched before it, per route
+    class, user and account, so the next extraction for the same user
+    resumes there instead of at page 1. Every extraction obtains a new
+    consent, so checkpoints are not keyed by it. Checkpoints live in the
+    cache (Redis) for ``OFDA_PAGINATION_CHECKPOINT_TIMEOUT`` seconds.
+    """
+
+    prefix = "pagination_checkpoint"
+
+    def __init__(self) -> None:
+        self.logger = logger
+        self.cache_service = CacheService()
+
+    @property
+    def timeout(self) -> int:
+        return getattr(settings, "OFDA_PAGINATION_CHECKPOINT_TIMEOUT", 3600)
+
+    @staticmethod
+    def key(
+        route_class: type, user_document: str, account_id: str = ""
+    ) -> str:
+        return f"{route_class.__name__}:{user_document}:{account_id}"
+
+    def load(self, key: str) -> dict[str, Any] | None:
+        return self.cache_service.get_cached_data(self.prefix, key)
+
+    def save(
+        self,
+        key: str,
+        next_page: int,
+        items: list[dict],
+        limit: int | None = None,
+    ) -> bool:
+        self.logger.info(
+            "Saving pagination checkpoint %s at page %s", key, next_page
+        )
+        return self.cache_service.cache_data(
+            self.prefix,
+            key,
+            {"next_page": next_page, "items": items, "limit": limit},
+            self.timeout,
+        )
+
+    def clear(self, key: str) -> bool:
+        return self.cache_service.invalidate_data(self.prefix, key)
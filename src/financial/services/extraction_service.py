@@ -1,8 +1,17 @@
-from datetime import datetime
-from typing import Any
-
-from src.config.logging import logger
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import copy_context
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any, TypeVar
+
+from django.conf import settings
+
+from src.config.logging import hot_path_logger, logger
 from src.core.services.cache_service import CacheService
+from src.core.utils.deadline import current_deadline
 from src.financial.routes.accounts import AccountsRoute
 from src.financial.routes.balances import BalancesRoute
 from src.financial.routes.transactions import TransactionsRoute
@@ -13,57 +22,117 @@ from src.financial.schemas.schemas import (
     SummarySchema,
     TransactionSchema,
 )
+from src.financial.services.checkpoint_service import (
+    PaginationCheckpointService,
+)
 from src.financial.services.consent_service import ConsentData, ConsentService
-from src.integration.enums import RouteMethod
+from src.financial.services.page_prefetcher import PagePrefetcher
+from src.financial.services.transaction_sync_service import (
+    TransactionSyncService,
+)
+from src.integration.decoders import DecodedPage, StreamedPage
+from src.integration.enums import PaginationStyle, RouteMethod
+from src.integration.policies import route_policies
+from src.integration.services.circuit_breaker_service import (
+    CircuitOpenError,
+    circuit_breaker,
+)
+from src.integration.services.page_size_service import page_sizes
 from src.integration.services.router_service import RouterService
 
+T = TypeVar("T")
+
+
+@dataclass
+class ExtractionReport:
+    """Errors of an extraction, or of the lists fetched for one account."""
+
+    errors: list[str] = field(default_factory=list)
+    incomplete: bool = False
+
+    def record(self, error_message: str) -> None:
+        self.errors.append(error_message)
+        self.incomplete = True
+
+    def merge(self, other: "ExtractionReport") -> None:
+        self.errors.extend(other.errors)
+        self.incomplete = self.incomplete or other.incomplete
+
 
 class ExtractionService:
     def __init__(self) -> None:
         self.logger = logger
+        self.hot_path_logger = hot_path_logger
         self.consent_service = ConsentService()
         self.router_service = RouterService()
         self.cache_service = CacheService()
+        self.checkpoint_service = PaginationCheckpointService()
+        self.transaction_sync = TransactionSyncService()
+        self.report = ExtractionReport()
+        self.streaming_decode = getattr(
+            settings, "OFDA_STREAMING_DECODE", False
+        )
+        self.stale_timeout = getattr(
+            settings, "OFDA_CIRCUIT_STALE_TIMEOUT", 86400
+        )
+        self.max_pages = getattr(settings, "OFDA_PAGINATION_MAX_PAGES", 100)
+        self.page_max_attempts = max(
+            getattr(settings, "OFDA_PAGE_MAX_ATTEMPTS", 2), 1
+        )
+        self.concurrency = max(
+            getattr(settings, "OFDA_EXTRACTION_CONCURRENCY", 16), 1
+        )
+        self.prefetch_pages = max(
+            getattr(settings, "OFDA_PAGE_PREFETCH", 0), 0
+        )
+        self._prefetch_windows: dict[str, int] = {}
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def extraction_errors(self) -> list[str]:
+        return self.report.errors
+
+    @property
+    def incomplete(self) -> bool:
+        return self.report.incomplete
 
     def extract_financial_data(
         self, user_document: str, dynamic_client_id: str, dynamic_token: str
     ) -> FinancialDataResponseSchema:
         start_time = datetime.now()
-        extraction_errors = []
+        self.report = ExtractionReport()
+        extraction_errors = self.report.errors
 
         cached_data = self.cache_service.get_cached_data(
             "extraction", user_document
         )
         if cached_data:
             self.logger.info(
-                f"Returning cached financial data for user_document: {user_document}"
+                "Returning cached financial data for user_document: %s",
+                user_document,
             )
             return FinancialDataResponseSchema(**cached_data)
 
         try:
             self.logger.info(
-                f"Starting financial data extraction for user_document: {user_document}"
+                "Starting financial data extraction for user_document: %s",
+                user_document,
             )
             consent_data = self._get_or_create_consent(
                 user_document=user_document,
                 dynamic_client_id=dynamic_client_id,
                 token=dynamic_token,
             )
-            self.logger.info(f"Consent obtained: {consent_data.id}")
+            self.logger.info("Consent obtained: %s", consent_data.id)
 
             accounts_data = self._extract_accounts(user_document, consent_data)
-            self.logger.info(f"Accounts extracted: {len(accounts_data)}")
-
-            balances_data = self._extract_balances(
-                user_document, consent_data, accounts_data
-            )
-            self.logger.info(f"Balances extracted: {len(balances_data)}")
+            self.logger.info("Accounts extracted: %s", len(accounts_data))
 
-            transactions_data = self._extract_transactions(
+            balances_data, transactions_data = self._extract_account_data(
                 user_document, consent_data, accounts_data
             )
             self.logger.info(
-                f"Transactions extracted: {len(transactions_data)}"
+                "Transactions extracted: %s", len(transactions_data)
             )
 
             processing_time = (
@@ -80,12 +149,24 @@ class ExtractionService:
             )
 
             self.logger.info(
-                f"Financial data extraction completed successfully for user_document: {user_document}"
+                "Financial data extraction completed successfully for user_document: %s",
+                user_document,
             )
 
-            self.cache_service.cache_data(
-                "extraction", user_document, formatted_response.model_dump()
-            )
+            response_data = formatted_response.model_dump()
+            # An incomplete extraction is not cached, so the next request
+            # fetches the missing pages instead of repeating the gaps.
+            if not self.incomplete:
+                self.cache_service.cache_data(
+                    "extraction", user_document, response_data
+                )
+            if circuit_breaker.enabled:
+                self.cache_service.cache_data(
+                    "extraction_stale",
+                    user_document,
+                    response_data,
+                    self.stale_timeout,
+                )
 
             return formatted_response
 
@@ -100,6 +181,13 @@ class ExtractionService:
                 f"Error in financial data extraction for user_document: {user_document}, Error: {str(e)}"
             )
 
+            if self._is_circuit_open(e):
+                stale_response = self._stale_response(
+                    user_document, error_message
+                )
+                if stale_response is not None:
+                    return stale_response
+
             # Create empty response schema for error case
             summary = SummarySchema(
                 total_accounts=0,
@@ -115,6 +203,34 @@ class ExtractionService:
                 summary=summary,
             )
 
+    @staticmethod
+    def _is_circuit_open(error: BaseException | None) -> bool:
+        while error is not None:
+            if isinstance(error, CircuitOpenError):
+                return True
+            error = error.__cause__
+        return False
+
+    def _stale_response(
+        self, user_document: str, error_message: str
+    ) -> FinancialDataResponseSchema | None:
+        stale_data = self.cache_service.get_cached_data(
+            "extraction_stale", user_document
+        )
+        if not stale_data:
+            return None
+        self.logger.warning(
+            "OFDA circuit open, serving last good extraction for "
+            "user_document: %s",
+            user_document,
+        )
+        stale_data["summary"]["errors"] = [
+            *stale_data["summary"]["errors"],
+            error_message,
+            "Served from the last successful extraction",
+        ]
+        return FinancialDataResponseSchema(**stale_data)
+
     def _get_or_create_consent(
         self, user_document: str, dynamic_client_id: str, token: str
     ) -> ConsentData:
@@ -128,60 +244,304 @@ class ExtractionService:
             # self.logger.error(f"Error getting/creating consent for user_document: {user_document}, Error: {str(e)}")
             raise ValueError(f"Failed to obtain consent: {str(e)}") from e
 
+    def _deadline_expired(self) -> bool:
+        deadline = current_deadline()
+        return deadline is not None and deadline.expired
+
+    def _record_deadline_skip(
+        self, report: ExtractionReport, resource: str, detail: str
+    ) -> None:
+        error_message = f"Deadline exceeded: skipped {resource} {detail}"
+        self.logger.warning(error_message)
+        report.record(error_message)
+
     def _fetch_paginated_data(
         self,
         route_class: type,
         route_data: dict[str, Any],
         data_key: str = "items",
     ) -> list[dict[str, Any]]:
-        all_items = []
+        return list(
+            self._iter_paginated_data(route_class, route_data, data_key)
+        )
+
+    def _iter_paginated_data(
+        self,
+        route_class: type,
+        route_data: dict[str, Any],
+        data_key: str = "items",
+        checkpoint: str | None = None,
+        stop_at: Callable[[dict[str, Any]], bool] | None = None,
+        in_order: Callable[[dict[str, Any], dict[str, Any]], bool]
+        | None = None,
+        report: ExtractionReport | None = None,
+        transform: Callable[[dict[str, Any]], dict[str, Any]] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield the items of every page, resuming from ``checkpoint``.
+
+        A failing page is attempted up to ``OFDA_PAGE_MAX_ATTEMPTS`` times
+        and at most ``OFDA_PAGINATION_MAX_PAGES`` pages are fetched per
+        list. When pagination stops early the missing pages are
+        reported in the extraction errors and, given a ``checkpoint`` key,
+        the pages fetched so far are saved so the next extraction resumes
+        from the first missing page. Routes whose policy does not paginate
+        are fetched once. With ``OFDA_PAGE_PREFETCH`` the next pages are
+        requested while the current one is read. Items matching
+        ``stop_at`` are not yielded, and pagination ends after the page
+        where one was found unless ``in_order`` rejects one of that page's
+        items after the item before it. Missing pages are recorded in
+        ``report``, the extraction's by default.
+
+        Items are passed through ``transform`` before they are yielded and
+        kept for the checkpoint, so the checkpoint holds the same objects
+        as the caller instead of the whole OFDA items next to them.
+        """
+        if report is None:
+            report = self.report
         page = 1
-        has_next = True
-        retry_count = 0
+        fetched: list[dict[str, Any]] = []
+        saved = checkpoint and self.checkpoint_service.load(checkpoint)
+        if saved:
+            page = saved["next_page"]
+            fetched = saved["items"]
+            self.logger.info(
+                "Resuming %s from page %s", route_class.__name__, page
+            )
+            yield from fetched
 
-        while has_next:
-            try:
-                route_data["page"] = page
-                route = route_class(data=route_data)
+        paginated = (
+            route_policies.get(route_class.__name__).pagination
+            == PaginationStyle.PAGE
+        )
+        limit = None
+        if paginated:
+            # Page numbers are only meaningful with the size they were
+            # counted with, so a resumed list keeps its size.
+            limit = (
+                saved.get("limit")
+                if saved
+                else page_sizes.size(route_class.__name__)
+            )
+        page_data = (
+            route_data if limit is None else {**route_data, "limit": limit}
+        )
+        prefetcher = None
+        if paginated and self.prefetch_pages:
+            prefetcher = PagePrefetcher(
+                lambda number: self._fetch_page(
+                    route_class, page_data, number
+                ),
+                window=self._prefetch_windows.get(
+                    route_class.__name__, self.prefetch_pages
+                ),
+                max_window=self.prefetch_pages,
+                last_page=page + self.max_pages - 1,
+            )
+        item_count = len(fetched)
+        pages_fetched = 0
+        attempts = 0
+        # Items of the current page already yielded by a failed attempt.
+        yielded_on_page = 0
+        page_items: list[dict[str, Any]] = []
+        has_next = True
+        stopped_reason: str | None = None
 
-                result = self.router_service.router_process(route)
-                if not result.success:
-                    self.logger.warning(
-                        f"Paginated data extraction failed on page {page}, attempt {retry_count + 1}"
+        try:
+            while has_next:
+                if pages_fetched >= self.max_pages:
+                    stopped_reason = f"page limit ({self.max_pages}) reached"
+                    break
+                if self._deadline_expired():
+                    self._record_deadline_skip(
+                        report,
+                        route_class.__name__,
+                        self._describe_pages(route_data, page),
                     )
-                    retry_count += 1
-                    continue
-
-                response_json = result.response.json()
-
-                if data_key in response_json:
-                    page_items = response_json[data_key]
-                    all_items.extend(page_items)
-                    has_next = response_json.get("has_next", False)
-                    self.logger.debug(
-                        f"Fetched page {page} with {len(page_items)} items, has_next: {has_next}"
+                    break
+                try:
+                    if prefetcher is not None:
+                        route, result = prefetcher.get(page)
+                    else:
+                        route, result = self._fetch_page(
+                            route_class, page_data, page
+                        )
+                    if result is None or not result.success:
+                        raise ValueError(f"page {page} was not fetched")
+
+                    page_reader = self._read_page(result, route, data_key)
+                    index = 0
+                    reached_stop = False
+                    page_in_order = True
+                    previous = None
+                    for item in page_reader:
+                        index += 1
+                        if in_order is not None and previous is not None:
+                            page_in_order = page_in_order and in_order(
+                                previous, item
+                            )
+                        previous = item
+                        if stop_at is not None and stop_at(item):
+                            reached_stop = True
+                            continue
+                        if index <= yielded_on_page:
+                            continue
+                        yielded_on_page = index
+                        if transform is not None:
+                            item = transform(item)
+                        page_items.append(item)
+                        yield item
+                    has_next = (
+                        paginated
+                        and not (reached_stop and page_in_order)
+                        and page_reader.has_next
                     )
-                else:
-                    all_items.append(response_json)
-                    has_next = False
-                    self.logger.debug(
-                        f"Fetched single item response on page {page}"
+                    if prefetcher is not None and (
+                        not has_next or (limit is not None and index < limit)
+                    ):
+                        # A short or empty page means the list is about to
+                        # end, so fewer pages are requested past it.
+                        prefetcher.shrink()
+                    if limit is not None:
+                        page_sizes.record(
+                            route_class.__name__,
+                            limit,
+                            len(page_items),
+                            *self._page_cost(result),
+                        )
+
+                except CircuitOpenError:
+                    self._save_checkpoint(checkpoint, page, fetched, limit)
+                    raise
+                except Exception as e:
+                    if self._deadline_expired():
+                        self._record_deadline_skip(
+                            report,
+                            route_class.__name__,
+                            self._describe_pages(route_data, page),
+                        )
+                        break
+                    attempts += 1
+                    self.logger.warning(
+                        "Error fetching page %s, attempt %s: %s",
+                        page,
+                        attempts,
+                        e,
                     )
+                    if attempts >= self.page_max_attempts:
+                        stopped_reason = str(e)
+                        break
+                    continue
 
-            except Exception as e:
-                self.logger.warning(f"Error fetching page {page}: {str(e)}")
-
-            page += 1
-            if page > 100:
-                self.logger.warning(
-                    "Reached maximum page limit (100) to prevent infinite loop"
+                self.hot_path_logger.debug(
+                    "Fetched page %s with %s items, has_next: %s",
+                    page,
+                    len(page_items),
+                    has_next,
                 )
-                break
+                item_count += len(page_items)
+                if checkpoint:
+                    fetched.extend(page_items)
+                page_items = []
+                yielded_on_page = 0
+                attempts = 0
+                pages_fetched += 1
+                page += 1
+        finally:
+            if prefetcher is not None:
+                self._end_prefetch(route_class.__name__, prefetcher)
+
+        if has_next:
+            if stopped_reason is not None:
+                self._record_missing_pages(
+                    report,
+                    route_class.__name__,
+                    self._describe_pages(route_data, page),
+                    stopped_reason,
+                )
+            self._save_checkpoint(checkpoint, page, fetched, limit)
+        elif saved:
+            self.checkpoint_service.clear(checkpoint)
+
+        self.hot_path_logger.info(
+            "Successfully fetched %s total items across %s pages",
+            item_count,
+            pages_fetched,
+        )
+
+    def _fetch_page(
+        self, route_class: type, route_data: dict[str, Any], page: int
+    ) -> tuple[Any, Any]:
+        route = route_class(data={**route_data, "page": page})
+        route.stream_response = self.streaming_decode
+        return route, self.router_service.router_process(route)
+
+    def _end_prefetch(
+        self, route_name: str, prefetcher: PagePrefetcher
+    ) -> None:
+        dropped = prefetcher.close()
+        # The next stream of this route starts where this one left off.
+        window = prefetcher.window
+        self._prefetch_windows[route_name] = window
+        self.hot_path_logger.debug(
+            "Prefetched %s pages of %s, dropped %s, window now %s",
+            prefetcher.hits,
+            route_name,
+            dropped,
+            window,
+        )
 
-        self.logger.info(
-            f"Successfully fetched {len(all_items)} total items across {page - 1} pages"
+    def _save_checkpoint(
+        self,
+        checkpoint: str | None,
+        page: int,
+        items: list[dict[str, Any]],
+        limit: int | None = None,
+    ) -> None:
+        if checkpoint:
+            self.checkpoint_service.save(checkpoint, page, items, limit)
+
+    @staticmethod
+    def _page_cost(result: Any) -> tuple[float | None, int | None]:
+        """Response time and body size of a page, when known."""
+        response = result.response
+        elapsed = getattr(response, "elapsed", None)
+        seconds = (
+            elapsed.total_seconds() if isinstance(elapsed, timedelta) else None
+        )
+        headers = getattr(response, "headers", None)
+        length = (
+            headers.get("Content-Length")
+            if isinstance(headers, Mapping)
+            else None
         )
-        return all_items
+        size = (
+            int(length)
+            if isinstance(length, str) and length.isdigit()
+            else None
+        )
+        return seconds, size
+
+    def _record_missing_pages(
+        self, report: ExtractionReport, resource: str, detail: str, reason: str
+    ) -> None:
+        error_message = f"Missing {resource} {detail}: {reason}"
+        self.logger.warning(error_message)
+        report.record(error_message)
+
+    def _read_page(
+        self, result: Any, route: Any, data_key: str
+    ) -> DecodedPage | StreamedPage:
+        if route.stream_response:
+            return StreamedPage(
+                result.response, data_key, label=route.__class__.__name__
+            )
+        return DecodedPage(result.response.json(), data_key)
+
+    def _describe_pages(self, route_data: dict[str, Any], page: int) -> str:
+        detail = f"pages from {page}"
+        if route_data.get("account_id"):
+            detail += f" for account {route_data['account_id']}"
+        return detail
 
     def _extract_accounts(
         self, user_document: str, consent_data: ConsentData
@@ -192,8 +552,15 @@ class ExtractionService:
                 "operation": RouteMethod.GET,
             }
 
-            accounts = self._fetch_paginated_data(
-                AccountsRoute, route_data, "items"
+            accounts = list(
+                self._iter_paginated_data(
+                    AccountsRoute,
+                    route_data,
+                    "items",
+                    checkpoint=self.checkpoint_service.key(
+                        AccountsRoute, user_document
+                    ),
+                )
             )
 
             if not accounts:
@@ -207,38 +574,152 @@ class ExtractionService:
             )
             raise ValueError(f"Failed to extract accounts: {str(e)}") from e
 
-    def _extract_balances(
+    def _extract_account_data(
         self,
         user_document: str,
         consent_data: ConsentData,
         accounts: list[dict[str, Any]],
-    ) -> list[dict[str, Any]]:
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Balances and transactions of every account, fetched concurrently.
+
+        The calls of all accounts share one pool of
+        ``OFDA_EXTRACTION_CONCURRENCY`` threads, and results are returned
+        in account order however they complete.
+        """
+        with self._account_pool(2 * len(accounts)):
+            balance_futures = self._submit_per_account(
+                self._fetch_balance, consent_data, accounts
+            )
+            transaction_futures = self._submit_per_account(
+                partial(self._fetch_transactions, user_document),
+                consent_data,
+                accounts,
+            )
+            balances = self._collect_balances(
+                user_document, accounts, balance_futures
+            )
+            self.logger.info("Balances extracted: %s", len(balances))
+            transactions = self._collect_transactions(
+                user_document, transaction_futures
+            )
+        return balances, transactions
+
+    @contextmanager
+    def _account_pool(self, calls: int) -> Iterator[None]:
+        workers = min(self.concurrency, calls)
+        if workers <= 1:
+            yield
+            return
+        executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="extraction"
+        )
+        self._executor = executor
         try:
-            balances = []
-            for account in accounts:
-                route = BalancesRoute(
-                    data={
-                        "token": consent_data.token,
-                        "account_id": account["id"],
-                        "operation": RouteMethod.GET,
-                    }
+            yield
+        finally:
+            self._executor = None
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _submit_per_account(
+        self,
+        fetch: Callable[[ConsentData, dict[str, Any]], T],
+        consent_data: ConsentData,
+        accounts: list[dict[str, Any]],
+    ) -> list[Future]:
+        futures = []
+        for account in accounts:
+            if self._executor is not None:
+                # Each call runs in its own copy of the request context, so
+                # the deadline and the retry budget apply to it.
+                futures.append(
+                    self._executor.submit(
+                        copy_context().run, fetch, consent_data, account
+                    )
                 )
+                continue
+            future: Future = Future()
+            futures.append(future)
+            try:
+                future.set_result(fetch(consent_data, account))
+            except Exception as e:
+                future.set_exception(e)
+                break
+        return futures
 
-                result = self.router_service.router_process(route)
+    @staticmethod
+    def _results(futures: list[Future]) -> Iterator[Any]:
+        try:
+            for future in futures:
+                yield future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
 
-                if not result.success:
-                    raise ValueError("Balances extraction failed")
+    def _extract_balances(
+        self,
+        user_document: str,
+        consent_data: ConsentData,
+        accounts: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        return self._collect_balances(
+            user_document,
+            accounts,
+            self._submit_per_account(
+                self._fetch_balance, consent_data, accounts
+            ),
+        )
 
-                response_json = result.response.json()
-                balances.append(
-                    {
-                        "account_id": account["id"],
-                        "balance": {
-                            "amount": response_json["balance"],
-                            "currency": response_json["currency"],
-                        },
-                    }
-                )
+    def _fetch_balance(
+        self, consent_data: ConsentData, account: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """Balance of ``account``, None when the deadline ran out first."""
+        route = BalancesRoute(
+            data={
+                "token": consent_data.token,
+                "account_id": account["id"],
+                "operation": RouteMethod.GET,
+            }
+        )
+        if self._deadline_expired():
+            return None
+        try:
+            result = self.router_service.router_process(route)
+        except Exception:
+            if not self._deadline_expired():
+                raise
+            return None
+
+        if not result.success:
+            raise ValueError("Balances extraction failed")
+
+        response_json = result.response.json()
+        return {
+            "account_id": account["id"],
+            "balance": {
+                "amount": response_json["balance"],
+                "currency": response_json["currency"],
+            },
+        }
+
+    def _collect_balances(
+        self,
+        user_document: str,
+        accounts: list[dict[str, Any]],
+        futures: list[Future],
+    ) -> list[dict[str, Any]]:
+        try:
+            balances = []
+            skipped = []
+            for account, balance in zip(
+                accounts, self._results(futures), strict=False
+            ):
+                if balance is None:
+                    skipped.append(account)
+                else:
+                    balances.append(balance)
+            if skipped:
+                self._record_skipped_balances(skipped)
 
             return balances
 
@@ -248,52 +729,116 @@ class ExtractionService:
             )
             raise ValueError(f"Failed to extract balances: {str(e)}") from e
 
+    def _record_skipped_balances(self, accounts: list[dict[str, Any]]) -> None:
+        skipped = ", ".join(account["id"] for account in accounts)
+        self._record_deadline_skip(
+            self.report, BalancesRoute.__name__, f"for accounts {skipped}"
+        )
+
     def _extract_transactions(
         self,
         user_document: str,
         consent_data: ConsentData,
         accounts: list[dict[str, Any]],
     ) -> list[dict[str, Any]]:
-        try:
-            all_transactions = []
-            for account in accounts:
-                route_data = {
-                    "token": consent_data.token,
-                    "account_id": account["id"],
-                    "operation": RouteMethod.GET,
-                }
-
-                account_transactions = self._fetch_paginated_data(
-                    TransactionsRoute, route_data, "items"
-                )
+        return self._collect_transactions(
+            user_document,
+            self._submit_per_account(
+                partial(self._fetch_transactions, user_document),
+                consent_data,
+                accounts,
+            ),
+        )
 
-                if not account_transactions:
-                    raise ValueError("Transactions extraction failed")
-
-                for transaction in account_transactions:
-                    all_transactions.append(
-                        {
-                            "account_id": account["id"],
-                            "transaction_id": transaction["id"],
-                            "transaction_type": transaction[
-                                "transaction_type"
-                            ],
-                            "transaction_status": transaction[
-                                "transaction_status"
-                            ],
-                            "amount": transaction["transaction_amount"],
-                            "currency": "",
-                            "direction": transaction["transaction_direction"],
-                            "description": transaction[
-                                "transaction_description"
-                            ],
-                            "date": transaction["transaction_date"],
-                        }
-                    )
+    def _fetch_transactions(
+        self,
+        user_document: str,
+        consent_data: ConsentData,
+        account: dict[str, Any],
+    ) -> tuple[list[dict[str, Any]], ExtractionReport]:
+        """Transactions of ``account`` and what was missing from them.
+
+        Runs on the account pool, so the report is returned for the calling
+        thread to merge instead of being written to the extraction's.
+        """
+        route_data = {
+            "token": consent_data.token,
+            "account_id": account["id"],
+            "operation": RouteMethod.GET,
+        }
 
-                self.logger.info(
-                    f"Extracted {len(account_transactions)} transactions for account {account['id']}"
-                )
+        snapshot_key = self.transaction_sync.key(user_document, account["id"])
+        snapshot = self.transaction_sync.load(snapshot_key)
+
+        # Whether this account's list was cut short, whatever happened to
+        # the lists of the other accounts.
+        report = ExtractionReport()
+        transactions = list(
+            self._iter_paginated_data(
+                TransactionsRoute,
+                route_data,
+                "items",
+                checkpoint=self.checkpoint_service.key(
+                    TransactionsRoute, user_document, account["id"]
+                ),
+                stop_at=(
+                    self.transaction_sync.is_known(snapshot)
+                    if snapshot
+                    else None
+                ),
+                in_order=self.transaction_sync.in_order,
+                report=report,
+                transform=partial(self._map_transaction, account["id"]),
+            )
+        )
+
+        new_count = len(transactions)
+        if snapshot:
+            transactions = self.transaction_sync.merge(transactions, snapshot)
+
+        if (
+            not transactions
+            and not report.incomplete
+            and not self._deadline_expired()
+        ):
+            raise ValueError("Transactions extraction failed")
+
+        # A list cut short would leave a gap under the new high-water mark.
+        if not report.incomplete:
+            self.transaction_sync.save(snapshot_key, transactions)
+
+        self.hot_path_logger.info(
+            "Extracted %s transactions for account %s, %s new",
+            len(transactions),
+            account["id"],
+            new_count,
+        )
+        return transactions, report
+
+    @staticmethod
+    def _map_transaction(
+        account_id: str, transaction: dict[str, Any]
+    ) -> dict[str, Any]:
+        return {
+            "account_id": account_id,
+            "transaction_id": transaction["id"],
+            "transaction_type": transaction["transaction_type"],
+            "transaction_status": transaction["transaction_status"],
+            "amount": transaction["transaction_amount"],
+            "currency": "",
+            "direction": transaction["transaction_direction"],
+            "description": transaction["transaction_description"],
+            "date": transaction["transaction_date"],
+        }
+
+    def _collect_transactions(
+        self, user_document: str, futures: list[Future]
+    ) -> list[dict[str, Any]]:
+        try:
+            all_transactions = []
+            for transactions, report in self._results(futures):
+                all_transactions.extend(transactions)
+                self.report.merge(report)
 
             return all_transactions
 
@@ -0,0 +1,75 @@
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Any
+
+
+def _discard(future: Future) -> None:
+    # A dropped page may hold an open (streamed) response.
+    if future.cancelled() or future.exception() is not None:
+        return
+    _, result = future.result()
+    close = getattr(getattr(result, "response", None), "close", None)
+    if close is not None:
+        close()
+
+
+class PagePrefetcher:
+    """Requests the pages after the one being read before they are asked for.
+
+    ``get(page)`` returns ``fetch(page)`` and keeps up to ``window`` of the
+    following pages, never past ``last_page``, in flight on worker threads,
+    each in its own copy of the caller's context so the deadline and the
+    retry budget apply. Every prefetched page that is used grows the window
+    by one, up to ``max_window``, and ``shrink`` halves it when the list
+    nears its end; ``close`` drops the pages still in flight and reports
+    how many there were.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[int], tuple[Any, Any]],
+        window: int,
+        max_window: int,
+        last_page: int,
+    ) -> None:
+        self.fetch = fetch
+        self.window = max(min(window, max_window), 1)
+        self.max_window = max_window
+        self.last_page = last_page
+        self.hits = 0
+        self._futures: dict[int, Future] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_window + 1, thread_name_prefix="page-prefetch"
+        )
+
+    def get(self, page: int) -> tuple[Any, Any]:
+        future = self._futures.pop(page, None)
+        if future is None:
+            future = self._submit(page)
+        else:
+            self.hits += 1
+            self.window = min(self.window + 1, self.max_window)
+        for ahead in range(
+            page + 1, min(page + self.window, self.last_page) + 1
+        ):
+            if ahead not in self._futures:
+                self._futures[ahead] = self._submit(ahead)
+        return future.result()
+
+    def shrink(self) -> None:
+        """Halve the window, down to one page."""
+        self.window = max(self.window // 2, 1)
+
+    def close(self) -> int:
+        """Drop the pages still in flight, returning how many there were."""
+        dropped = len(self._futures)
+        for future in self._futures.values():
+            if not future.cancel():
+                future.add_done_callback(_discard)
+        self._futures.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        return dropped
+
+    def _submit(self, page: int) -> Future:
+        return self._executor.submit(copy_context().run, self.fetch, page)
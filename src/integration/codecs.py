@@ -0,0 +1,113 @@
+import json
+import threading
+from typing import Any
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+class JSONCodec:
+    name = "json"
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    name = "orjson"
+
+    def loads(self, data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+
+def get_json_codec() -> JSONCodec:
+    preferred = getattr(settings, "OFDA_JSON_CODEC", "auto")
+    if preferred in ("auto", "orjson") and orjson is not None:
+        return OrjsonCodec()
+    return JSONCodec()
+
+
+def get_accept_encoding() -> str:
+    """Preferred response encodings the HTTP stack can actually decode."""
+    supported = set(ACCEPT_ENCODING.split(","))
+    preferred = getattr(
+        settings, "OFDA_ACCEPT_ENCODINGS", ["zstd", "br", "gzip", "deflate"]
+    )
+    encodings = [encoding for encoding in preferred if encoding in supported]
+    return ", ".join(encodings) or "identity"
+
+
+class CodecResponse(requests.Response):
+    """Response whose ``json()`` goes through the configured codec."""
+
+    def json(self, **kwargs: Any) -> Any:
+        if kwargs or not self.content:
+            return super().json(**kwargs)
+        return get_json_codec().loads(self.content)
+
+
+class CodecHTTPAdapter(HTTPAdapter):
+    def build_response(self, req: Any, resp: Any) -> requests.Response:
+        response = super().build_response(req, resp)
+        response.__class__ = CodecResponse
+        return response
+
+
+class TransferStats:
+    """Bytes received on the wire vs decoded body bytes, per route class."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: dict[str, dict[str, int]] = {}
+
+    def record(self, label: str, wire_bytes: int, decoded_bytes: int) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(
+                label, {"responses": 0, "wire_bytes": 0, "decoded_bytes": 0}
+            )
+            stats["responses"] += 1
+            stats["wire_bytes"] += wire_bytes
+            stats["decoded_bytes"] += decoded_bytes
+
+    def record_response(self, label: str, response: Any) -> None:
+        wire_bytes, decoded_bytes = self._measure(response)
+        if wire_bytes is not None and decoded_bytes is not None:
+            self.record(label, wire_bytes, decoded_bytes)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            stats = {label: dict(data) for label, data in self._stats.items()}
+        for data in stats.values():
+            data["compression_ratio"] = (
+                round(data["decoded_bytes"] / data["wire_bytes"], 2)
+                if data["wire_bytes"]
+                else None
+            )
+        return stats
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    @staticmethod
+    def _measure(response: Any) -> tuple[int | None, int | None]:
+        num_bytes_downloaded = getattr(response, "num_bytes_downloaded", None)
+        if isinstance(num_bytes_downloaded, int):
+            return num_bytes_downloaded, len(response.content)
+        if not isinstance(response, requests.Response):
+            return None, None
+        tell = getattr(response.raw, "tell", None)
+        wire_bytes = tell() if callable(tell) else None
+        if not isinstance(wire_bytes, int):
+            return None, None
+        return wire_bytes, len(response.content)
+
+
+transfer_stats = TransferStats()
@@ -0,0 +1,118 @@
+import json
+from collections.abc import Iterator
+from typing import Any
+
+try:
+    import ijson
+    from ijson.common import ObjectBuilder
+except ImportError:  # pragma: no cover - exercised only without ijson
+    ijson = None
+    ObjectBuilder = None
+
+from src.integration.codecs import transfer_stats
+
+
+class _CountingReader:
+    def __init__(self, raw: Any) -> None:
+        self._raw = raw
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._raw.read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+class DecodedPage:
+    """Already decoded OFDA page exposing the same API as StreamedPage."""
+
+    def __init__(self, document: Any, data_key: str = "items") -> None:
+        self._document = document
+        self._data_key = data_key
+        self.is_paginated = isinstance(document, dict) and data_key in document
+        self.has_next = self.is_paginated and bool(
+            document.get("has_next", False)
+        )
+
+    def __iter__(self) -> Iterator[Any]:
+        if self.is_paginated:
+            yield from self._document[self._data_key]
+        else:
+            yield self._document
+
+
+class StreamedPage:
+    """Incrementally decoded OFDA page.
+
+    Iterating yields the entries of ``data_key`` one by one while the body
+    is read from the socket, so the full page dict never exists in memory.
+    ``has_next`` is known once iteration finishes and, when ``label`` is
+    given, the page is counted in the transfer stats under that route
+    label. When the body has no ``data_key`` the whole document is yielded
+    as a single item, matching the non-paginated behaviour of
+    ``response.json()``.
+    """
+
+    def __init__(
+        self,
+        response: Any,
+        data_key: str = "items",
+        label: str | None = None,
+    ) -> None:
+        self._response = response
+        self._data_key = data_key
+        self._label = label
+        self.has_next = False
+        self.is_paginated = False
+
+    def __iter__(self) -> Iterator[Any]:
+        try:
+            if ijson is None:
+                yield from self._iter_buffered()
+            else:
+                yield from self._iter_streamed()
+        finally:
+            self._response.close()
+
+    def _iter_streamed(self) -> Iterator[Any]:
+        raw = self._response.raw
+        raw.decode_content = True
+        reader = _CountingReader(raw)
+        item_prefix = f"{self._data_key}.item"
+        item_builder = None
+        rest_builder = ObjectBuilder()
+
+        for prefix, event, value in ijson.parse(reader, use_float=True):
+            if item_builder is not None:
+                item_builder.event(event, value)
+                if prefix == item_prefix and event in ("end_map", "end_array"):
+                    yield item_builder.value
+                    item_builder = None
+                continue
+
+            if prefix == item_prefix:
+                if event in ("start_map", "start_array"):
+                    item_builder = ObjectBuilder()
+                    item_builder.event(event, value)
+                else:
+                    yield value
+            elif prefix == self._data_key:
+                self.is_paginated = True
+            else:
+                rest_builder.event(event, value)
+
+        wire_bytes = raw.tell() if hasattr(raw, "tell") else None
+        if self._label and isinstance(wire_bytes, int):
+            transfer_stats.record(self._label, wire_bytes, reader.bytes_read)
+
+        rest = getattr(rest_builder, "value", None)
+        if not self.is_paginated:
+            yield rest
+        elif isinstance(rest, dict):
+            self.has_next = bool(rest.get("has_next", False))
+
+    def _iter_buffered(self) -> Iterator[Any]:
+        page = DecodedPage(json.loads(self._response.content), self._data_key)
+        self.is_paginated = page.is_paginated
+        self.has_next = page.has_next
+        yield from page
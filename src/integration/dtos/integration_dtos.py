@@ -1,6 +1,19 @@
+import json
 from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any
 
 from requests import PreparedRequest, Response
+from requests.structures import CaseInsensitiveDict
+
+RESULT_HEADERS = (
+    "Content-Type",
+    "Content-Length",
+    "ETag",
+    "Last-Modified",
+    "Retry-After",
+    "Date",
+)
 
 
 @dataclass
@@ -9,3 +22,118 @@ class IntegrationResultDTO:
     request: PreparedRequest | None = None
     response: Response | None = None
     additional_data: dict = field(default_factory=dict)
+
+
+class CompactIntegrationResultDTO:
+    """Integration result that keeps the decoded body instead of the response.
+
+    The connection and the raw buffers are released as soon as the result is
+    built. ``response`` gives the fields callers read from the HTTP response
+    (``json()``, ``ok``, ``status_code``, ``headers``...) on top of the
+    stored values. A body that is not JSON is kept as bytes, so ``json()``
+    raises exactly like it would on the response.
+    """
+
+    __slots__ = (
+        "success",
+        "status_code",
+        "reason",
+        "url",
+        "elapsed_seconds",
+        "headers",
+        "body",
+        "content",
+        "additional_data",
+    )
+
+    def __init__(
+        self,
+        success: bool,
+        status_code: int,
+        reason: str = "",
+        url: str = "",
+        elapsed_seconds: float = 0.0,
+        headers: dict[str, str] | None = None,
+        body: Any = None,
+        content: bytes | None = None,
+        additional_data: dict | None = None,
+    ) -> None:
+        self.success = success
+        self.status_code = status_code
+        self.reason = reason
+        self.url = url
+        self.elapsed_seconds = elapsed_seconds
+        self.headers = headers or {}
+        self.body = body
+        self.content = content
+        self.additional_data = additional_data or {}
+
+    @classmethod
+    def from_result(
+        cls, result: IntegrationResultDTO
+    ) -> "CompactIntegrationResultDTO":
+        response = result.response
+        body = None
+        content = None
+        try:
+            body = response.json()
+        except ValueError:
+            content = response.content
+        headers = {
+            name: response.headers[name]
+            for name in RESULT_HEADERS
+            if name in response.headers
+        }
+        compact = cls(
+            success=result.success,
+            status_code=response.status_code,
+            reason=response.reason or "",
+            url=str(response.url),
+            elapsed_seconds=response.elapsed.total_seconds(),
+            headers=headers,
+            body=body,
+            content=content,
+            additional_data=result.additional_data,
+        )
+        response.close()
+        return compact
+
+    @property
+    def response(self) -> "CompactResponse":
+        return CompactResponse(self)
+
+
+class CompactResponse:
+    __slots__ = ("_result",)
+
+    def __init__(self, result: CompactIntegrationResultDTO) -> None:
+        self._result = result
+
+    @property
+    def status_code(self) -> int:
+        return self._result.status_code
+
+    @property
+    def ok(self) -> bool:
+        return self._result.status_code < 400
+
+    @property
+    def reason(self) -> str:
+        return self._result.reason
+
+    @property
+    def url(self) -> str:
+        return self._result.url
+
+    @property
+    def elapsed(self) -> timedelta:
+        return timedelta(seconds=self._result.elapsed_seconds)
+
+    @property
+    def headers(self) -> CaseInsensitiveDict:
+        return CaseInsensitiveDict(self._result.headers)
+
+    def json(self) -> Any:
+        if self._result.content is not None:
+            return json.loads(self._result.content)
+        return self._result.body
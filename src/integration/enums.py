@@ -7,3 +7,8 @@ class RouteMethod(StrEnum):
     PUT = "PUT"
     DELETE = "DELETE"
     LIST = "LIST"
+
+
+class PaginationStyle(StrEnum):
+    NONE = "none"
+    PAGE = "page"
@@ -0,0 +1,139 @@
+import dataclasses
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from django.conf import settings
+
+from src.core.utils.mapping import parse_mapping
+from src.core.utils.retry import RetryPolicy
+from src.integration.enums import PaginationStyle
+
+
+def _optional_float(value: str) -> float | None:
+    return None if value.lower() in ("", "none", "default") else float(value)
+
+
+def _optional_int(value: str) -> int | None:
+    return None if value.lower() in ("", "none", "default") else int(value)
+
+
+def _bool(value: str) -> bool:
+    if value.lower() in ("1", "true", "yes", "on"):
+        return True
+    if value.lower() in ("0", "false", "no", "off"):
+        return False
+    raise ValueError(f"Invalid boolean {value!r}")
+
+
+@dataclass(frozen=True)
+class RoutePolicy:
+    """How the integration layer calls one OFDA route.
+
+    ``timeout`` and ``cache_ttl`` default (None) to ``OFDA_API_TIMEOUT``
+    and ``OFDA_CONDITIONAL_GET_TTL``; a ``cache_ttl`` of 0 turns the
+    validator cache off for the route. ``page_size`` pins the ``limit``
+    of paginated routes, which is adapted by ``PageSizeService`` when
+    None.
+    """
+
+    traffic_class: str = "default"
+    timeout: float | None = None
+    max_retries: int = 3
+    retry_base_delay: float = 1.0
+    retry_max_delay: float = 8.0
+    cache_ttl: int | None = None
+    hedge: bool = False
+    pagination: PaginationStyle = PaginationStyle.NONE
+    page_size: int | None = None
+
+    def retry_policy(self) -> RetryPolicy:
+        return RetryPolicy(
+            max_retries=self.max_retries,
+            base_delay=self.retry_base_delay,
+            max_delay=self.retry_max_delay,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        return dataclasses.asdict(self)
+
+
+FIELD_PARSERS: dict[str, Callable[[str], Any]] = {
+    "traffic_class": str,
+    "timeout": _optional_float,
+    "max_retries": int,
+    "retry_base_delay": float,
+    "retry_max_delay": float,
+    "cache_ttl": _optional_int,
+    "hedge": _bool,
+    "pagination": PaginationStyle,
+    "page_size": _optional_int,
+}
+
+DEFAULT_POLICY = RoutePolicy()
+
+
+class RoutePolicyRegistry:
+    """Policies of the OFDA routes, by route class name.
+
+    Each route declares its policy once, as the ``policy`` attribute of
+    its class, and ``OFDA_ROUTE_POLICIES`` overrides single fields with
+    ``Route.field=value`` entries, e.g. ``TransactionsRoute.timeout=60``,
+    so an endpoint is tuned without a code change. Routes that declare
+    nothing get ``DEFAULT_POLICY``.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._declared: dict[str, RoutePolicy] = {}
+        self._resolved: dict[str, RoutePolicy] = {}
+        self._overrides_source: tuple[str, ...] | None = None
+
+    def register(self, route_name: str, policy: RoutePolicy) -> None:
+        with self._lock:
+            self._declared[route_name] = policy
+            self._resolved.clear()
+
+    def get(self, route_name: str) -> RoutePolicy:
+        """Active policy of ``route_name``, overrides applied."""
+        source = tuple(getattr(settings, "OFDA_ROUTE_POLICIES", []))
+        with self._lock:
+            if source != self._overrides_source:
+                self._resolved.clear()
+                self._overrides_source = source
+            policy = self._resolved.get(route_name)
+        if policy is None:
+            policy = self._resolve(route_name, source)
+            with self._lock:
+                self._resolved[route_name] = policy
+        return policy
+
+    def for_route(self, route: Any) -> RoutePolicy:
+        return self.get(route.__class__.__name__)
+
+    def table(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            names = sorted(self._declared)
+        return {name: self.get(name).as_dict() for name in names}
+
+    def _resolve(
+        self, route_name: str, source: tuple[str, ...]
+    ) -> RoutePolicy:
+        with self._lock:
+            policy = self._declared.get(route_name, DEFAULT_POLICY)
+        changes = {}
+        for key, value in parse_mapping(source, str).items():
+            name, _, field_name = key.partition(".")
+            if name != route_name:
+                continue
+            if field_name not in FIELD_PARSERS:
+                raise ValueError(
+                    f"Unknown route policy field {field_name!r} in "
+                    f"OFDA_ROUTE_POLICIES entry {key!r}"
+                )
+            changes[field_name] = FIELD_PARSERS[field_name](value)
+        return dataclasses.replace(policy, **changes) if changes else policy
+
+
+route_policies = RoutePolicyRegistry()
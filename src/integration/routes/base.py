@@ -1,22 +1,57 @@
 from typing import Any
 
-import requests
+from django.conf import settings
 from requests import HTTPError, Response
 from requests.exceptions import ConnectionError as RequestsConnectionError
 from requests.exceptions import RequestException, Timeout
 
-from src.config.logging import logger
+from src.config.logging import hot_path_logger, logger
+from src.core.utils.deadline import current_deadline
+from src.integration.codecs import get_accept_encoding, transfer_stats
 from src.integration.dtos.integration_dtos import IntegrationResultDTO
 from src.integration.enums import RouteMethod
+from src.integration.policies import RoutePolicy, route_policies
+from src.integration.services.bulkhead_service import bulkheads
+from src.integration.services.circuit_breaker_service import circuit_breaker
+from src.integration.services.connection_pool_service import connection_pool
+from src.integration.services.cooldown_service import cooldowns
+from src.integration.services.hedging_service import hedging
+from src.integration.services.load_balancer_service import load_balancer
+from src.integration.services.validator_cache_service import validator_cache
 
 
 class BaseRoute:
+    # Timeouts, retries, caching, bulkhead and hedging of the route, see
+    # RoutePolicyRegistry.
+    policy: RoutePolicy = RoutePolicy()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "policy" in cls.__dict__:
+            route_policies.register(cls.__name__, cls.policy)
+
     def __init__(self) -> None:
         self.method: RouteMethod | None = None
+        self.stream_response: bool = False
+        # OFDA base URL of the current attempt, set by the router.
+        self.endpoint: str | None = None
+
+    def get_policy(self) -> RoutePolicy:
+        return route_policies.for_route(self)
+
+    @property
+    def traffic_class(self) -> str:
+        # Bulkhead this route's calls are limited by and pooled in.
+        return self.get_policy().traffic_class
 
     def get_base_url(self) -> str | None:
         raise NotImplementedError("get_base_url_not_implemented")
 
+    def get_endpoint(self) -> str:
+        if self.endpoint is None:
+            self.endpoint = load_balancer.choose()
+        return self.endpoint
+
     def get_resource_path(self) -> str:
         raise NotImplementedError("get_resource_path_not_implemented")
 
@@ -48,38 +83,167 @@ class BaseRoute:
             success=success, request=response.request, response=response
         )
 
+    def build_request(self, method: RouteMethod) -> tuple[str, dict | None]:
+        if method in (RouteMethod.GET, RouteMethod.POST):
+            url = f"{self.get_base_url()}{self.get_resource_path()}"
+        else:
+            url = f"{self.get_base_url()}{self.get_data_resource_path()}"
+        payload = (
+            self.get_payload()
+            if method in (RouteMethod.POST, RouteMethod.PUT)
+            else None
+        )
+        return url, payload
+
+    def build_headers(self) -> dict[str, str]:
+        authorization_header = self.get_authorization_header() or {}
+        return {
+            "content-Type": "application/json",
+            "Accept-Encoding": get_accept_encoding(),
+        } | authorization_header
+
+    def get_timeout(self) -> float:
+        timeout = self.get_policy().timeout
+        if timeout is None:
+            timeout = getattr(settings, "OFDA_API_TIMEOUT", 30)
+        deadline = current_deadline()
+        if deadline is None:
+            return timeout
+        return deadline.timeout(cap=timeout)
+
+    def uses_validator_cache(self) -> bool:
+        return (
+            validator_cache.enabled
+            and not self.stream_response
+            and self.get_policy().cache_ttl != 0
+        )
+
+    def endpoint_available(self, endpoint: str) -> bool:
+        """Whether a call to ``endpoint`` would go through right now.
+
+        It would not while the endpoint's circuit is open or while it has
+        asked us to back off.
+        """
+        if circuit_breaker.is_open(self, endpoint):
+            return False
+        return not cooldowns.remaining(self, endpoint)
+
+    def hedge_endpoint(self) -> str | None:
+        """Another available endpoint than this call's, if there is one."""
+        endpoint = self.endpoint
+        if endpoint is None:
+            return None
+        other = load_balancer.choose(
+            lambda candidate: (
+                candidate != endpoint and self.endpoint_available(candidate)
+            )
+        )
+        if other == endpoint or not self.endpoint_available(other):
+            return None
+        return other
+
+    def hedge(
+        self, url: str, extra_headers: dict[str, str] | None = None
+    ) -> Response:
+        # GETs are idempotent, so a slow one may be hedged when the route
+        # policy allows it.
+        def call() -> Response:
+            return self.execute_request(
+                RouteMethod.GET, url, extra_headers=extra_headers
+            )
+
+        if not self.get_policy().hedge:
+            return call()
+
+        endpoint = self.endpoint
+        hedges: list[tuple[str | None, Response]] = []
+
+        def hedge_call() -> Response:
+            # The hedge is a call of its own: it goes to another endpoint
+            # when one is available, takes another bulkhead slot than the
+            # slow call holds, and its outcome counts for its endpoint.
+            hedge_endpoint = self.hedge_endpoint() or endpoint
+            hedge_url = url
+            if hedge_endpoint != endpoint and url.startswith(endpoint):
+                hedge_url = hedge_endpoint + url[len(endpoint) :]
+            with (
+                circuit_breaker.guard(self, hedge_endpoint),
+                cooldowns.guard(self, hedge_endpoint),
+                bulkheads.for_route(self).slot(),
+            ):
+                response = self.execute_request(
+                    RouteMethod.GET, hedge_url, extra_headers=extra_headers
+                )
+            hedges.append((hedge_endpoint, response))
+            return response
+
+        response = hedging.run(self, call, hedge_call)
+        for hedge_endpoint, hedge_response in hedges:
+            if hedge_response is response:
+                # The hedge answered: the call is credited to its endpoint.
+                self.endpoint = hedge_endpoint
+        return response
+
     def execute_get(self) -> Response:
-        url = f"{self.get_base_url()}{self.get_resource_path()}"
-        return self.execute_request(RouteMethod.GET, url)
+        url, _ = self.build_request(RouteMethod.GET)
+        if not self.uses_validator_cache():
+            return self.hedge(url)
+
+        authorization = self.build_headers().get("Authorization")
+        conditional_headers, entry = validator_cache.conditional_headers(
+            url, authorization
+        )
+        response = self.hedge(url, conditional_headers)
+        return validator_cache.resolve(
+            url, authorization, response, entry, self.get_policy().cache_ttl
+        )
 
     def execute_post(self) -> Response:
-        url = f"{self.get_base_url()}{self.get_resource_path()}"
-        return self.execute_request(RouteMethod.POST, url, self.get_payload())
+        return self.execute_request(
+            RouteMethod.POST, *self.build_request(RouteMethod.POST)
+        )
 
     def execute_put(self) -> Response:
-        url = f"{self.get_base_url()}{self.get_data_resource_path()}"
-        return self.execute_request(RouteMethod.PUT, url, self.get_payload())
+        return self.execute_request(
+            RouteMethod.PUT, *self.build_request(RouteMethod.PUT)
+        )
 
     def execute_delete(self) -> Response:
-        url = f"{self.get_base_url()}{self.get_data_resource_path()}"
-        return self.execute_request(RouteMethod.DELETE, url)
+        return self.execute_request(
+            RouteMethod.DELETE, *self.build_request(RouteMethod.DELETE)
+        )
 
     def execute_request(
-        self, method: RouteMethod, url: str, payload: dict | None = None
+        self,
+        method: RouteMethod,
+        url: str,
+        payload: dict | None = None,
+        extra_headers: dict[str, str] | None = None,
     ) -> Response:
-        authorization_header = self.get_authorization_header() or {}
-        headers = {"content-Type": "application/json"} | authorization_header
+        headers = self.build_headers() | (extra_headers or {})
+        timeout = self.get_timeout()
         try:
-            request_function = getattr(requests, method.value.lower())
-            logger.info(
-                f"Executing Request - URL:{url}, Method:{method}, Payload:{payload}, "
-            )
-            response = request_function(
-                url=url,
-                headers=headers,
-                json=payload,
+            session = connection_pool.get_session(url, self.traffic_class)
+            request_function = getattr(session, method.value.lower())
+            hot_path_logger.info(
+                "Executing Request - URL:%s, Method:%s, Payload:%s",
+                url,
+                method,
+                payload,
             )
-            response.raise_for_status()
+            with load_balancer.track(url):
+                response = request_function(
+                    url=url,
+                    headers=headers,
+                    json=payload,
+                    timeout=timeout,
+                    stream=self.stream_response,
+                )
+                if not self.stream_response:
+                    transfer_stats.record_response(
+                        self.__class__.__name__, response
+                    )
+                response.raise_for_status()
             return response
         except HTTPError:
             logger.error(
@@ -0,0 +1,77 @@
+import threading
+from typing import Any
+
+from django.conf import settings
+
+from src.core.utils.mapping import parse_mapping
+from src.integration.services.concurrency_limiter_service import (
+    ConcurrencyLimiterService,
+)
+
+DEFAULT_TRAFFIC_CLASS = "default"
+
+
+class BulkheadService:
+    """One adaptive concurrency limit per OFDA traffic class.
+
+    Routes declare a ``traffic_class`` (client, consent, accounts,
+    balances, transactions). Each class gets its own in-flight limit,
+    capped by ``OFDA_BULKHEAD_LIMITS``, and its own queue timeout from
+    ``OFDA_BULKHEAD_QUEUE_TIMEOUTS``, so thousands of transaction pages
+    queue behind each other and never behind, or in front of, the client
+    and consent setup of other users. Each class also gets its own
+    connection pool of the same size.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._limiters: dict[str, ConcurrencyLimiterService] = {}
+
+    @property
+    def limits(self) -> dict[str, int]:
+        return parse_mapping(
+            getattr(settings, "OFDA_BULKHEAD_LIMITS", []), int
+        )
+
+    @property
+    def queue_timeouts(self) -> dict[str, float]:
+        return parse_mapping(
+            getattr(settings, "OFDA_BULKHEAD_QUEUE_TIMEOUTS", [])
+        )
+
+    @property
+    def capacity(self) -> int:
+        """Most OFDA calls the bulkheads let a worker have in flight."""
+        # Classes without a limit of their own share the default one.
+        return sum(self.limits.values()) + getattr(
+            settings, "OFDA_CONCURRENCY_MAX_LIMIT", 100
+        )
+
+    def max_concurrency(self, traffic_class: str) -> int | None:
+        return self.limits.get(traffic_class)
+
+    def for_route(self, route: Any) -> ConcurrencyLimiterService:
+        return self.get(getattr(route, "traffic_class", DEFAULT_TRAFFIC_CLASS))
+
+    def get(self, traffic_class: str) -> ConcurrencyLimiterService:
+        with self._lock:
+            limiter = self._limiters.get(traffic_class)
+            if limiter is None:
+                limiter = ConcurrencyLimiterService(
+                    name=traffic_class,
+                    max_limit=self.max_concurrency(traffic_class),
+                    queue_timeout=self.queue_timeouts.get(traffic_class),
+                )
+                self._limiters[traffic_class] = limiter
+            return limiter
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            limiters = dict(self._limiters)
+        return {
+            traffic_class: limiter.stats()
+            for traffic_class, limiter in sorted(limiters.items())
+        }
+
+
+bulkheads = BulkheadService()
@@ -0,0 +1,287 @@
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from enum import StrEnum
+from typing import Any
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.cache import cache
+
+from src.config.logging import logger
+from src.core.utils.retry import is_retryable
+
+# How long a worker trusts its last look at a shared circuit, so calls do
+# not each pay a cache round trip.
+REFRESH_INTERVAL = 0.25
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, circuit: str, retry_after: float) -> None:
+        super().__init__(
+            f"Circuit {circuit} is open, retry in {retry_after:.0f}s"
+        )
+        self.circuit = circuit
+        self.retry_after = retry_after
+
+
+class CircuitBreakerService:
+    """Circuit breaker per route class and OFDA host, shared through the cache.
+
+    State lives in the Django cache (Redis in deployments), so failures
+    seen by one worker open the circuit for every worker and node:
+
+    - closed: calls go through; retryable failures (5xx, timeouts,
+      connection errors) are counted in a sliding window and
+      ``OFDA_CIRCUIT_FAILURE_THRESHOLD`` of them open the circuit.
+    - open: calls fail at once with ``CircuitOpenError`` for
+      ``OFDA_CIRCUIT_OPEN_SECONDS``.
+    - half-open: one probe call at a time is let through; success closes
+      the circuit and failure opens it again.
+
+    Each worker reuses the state it last read for ``REFRESH_INTERVAL``
+    seconds, so a state change reaches the other workers that much later.
+    """
+
+    key_prefix = "ofda_circuit"
+
+    def __init__(self) -> None:
+        self.logger = logger
+        self._lock = threading.Lock()
+        self._known_circuits: set[str] = set()
+        # circuit -> (tripped, open until as a timestamp, when it was read)
+        self._known_states: dict[str, tuple[bool, float | None, float]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return getattr(settings, "OFDA_CIRCUIT_BREAKER", True)
+
+    @property
+    def failure_threshold(self) -> int:
+        return getattr(settings, "OFDA_CIRCUIT_FAILURE_THRESHOLD", 5)
+
+    @property
+    def failure_window(self) -> int:
+        return getattr(settings, "OFDA_CIRCUIT_FAILURE_WINDOW", 30)
+
+    @property
+    def open_seconds(self) -> int:
+        return getattr(settings, "OFDA_CIRCUIT_OPEN_SECONDS", 30)
+
+    def circuit_name(self, route: Any, base_url: str | None = None) -> str:
+        parts = urlsplit(str(base_url or route.get_base_url() or ""))
+        return f"{route.__class__.__name__}@{parts.netloc}"
+
+    def is_open(self, route: Any, base_url: str | None = None) -> bool:
+        """Whether calls to ``route`` at ``base_url`` would be rejected."""
+        if not self.enabled:
+            return False
+        state, _ = self._read_state(self.circuit_name(route, base_url))
+        return state == CircuitState.OPEN
+
+    def before_call(
+        self, route: Any, base_url: str | None = None
+    ) -> tuple[str | None, CircuitState]:
+        """Raise ``CircuitOpenError`` unless the call may go through.
+
+        Returns the circuit of the route and the state the call was let
+        through in, to be handed back to ``record_success`` or
+        ``record_failure``.
+        """
+        if not self.enabled:
+            return None, CircuitState.CLOSED
+        circuit = self.circuit_name(route, base_url)
+        self._register(circuit)
+        state, opened_until = self._read_state(circuit)
+        if state == CircuitState.OPEN:
+            raise CircuitOpenError(circuit, opened_until - time.time())
+        if state == CircuitState.HALF_OPEN and not self._cache_call(
+            "add", self._key(circuit, "probe"), 1, self.open_seconds
+        ):
+            raise CircuitOpenError(circuit, self.open_seconds)
+        return circuit, state
+
+    @contextmanager
+    def guard(self, route: Any, base_url: str | None = None) -> Iterator[None]:
+        """Run one call to ``route`` through its circuit.
+
+        When the route ends up answered by another endpoint (a hedge won),
+        the outcome of the call itself is unknown: it neither closes nor
+        opens the circuit.
+        """
+        circuit, state = self.before_call(route, base_url)
+        try:
+            yield
+        except Exception as e:
+            self.record_failure(circuit, state, e)
+            raise
+        if circuit is not None and circuit != self.circuit_name(
+            route, base_url
+        ):
+            self.release_probe(circuit, state)
+            return
+        self.record_success(circuit, state)
+
+    def record_success(self, circuit: str | None, state: CircuitState) -> None:
+        if circuit is None or state == CircuitState.CLOSED:
+            return
+        self.logger.info("Circuit %s closed after a probe call", circuit)
+        self._remember(circuit, False, None)
+        self._cache_call(
+            "delete_many",
+            [
+                self._key(circuit, "tripped"),
+                self._key(circuit, "open_until"),
+                self._key(circuit, "probe"),
+                self._key(circuit, "failures"),
+            ],
+        )
+
+    def record_failure(
+        self, circuit: str | None, state: CircuitState, exc: BaseException
+    ) -> None:
+        if circuit is None:
+            return
+        if not is_retryable(exc):
+            # A client error or a deadline says nothing about the host, so
+            # the probe is handed to the next call.
+            self.release_probe(circuit, state)
+            return
+        if state == CircuitState.HALF_OPEN:
+            self._open(circuit, f"probe failed: {exc}")
+            return
+
+        failures_key = self._key(circuit, "failures")
+        self._cache_call("add", failures_key, 0, self.failure_window)
+        failures = self._cache_call("incr", failures_key) or 0
+        if failures >= self.failure_threshold:
+            self._open(circuit, f"{failures} failures, last: {exc}")
+
+    def release_probe(self, circuit: str | None, state: CircuitState) -> None:
+        """End a call that neither closes nor opens its circuit."""
+        if circuit is not None and state == CircuitState.HALF_OPEN:
+            self._cache_call("delete", self._key(circuit, "probe"))
+
+    def states(self) -> dict[str, dict[str, Any]]:
+        circuits = set(self._cache_call("get", self._names_key()) or ())
+        with self._lock:
+            circuits |= self._known_circuits
+
+        states = {}
+        for circuit in sorted(circuits):
+            state, opened_until = self._read_state(circuit, refresh=True)
+            states[circuit] = {
+                "state": state.value,
+                "failures": self._cache_call(
+                    "get", self._key(circuit, "failures")
+                )
+                or 0,
+                "retry_after": max(round(opened_until - time.time()), 0)
+                if state == CircuitState.OPEN
+                else None,
+            }
+        return states
+
+    def _open(self, circuit: str, reason: str) -> None:
+        opened_until = time.time() + self.open_seconds
+        self.logger.warning(
+            "Circuit %s opened for %ss: %s", circuit, self.open_seconds, reason
+        )
+        self._remember(circuit, True, opened_until)
+        self._cache_call(
+            "set",
+            self._key(circuit, "open_until"),
+            opened_until,
+            self.open_seconds,
+        )
+        # Outlives open_until, so the next call after the open period is
+        # let through as a single probe instead of closing the circuit.
+        self._cache_call(
+            "set",
+            self._key(circuit, "tripped"),
+            opened_until,
+            self.open_seconds * 10,
+        )
+        self._cache_call(
+            "delete_many",
+            [self._key(circuit, "probe"), self._key(circuit, "failures")],
+        )
+
+    def _read_state(
+        self, circuit: str, refresh: bool = False
+    ) -> tuple[CircuitState, float]:
+        now = time.monotonic()
+        with self._lock:
+            tripped, opened_until, read_at = self._known_states.get(
+                circuit, (False, None, -REFRESH_INTERVAL)
+            )
+        if refresh or now - read_at >= REFRESH_INTERVAL:
+            values = (
+                self._cache_call(
+                    "get_many",
+                    [
+                        self._key(circuit, "tripped"),
+                        self._key(circuit, "open_until"),
+                    ],
+                )
+                or {}
+            )
+            tripped = self._key(circuit, "tripped") in values
+            opened_until = values.get(self._key(circuit, "open_until"))
+            self._remember(circuit, tripped, opened_until, now)
+        if not tripped:
+            return CircuitState.CLOSED, 0.0
+        if opened_until is not None and opened_until > time.time():
+            return CircuitState.OPEN, opened_until
+        return CircuitState.HALF_OPEN, 0.0
+
+    def _remember(
+        self,
+        circuit: str,
+        tripped: bool,
+        opened_until: float | None,
+        read_at: float | None = None,
+    ) -> None:
+        with self._lock:
+            self._known_states[circuit] = (
+                tripped,
+                opened_until,
+                time.monotonic() if read_at is None else read_at,
+            )
+
+    def _register(self, circuit: str) -> None:
+        with self._lock:
+            if circuit in self._known_circuits:
+                return
+            self._known_circuits.add(circuit)
+            known = set(self._known_circuits)
+        names = set(self._cache_call("get", self._names_key()) or ())
+        if not known <= names:
+            self._cache_call("set", self._names_key(), names | known, None)
+
+    def _cache_call(self, operation: str, *args: Any) -> Any:
+        # The breaker must never take down the calls it protects: a cache
+        # outage leaves every circuit closed.
+        try:
+            return getattr(cache, operation)(*args)
+        except Exception as e:
+            self.logger.debug(
+                "Circuit breaker cache %s failed: %s", operation, e
+            )
+            return None
+
+    def _key(self, circuit: str, field: str) -> str:
+        return f"{self.key_prefix}:{circuit}:{field}"
+
+    def _names_key(self) -> str:
+        return f"{self.key_prefix}:names"
+
+
+circuit_breaker = CircuitBreakerService()
@@ -0,0 +1,187 @@
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from django.conf import settings
+
+from src.config.logging import logger
+from src.core.utils.deadline import current_deadline
+from src.core.utils.retry import is_retryable
+
+LATENCY_WINDOW = 100
+MIN_SAMPLES = 10
+BACKOFF_FACTOR = 0.9
+
+
+class BulkheadFullError(Exception):
+    pass
+
+
+class ConcurrencyLimiterService:
+    """Adaptive limit on the OFDA requests a worker has in flight (AIMD).
+
+    The limit grows by one every ``limit`` calls that answer close to the
+    best latency seen over the last calls while the limit is actually in
+    use, and is cut by 10% when a call fails with a retryable error (5xx,
+    429, timeouts, connection errors) or takes longer than
+    ``OFDA_CONCURRENCY_LATENCY_TOLERANCE`` times that latency. Cuts happen
+    at most once per round trip, so a burst of failures from the same
+    overload counts once. Calls over the limit wait for a free slot, up to
+    the request deadline or ``queue_timeout``, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        name: str = "default",
+        max_limit: int | None = None,
+        queue_timeout: float | None = None,
+    ) -> None:
+        self.logger = logger
+        self.name = name
+        self.queue_timeout = queue_timeout
+        self._max_limit = max_limit
+        self._condition = threading.Condition()
+        self._limit = float(
+            min(
+                getattr(settings, "OFDA_CONCURRENCY_INITIAL_LIMIT", 20),
+                self.max_limit,
+            )
+        )
+        self._in_flight = 0
+        self._latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._last_decrease = 0.0
+        self._stats = {
+            "calls": 0,
+            "queued": 0,
+            "rejected": 0,
+            "increases": 0,
+            "decreases": 0,
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return getattr(settings, "OFDA_ADAPTIVE_CONCURRENCY", True)
+
+    @property
+    def min_limit(self) -> int:
+        return max(getattr(settings, "OFDA_CONCURRENCY_MIN_LIMIT", 1), 1)
+
+    @property
+    def max_limit(self) -> int:
+        if self._max_limit is not None:
+            return self._max_limit
+        return getattr(settings, "OFDA_CONCURRENCY_MAX_LIMIT", 100)
+
+    @property
+    def latency_tolerance(self) -> float:
+        return getattr(settings, "OFDA_CONCURRENCY_LATENCY_TOLERANCE", 2.0)
+
+    @property
+    def limit(self) -> int:
+        """Current number of OFDA calls the worker may have in flight."""
+        with self._condition:
+            return int(self._limit)
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold one in-flight slot for the duration of an OFDA call."""
+        if not self.enabled:
+            yield
+            return
+        with self._condition:
+            if not self._has_room():
+                self._stats["queued"] += 1
+                started = time.monotonic()
+                while not self._has_room():
+                    self._condition.wait(self._wait_timeout(started))
+            self._in_flight += 1
+        with self._measure():
+            yield
+
+    def stats(self) -> dict[str, Any]:
+        with self._condition:
+            min_latency = min(self._latencies) if self._latencies else None
+            return {
+                "enabled": self.enabled,
+                "limit": int(self._limit),
+                "max_limit": self.max_limit,
+                "in_flight": self._in_flight,
+                "min_latency_ms": round(min_latency * 1000, 1)
+                if min_latency is not None
+                else None,
+                **self._stats,
+            }
+
+    def _has_room(self) -> bool:
+        return self._in_flight < int(self._limit)
+
+    def _wait_timeout(self, started: float) -> float:
+        timeout = 1.0
+        if self.queue_timeout is not None:
+            timeout = self.queue_timeout - (time.monotonic() - started)
+            if timeout <= 0:
+                with self._condition:
+                    self._stats["rejected"] += 1
+                raise BulkheadFullError(
+                    f"No free {self.name} OFDA slot within "
+                    f"{self.queue_timeout}s"
+                )
+        deadline = current_deadline()
+        if deadline is None:
+            return timeout
+        deadline.check()
+        return min(deadline.remaining(), timeout)
+
+    @contextmanager
+    def _measure(self) -> Iterator[None]:
+        started = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            self._release(
+                time.monotonic() - started, overloaded=is_retryable(e)
+            )
+            raise
+        self._release(time.monotonic() - started, overloaded=False)
+
+    def _release(self, latency: float, overloaded: bool) -> None:
+        with self._condition:
+            in_use = self._in_flight >= self._limit / 2
+            self._in_flight -= 1
+            self._stats["calls"] += 1
+            if not overloaded:
+                self._latencies.append(latency)
+            slow = (
+                len(self._latencies) >= MIN_SAMPLES
+                and latency > min(self._latencies) * self.latency_tolerance
+            )
+            now = time.monotonic()
+            round_trip = max(latency, min(self._latencies, default=0.0))
+            if overloaded or slow:
+                if now - self._last_decrease >= round_trip:
+                    self._decrease(now, "errors" if overloaded else "latency")
+            elif in_use and self._limit < self.max_limit:
+                previous = int(self._limit)
+                self._limit = min(
+                    self._limit + 1 / self._limit, self.max_limit
+                )
+                if int(self._limit) != previous:
+                    self._stats["increases"] += 1
+            self._condition.notify_all()
+
+    def _decrease(self, now: float, reason: str) -> None:
+        previous = int(self._limit)
+        self._limit = max(self._limit * BACKOFF_FACTOR, self.min_limit)
+        self._last_decrease = now
+        self._stats["decreases"] += 1
+        if int(self._limit) != previous:
+            self.logger.warning(
+                "OFDA %s concurrency limit lowered from %s to %s (%s)",
+                self.name,
+                previous,
+                int(self._limit),
+                reason,
+            )
@@ -0,0 +1,171 @@
+import os
+import threading
+from typing import Any
+from urllib.parse import urlsplit
+
+import requests
+import urllib3
+from django.conf import settings
+
+from src.config.logging import logger
+from src.integration.codecs import CodecHTTPAdapter
+from src.integration.services.bulkhead_service import (
+    DEFAULT_TRAFFIC_CLASS,
+    bulkheads,
+)
+
+
+class ConnectionPoolService:
+    """Process-wide registry of keep-alive sessions, one per OFDA host.
+
+    Routes of a bulkhead traffic class get a session of their own, sized
+    to the concurrency limit of the class, so heavy data fetching cannot
+    take the connections that client and consent setup need.
+    """
+
+    def __init__(self) -> None:
+        self.logger = logger
+        self._lock = threading.Lock()
+        self._sessions: dict[str, requests.Session] = {}
+        self._pid = os.getpid()
+
+    @property
+    def pool_maxsize(self) -> int:
+        return getattr(settings, "OFDA_HTTP_POOL_MAXSIZE", 10)
+
+    @property
+    def pool_block(self) -> bool:
+        return getattr(settings, "OFDA_HTTP_POOL_BLOCK", False)
+
+    def get_session(
+        self, url: str, traffic_class: str | None = None
+    ) -> requests.Session:
+        pool_key = self._pool_key(url, traffic_class)
+        with self._lock:
+            self._reset_after_fork()
+            session = self._sessions.get(pool_key)
+            if session is None:
+                pool_maxsize = self._pool_maxsize_for(traffic_class)
+                session = self._create_session(pool_maxsize)
+                self._sessions[pool_key] = session
+                self.logger.debug(
+                    "Created pooled session for %s (maxsize=%s)",
+                    pool_key,
+                    pool_maxsize,
+                )
+            return session
+
+    def prewarm(
+        self, url: str, connections: int, traffic_class: str | None = None
+    ) -> int:
+        """Open up to ``connections`` keep-alive connections to ``url``.
+
+        The connections are parked in the session pool that real requests
+        draw from, so DNS, TCP and TLS setup happen before the first call.
+        """
+        session = self.get_session(url, traffic_class)
+        adapter = session.get_adapter(url)
+        # Resolve verify/proxies the way a request would, so the
+        # connections land in the pool that requests will draw from.
+        options = session.merge_environment_settings(
+            url, {}, None, session.verify, None
+        )
+        if hasattr(adapter, "get_connection_with_tls_context"):
+            pool = adapter.get_connection_with_tls_context(
+                requests.Request("GET", url).prepare(),
+                options["verify"],
+                options["proxies"],
+                options["cert"],
+            )
+        else:  # requests < 2.32.2
+            pool = adapter.get_connection(url, options["proxies"])
+
+        opened = []
+        try:
+            for _ in range(min(connections, adapter._pool_maxsize)):
+                connection = pool._get_conn()
+                opened.append(connection)
+                connection.connect()
+        except (OSError, urllib3.exceptions.HTTPError) as e:
+            self.logger.warning(f"Failed to prewarm connections to {url}: {e}")
+        finally:
+            for connection in opened:
+                pool._put_conn(connection)
+        return sum(1 for connection in opened if connection.is_connected)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            sessions = dict(self._sessions)
+
+        pool_stats = {}
+        for pool_key in sorted(sessions):
+            opened = 0
+            requests_sent = 0
+            session = sessions[pool_key]
+            for pool in self._iter_pools(session):
+                opened += pool.num_connections
+                requests_sent += pool.num_requests
+            pool_stats[pool_key] = {
+                "pool_maxsize": session.get_adapter("https://")._pool_maxsize,
+                "requests": requests_sent,
+                "connections_opened": opened,
+                "connections_reused": max(requests_sent - opened, 0),
+            }
+        return pool_stats
+
+    def close_all(self) -> None:
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+    def _create_session(self, pool_maxsize: int) -> requests.Session:
+        session = requests.Session()
+        adapter = CodecHTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_maxsize,
+            pool_block=self.pool_block,
+            max_retries=0,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers["Connection"] = "keep-alive"
+        return session
+
+    def _reset_after_fork(self) -> None:
+        # Sockets inherited from the gunicorn master must not be shared
+        # between workers, so a forked process starts with fresh pools.
+        current_pid = os.getpid()
+        if current_pid != self._pid:
+            self._sessions = {}
+            self._pid = current_pid
+
+    def _iter_pools(self, session: requests.Session) -> list[Any]:
+        pools = []
+        for adapter in set(session.adapters.values()):
+            pool_manager = getattr(adapter, "poolmanager", None)
+            if pool_manager is None:
+                continue
+            # RecentlyUsedContainer refuses iteration; keys() copies the
+            # keys under its lock, and a pool evicted since reads as None.
+            for key in list(pool_manager.pools.keys()):
+                pool = pool_manager.pools.get(key)
+                if pool is not None:
+                    pools.append(pool)
+        return pools
+
+    def _pool_maxsize_for(self, traffic_class: str | None) -> int:
+        if traffic_class is None:
+            return self.pool_maxsize
+        return bulkheads.max_concurrency(traffic_class) or self.pool_maxsize
+
+    @staticmethod
+    def _pool_key(url: str, traffic_class: str | None) -> str:
+        parts = urlsplit(url)
+        host_key = f"{parts.scheme}://{parts.netloc}"
+        if traffic_class is None or traffic_class == DEFAULT_TRAFFIC_CLASS:
+            return host_key
+        return f"{host_key} [{traffic_class}]"
+
+
+connection_pool = ConnectionPoolService()
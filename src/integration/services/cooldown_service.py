@@ -0,0 +1,171 @@
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.cache import cache
+
+from src.config.logging import logger
+from src.core.utils.deadline import current_deadline
+from src.core.utils.retry import retry_after
+
+# How long a worker trusts its last look at the shared cooldown, so calls
+# do not each pay a cache round trip.
+REFRESH_INTERVAL = 0.25
+
+
+class CooldownError(Exception):
+    def __init__(self, name: str, retry_after: float) -> None:
+        super().__init__(
+            f"OFDA asked to back off {name}, retry in {retry_after:.0f}s"
+        )
+        self.name = name
+        self.retry_after = retry_after
+
+
+class CooldownService:
+    """Honors OFDA's ``Retry-After`` for every worker through the cache.
+
+    A 429 or 503 carrying ``Retry-After`` starts a cooldown for the route
+    class and host that answered it, stored in the Django cache (Redis in
+    deployments). Later calls to that route and host, from any worker,
+    wait for the cooldown to end before they are sent instead of being
+    rejected too. A call whose wait would outlast the request deadline or
+    ``OFDA_COOLDOWN_MAX_WAIT`` fails at once with ``CooldownError``.
+    """
+
+    key_prefix = "ofda_cooldown"
+
+    def __init__(self) -> None:
+        self.logger = logger
+        self._lock = threading.Lock()
+        # name -> (cooldown end as a timestamp, when it was read)
+        self._known: dict[str, tuple[float, float]] = {}
+        self._stats: dict[str, dict[str, float]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return getattr(settings, "OFDA_RETRY_AFTER_COOLDOWN", True)
+
+    @property
+    def max_seconds(self) -> float:
+        return getattr(settings, "OFDA_COOLDOWN_MAX_SECONDS", 300)
+
+    @property
+    def max_wait(self) -> float:
+        return getattr(settings, "OFDA_COOLDOWN_MAX_WAIT", 30)
+
+    def cooldown_name(self, route: Any, base_url: str | None = None) -> str:
+        parts = urlsplit(str(base_url or route.get_base_url() or ""))
+        return f"{route.__class__.__name__}@{parts.netloc}"
+
+    def remaining(self, route: Any, base_url: str | None = None) -> float:
+        """Seconds left in the cooldown of ``route``, 0 when there is none."""
+        if not self.enabled:
+            return 0.0
+        return self._remaining(self.cooldown_name(route, base_url))
+
+    def record(
+        self, route: Any, exc: BaseException, base_url: str | None = None
+    ) -> float | None:
+        """Start a cooldown if ``exc`` carries a Retry-After."""
+        seconds = retry_after(exc)
+        if not self.enabled or seconds is None or seconds <= 0:
+            return None
+        seconds = min(seconds, self.max_seconds)
+        name = self.cooldown_name(route, base_url)
+        until = time.time() + seconds
+        if until <= self._until(name, refresh=True):
+            return seconds
+        self.logger.warning(
+            "OFDA asked %s to back off for %.1fs", name, seconds
+        )
+        try:
+            cache.set(self._key(name), until, int(seconds) + 1)
+        except Exception as e:
+            self.logger.debug("Cooldown cache set failed: %s", e)
+        with self._lock:
+            self._known[name] = (until, time.monotonic())
+            self._route_stats(name)["cooldowns"] += 1
+        return seconds
+
+    @contextmanager
+    def guard(self, route: Any, base_url: str | None = None) -> Iterator[None]:
+        """Wait out the cooldown of ``route``, then run one call to it."""
+        wait = self._wait_before(route, base_url)
+        if wait:
+            time.sleep(wait)
+        try:
+            yield
+        except Exception as e:
+            self.record(route, e, base_url)
+            raise
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            stats = {
+                name: dict(route_stats)
+                for name, route_stats in self._stats.items()
+            }
+        for name, route_stats in stats.items():
+            route_stats["waited_seconds"] = round(
+                route_stats["waited_seconds"], 3
+            )
+            route_stats["remaining"] = round(self._remaining(name), 3)
+        return stats
+
+    def _wait_before(self, route: Any, base_url: str | None = None) -> float:
+        if not self.enabled:
+            return 0.0
+        name = self.cooldown_name(route, base_url)
+        wait = self._remaining(name)
+        if not wait:
+            return 0.0
+        deadline = current_deadline()
+        limit = self.max_wait
+        if deadline is not None:
+            limit = min(limit, deadline.remaining())
+        with self._lock:
+            route_stats = self._route_stats(name)
+            if wait > limit:
+                route_stats["rejected"] += 1
+            else:
+                route_stats["waits"] += 1
+                route_stats["waited_seconds"] += wait
+        if wait > limit:
+            raise CooldownError(name, wait)
+        return wait
+
+    def _remaining(self, name: str) -> float:
+        return max(self._until(name) - time.time(), 0.0)
+
+    def _until(self, name: str, refresh: bool = False) -> float:
+        now = time.monotonic()
+        with self._lock:
+            until, read_at = self._known.get(name, (0.0, -REFRESH_INTERVAL))
+        if not refresh and now - read_at < REFRESH_INTERVAL:
+            return until
+        try:
+            until = max(cache.get(self._key(name)) or 0.0, until)
+        except Exception as e:
+            # Fail open: without the cache, only Retry-After answers seen
+            # by this worker hold its calls back.
+            self.logger.debug("Cooldown cache get failed: %s", e)
+        with self._lock:
+            self._known[name] = (until, now)
+        return until
+
+    def _route_stats(self, name: str) -> dict[str, float]:
+        return self._stats.setdefault(
+            name,
+            {"cooldowns": 0, "waits": 0, "waited_seconds": 0.0, "rejected": 0},
+        )
+
+    def _key(self, name: str) -> str:
+        return f"{self.key_prefix}:{name}"
+
+
+cooldowns = CooldownService()
@@ -0,0 +1,214 @@
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextvars import copy_context
+from typing import Any, TypeVar
+
+from django.conf import settings
+
+from src.config.logging import hot_path_logger, logger
+from src.integration.services.bulkhead_service import bulkheads
+from src.integration.services.rate_limiter_service import rate_limiter
+
+T = TypeVar("T")
+
+MIN_SAMPLES = 20
+LATENCY_WINDOW = 200
+MAX_HEDGE_TOKENS = 10.0
+
+
+def _close_response(future: Future) -> None:
+    if not future.cancelled() and future.exception() is None:
+        close = getattr(future.result(), "close", None)
+        if close is not None:
+            close()
+
+
+class HedgingService:
+    """Duplicates slow idempotent GETs and keeps the first answer.
+
+    A GET that has not answered after the ``OFDA_HEDGE_PERCENTILE`` latency
+    of its route class (over the last calls) is sent a second time, and
+    the first successful response wins; the other one is closed or
+    cancelled. Every call adds ``OFDA_HEDGE_MAX_RATIO`` of a token to a
+    budget and each hedge spends a whole token, so at most that share of
+    the calls is duplicated. Hedges also need a free rate limiter token,
+    they never wait for one. Calls wait for their hedge on a pool sized to
+    the bulkheads, so they never queue behind hedges, which run on
+    ``OFDA_HEDGE_MAX_WORKERS`` threads of their own.
+    """
+
+    def __init__(self) -> None:
+        self.logger = logger
+        self.hot_path_logger = hot_path_logger
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._hedge_executor: ThreadPoolExecutor | None = None
+        self._latencies: dict[str, deque[float]] = {}
+        self._tokens: dict[str, float] = {}
+        self._stats: dict[str, dict[str, int]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return getattr(settings, "OFDA_HEDGING", False)
+
+    @property
+    def percentile(self) -> float:
+        return getattr(settings, "OFDA_HEDGE_PERCENTILE", 95)
+
+    @property
+    def max_ratio(self) -> float:
+        return getattr(settings, "OFDA_HEDGE_MAX_RATIO", 0.05)
+
+    def delay(self, route_class: str) -> float | None:
+        """Time to wait for a call before hedging it, None while learning."""
+        with self._lock:
+            latencies = sorted(self._latencies.get(route_class, ()))
+        if len(latencies) < MIN_SAMPLES:
+            return None
+        index = round(self.percentile / 100 * (len(latencies) - 1))
+        return latencies[index]
+
+    def record_latency(self, route_class: str, seconds: float) -> None:
+        with self._lock:
+            self._latencies.setdefault(
+                route_class, deque(maxlen=LATENCY_WINDOW)
+            ).append(seconds)
+
+    def run(
+        self,
+        route: Any,
+        call: Callable[[], T],
+        hedge_call: Callable[[], T] | None = None,
+    ) -> T:
+        """``call()``, or the hedge's answer when that comes first.
+
+        ``hedge_call`` sends the hedge, ``call`` again by default.
+        """
+        route_class = route.__class__.__name__
+        if not self.enabled:
+            return call()
+        delay = self._start(route_class)
+        if delay is None:
+            return self._timed(route_class, call)
+        primary = self._submit(self._get_executor(), route_class, call)
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._try_hedge(route):
+            return primary.result()
+
+        pending = {
+            primary,
+            self._submit(
+                self._get_hedge_executor(), route_class, hedge_call or call
+            ),
+        }
+        error: BaseException | None = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    # The caller accounts the error to the endpoint of the
+                    # first call, so that call's error is the one raised.
+                    if future is primary or error is None:
+                        error = future.exception()
+                    continue
+                for loser in pending:
+                    # A hedge still waiting for a thread is never sent.
+                    loser.cancel()
+                    loser.add_done_callback(_close_response)
+                self._record_winner(route_class, future is not primary)
+                return future.result()
+        raise error
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            stats = {
+                route_class: dict(route_stats)
+                for route_class, route_stats in self._stats.items()
+            }
+        for route_class, route_stats in stats.items():
+            route_stats["delay_seconds"] = self.delay(route_class)
+        return stats
+
+    def _start(self, route_class: str) -> float | None:
+        with self._lock:
+            route_stats = self._route_stats(route_class)
+            route_stats["calls"] += 1
+            self._tokens[route_class] = min(
+                self._tokens.get(route_class, 0.0) + self.max_ratio,
+                MAX_HEDGE_TOKENS,
+            )
+        return self.delay(route_class)
+
+    def _try_hedge(self, route: Any) -> bool:
+        route_class = route.__class__.__name__
+        with self._lock:
+            if self._tokens.get(route_class, 0.0) < 1:
+                return False
+            self._tokens[route_class] -= 1
+        if not rate_limiter.try_acquire(route):
+            return False
+        with self._lock:
+            self._route_stats(route_class)["hedged"] += 1
+        self.hot_path_logger.info("Hedging slow %s call", route_class)
+        return True
+
+    def _record_winner(self, route_class: str, hedge_won: bool) -> None:
+        if hedge_won:
+            with self._lock:
+                self._route_stats(route_class)["hedge_wins"] += 1
+
+    def _route_stats(self, route_class: str) -> dict[str, int]:
+        return self._stats.setdefault(
+            route_class, {"calls": 0, "hedged": 0, "hedge_wins": 0}
+        )
+
+    def _submit(
+        self,
+        executor: ThreadPoolExecutor,
+        route_class: str,
+        call: Callable[[], T],
+    ) -> Future:
+        # Each attempt runs in its own copy of the caller's context, so the
+        # deadline and the retry budget apply to it.
+        return executor.submit(
+            copy_context().run, self._timed, route_class, call
+        )
+
+    def _timed(self, route_class: str, call: Callable[[], T]) -> T:
+        started = time.monotonic()
+        result = call()
+        self.record_latency(route_class, time.monotonic() - started)
+        return result
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # Hedged calls run inside a bulkhead slot, so they are never more
+        # than the bulkheads let through; threads are started on demand.
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=bulkheads.capacity,
+                    thread_name_prefix="ofda-hedged",
+                )
+            return self._executor
+
+    def _get_hedge_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(
+                    max_workers=getattr(
+                        settings, "OFDA_HEDGE_MAX_WORKERS", 32
+                    ),
+                    thread_name_prefix="ofda-hedge",
+                )
+            return self._hedge_executor
+
+
+hedging = HedgingService()
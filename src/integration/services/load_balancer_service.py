@@ -0,0 +1,216 @@
+import random
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from django.conf import settings
+
+from src.config.logging import logger
+from src.core.utils.retry import is_retryable
+
+EWMA_ALPHA = 0.3
+MAX_EJECTION_DOUBLINGS = 4
+MIN_SLOW_START_WEIGHT = 0.1
+
+
+class Endpoint:
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.outstanding = 0
+        self.latency = 0.0
+        self.consecutive_failures = 0
+        # Ejections since the endpoint last took its full share of traffic.
+        self.ejection_streak = 0
+        self.ejections = 0
+        self.ejected_until = 0.0
+        self.requests = 0
+        self.failures = 0
+
+    def weight(self, now: float, slow_start: float) -> float:
+        """Share of traffic an endpoint back from ejection may take."""
+        if not self.ejection_streak or slow_start <= 0:
+            return 1.0
+        ramp = (now - self.ejected_until) / slow_start
+        return min(max(ramp, MIN_SLOW_START_WEIGHT), 1.0)
+
+    def score(self, now: float, slow_start: float) -> float:
+        # Peak EWMA: expected wait behind the calls already in flight. Until
+        # it has answered, an endpoint looks fast so it gets tried.
+        latency = max(self.latency, 0.001)
+        return (self.outstanding + 1) * latency / self.weight(now, slow_start)
+
+
+class LoadBalancerService:
+    """Spreads OFDA calls over equivalent base URLs (``OFDA_API_BASE_URLS``).
+
+    Each call goes to the better of two endpoints picked at random, scored
+    by their calls in flight times their latency (an EWMA of the last
+    answers). ``OFDA_LB_EJECT_FAILURES`` retryable failures in a row eject
+    an endpoint for ``OFDA_LB_EJECT_SECONDS``, doubled on every ejection
+    that follows without a success in between, and an endpoint coming back
+    takes a share of the traffic that grows over
+    ``OFDA_LB_SLOW_START_SECONDS``. The last endpoint standing is never
+    ejected. State is kept per worker; with a single URL calls go straight
+    to it.
+    """
+
+    def __init__(self) -> None:
+        self.logger = logger
+        self._lock = threading.Lock()
+        self._endpoints: dict[str, Endpoint] = {}
+        self._random = random.Random()  # noqa: S311 - not crypto
+
+    @property
+    def urls(self) -> list[str]:
+        urls = [
+            url.strip().rstrip("/")
+            for url in getattr(settings, "OFDA_API_BASE_URLS", [])
+            if url.strip()
+        ]
+        return urls or [getattr(settings, "OFDA_API_BASE_URL", "")]
+
+    @property
+    def eject_failures(self) -> int:
+        return max(getattr(settings, "OFDA_LB_EJECT_FAILURES", 3), 1)
+
+    @property
+    def eject_seconds(self) -> float:
+        return getattr(settings, "OFDA_LB_EJECT_SECONDS", 30)
+
+    @property
+    def slow_start(self) -> float:
+        return getattr(settings, "OFDA_LB_SLOW_START_SECONDS", 30)
+
+    def choose(self, available: Callable[[str], bool] | None = None) -> str:
+        """Base URL for the next call.
+
+        ``available`` can rule out endpoints the caller knows will reject
+        the call, such as those with an open circuit; it is ignored when it
+        rules out every endpoint.
+        """
+        urls = self.urls
+        if len(urls) == 1:
+            return urls[0]
+        now = time.monotonic()
+        with self._lock:
+            endpoints = [self._endpoint(url) for url in urls]
+        candidates = [e for e in endpoints if e.ejected_until <= now]
+        if available is not None:
+            candidates = [e for e in candidates if available(e.url)] or (
+                candidates
+            )
+        if not candidates:
+            # Everything is ejected: try the endpoint that comes back first.
+            return min(endpoints, key=lambda e: e.ejected_until).url
+        if len(candidates) == 1:
+            return candidates[0].url
+        slow_start = self.slow_start
+        with self._lock:
+            first, second = self._random.sample(candidates, 2)
+            return min(
+                (first, second), key=lambda e: e.score(now, slow_start)
+            ).url
+
+    @contextmanager
+    def track(self, url: str) -> Iterator[None]:
+        """Account one request to ``url`` against its endpoint."""
+        endpoint = self._endpoint_of(url)
+        if endpoint is None:
+            yield
+            return
+        with self._lock:
+            endpoint.outstanding += 1
+            endpoint.requests += 1
+        started = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            self._release(
+                endpoint, time.monotonic() - started, failed=is_retryable(e)
+            )
+            raise
+        self._release(endpoint, time.monotonic() - started, failed=False)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        now = time.monotonic()
+        slow_start = self.slow_start
+        with self._lock:
+            return {
+                url: {
+                    "outstanding": endpoint.outstanding,
+                    "latency_ms": round(endpoint.latency * 1000, 1),
+                    "requests": endpoint.requests,
+                    "failures": endpoint.failures,
+                    "ejections": endpoint.ejections,
+                    "ejected": endpoint.ejected_until > now,
+                    "weight": round(endpoint.weight(now, slow_start), 2),
+                }
+                for url, endpoint in sorted(self._endpoints.items())
+            }
+
+    def _endpoint(self, url: str) -> Endpoint:
+        endpoint = self._endpoints.get(url)
+        if endpoint is None:
+            endpoint = self._endpoints[url] = Endpoint(url)
+        return endpoint
+
+    def _endpoint_of(self, url: str) -> Endpoint | None:
+        urls = self.urls
+        if len(urls) == 1:
+            return None
+        for base_url in urls:
+            if url == base_url or url.startswith(
+                (f"{base_url}/", f"{base_url}?")
+            ):
+                with self._lock:
+                    return self._endpoint(base_url)
+        return None
+
+    def _release(
+        self, endpoint: Endpoint, latency: float, failed: bool
+    ) -> None:
+        with self._lock:
+            endpoint.outstanding -= 1
+            if not failed:
+                endpoint.latency = (
+                    latency
+                    if not endpoint.latency
+                    else EWMA_ALPHA * latency
+                    + (1 - EWMA_ALPHA) * endpoint.latency
+                )
+                endpoint.consecutive_failures = 0
+                if endpoint.weight(time.monotonic(), self.slow_start) >= 1:
+                    endpoint.ejection_streak = 0
+                return
+            endpoint.failures += 1
+            endpoint.consecutive_failures += 1
+            if endpoint.consecutive_failures >= self.eject_failures:
+                self._eject(endpoint)
+
+    def _eject(self, endpoint: Endpoint) -> None:
+        now = time.monotonic()
+        others = [
+            self._endpoint(url)
+            for url in self.urls
+            if url != endpoint.url and self._endpoint(url).ejected_until <= now
+        ]
+        if not others:
+            return
+        seconds = self.eject_seconds * 2 ** min(
+            endpoint.ejection_streak, MAX_EJECTION_DOUBLINGS
+        )
+        endpoint.ejection_streak += 1
+        endpoint.ejections += 1
+        endpoint.ejected_until = now + seconds
+        endpoint.consecutive_failures = 0
+        self.logger.warning(
+            "OFDA endpoint %s ejected for %.0fs after %s failures",
+            endpoint.url,
+            seconds,
+            self.eject_failures,
+        )
+
+
+load_balancer = LoadBalancerService()
@@ -0,0 +1,116 @@
+import threading
+from typing import Any
+
+from django.conf import settings
+
+from src.config.logging import logger
+from src.integration.policies import route_policies
+
+
+class PageSizeService:
+    """Page size (the ``limit`` parameter) of paginated OFDA resources.
+
+    Every route class starts at ``OFDA_PAGE_SIZE``. A full page answered
+    within half of ``OFDA_PAGE_TARGET_SECONDS`` and under half of
+    ``OFDA_PAGE_MAX_BYTES`` doubles the size of the next lists of that
+    route, and a page slower or larger than those halves it, within
+    ``OFDA_PAGE_SIZE_MIN`` and ``OFDA_PAGE_SIZE_MAX``. A ``page_size`` in
+    the route policy pins the size instead. Sizes are kept per worker.
+    """
+
+    def __init__(self) -> None:
+        self.logger = logger
+        self._lock = threading.Lock()
+        self._sizes: dict[str, int] = {}
+        self._stats: dict[str, dict[str, int]] = {}
+
+    @property
+    def initial(self) -> int:
+        return getattr(settings, "OFDA_PAGE_SIZE", 100)
+
+    @property
+    def min_size(self) -> int:
+        return max(getattr(settings, "OFDA_PAGE_SIZE_MIN", 10), 1)
+
+    @property
+    def max_size(self) -> int:
+        return max(getattr(settings, "OFDA_PAGE_SIZE_MAX", 500), self.min_size)
+
+    @property
+    def target_seconds(self) -> float:
+        return getattr(settings, "OFDA_PAGE_TARGET_SECONDS", 1.0)
+
+    @property
+    def max_bytes(self) -> int:
+        return getattr(settings, "OFDA_PAGE_MAX_BYTES", 1048576)
+
+    def size(self, route_name: str) -> int:
+        """Page size for the next list of ``route_name``."""
+        pinned = route_policies.get(route_name).page_size
+        if pinned is not None:
+            return pinned
+        with self._lock:
+            return self._current(route_name)
+
+    def record(
+        self,
+        route_name: str,
+        size: int,
+        items: int,
+        seconds: float | None,
+        content_bytes: int | None,
+    ) -> None:
+        """Adapt the size of ``route_name`` to a page fetched with ``size``."""
+        if route_policies.get(route_name).page_size is not None:
+            return
+        with self._lock:
+            self._route_stats(route_name)["pages"] += 1
+        too_slow = seconds is not None and seconds > self.target_seconds
+        too_large = (
+            content_bytes is not None and content_bytes > self.max_bytes
+        )
+        if too_slow or too_large:
+            self._resize(route_name, size, max(size // 2, self.min_size))
+            return
+        # Short pages (the last one of a list) say little about larger ones.
+        if items < size or seconds is None:
+            return
+        fast = seconds <= self.target_seconds / 2
+        small = content_bytes is None or content_bytes <= self.max_bytes / 2
+        if fast and small:
+            self._resize(route_name, size, min(size * 2, self.max_size))
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            return {
+                route_name: {"size": self._current(route_name), **route_stats}
+                for route_name, route_stats in sorted(self._stats.items())
+            }
+
+    def _route_stats(self, route_name: str) -> dict[str, int]:
+        return self._stats.setdefault(
+            route_name, {"pages": 0, "increases": 0, "decreases": 0}
+        )
+
+    def _current(self, route_name: str) -> int:
+        size = self._sizes.get(route_name, self.initial)
+        return min(max(size, self.min_size), self.max_size)
+
+    def _resize(self, route_name: str, size: int, new_size: int) -> None:
+        with self._lock:
+            route_stats = self._route_stats(route_name)
+            # Pages of lists started before the last change do not move
+            # the size again.
+            if new_size == size or self._current(route_name) != size:
+                return
+            self._sizes[route_name] = new_size
+            route_stats["increases" if new_size > size else "decreases"] += 1
+        self.logger.info(
+            "OFDA %s page size changed from %s to %s",
+            route_name,
+            size,
+            new_size,
+        )
+
+
+page_sizes = PageSizeService()
@@ -0,0 +1,331 @@
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from django.conf import settings
+
+from src.config.logging import logger
+from src.core.utils.deadline import current_deadline
+from src.core.utils.mapping import parse_mapping
+
+# Refills the bucket from the time elapsed since the last call and grants up
+# to ARGV[3] tokens in one step, so every worker and pod draws from the same
+# budget. Redis' clock is used so skew between hosts does not matter.
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(bucket[1]) or burst
+local updated_at = tonumber(bucket[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated_at) * rate)
+local granted = math.min(requested, math.floor(tokens))
+tokens = tokens - granted
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated_at', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+local wait = 0
+if granted == 0 then
+    wait = (1 - tokens) / rate
+end
+return {granted, tostring(wait)}
+"""
+
+_current_client: ContextVar[str | None] = ContextVar(
+    "current_rate_limit_client", default=None
+)
+
+
+@contextmanager
+def rate_limit_scope(client: str) -> Iterator[None]:
+    """Queue the outbound calls made inside the scope under ``client``."""
+    token = _current_client.set(client)
+    try:
+        yield
+    finally:
+        _current_client.reset(token)
+
+
+def current_client() -> str | None:
+    """Client (user) of the current ``rate_limit_scope``, if any."""
+    return _current_client.get()
+
+
+class RateLimitTimeoutError(Exception):
+    pass
+
+
+class LocalTokenBucket:
+    """In-process stand-in for the Redis bucket when the cache is not Redis."""
+
+    def __init__(self, rate: float, burst: float) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self, requested: int) -> tuple[int, float]:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.burst,
+                self.tokens + max(now - self.updated_at, 0) * self.rate,
+            )
+            self.updated_at = now
+            granted = min(requested, int(self.tokens))
+            self.tokens -= granted
+            wait = (1 - self.tokens) / self.rate if not granted else 0.0
+            return granted, wait
+
+
+class FairQueue:
+    """Round-robin turns between the clients waiting for a token.
+
+    Each client has its own FIFO of waiters and only the head of the
+    client whose turn it is may take the next token, so one large
+    extraction cannot starve the others queued behind it.
+    """
+
+    def __init__(self) -> None:
+        self.condition = threading.Condition()
+        self._waiters: OrderedDict[str, deque[object]] = OrderedDict()
+
+    def __len__(self) -> int:
+        with self.condition:
+            return sum(len(waiters) for waiters in self._waiters.values())
+
+    def join(self, client: str) -> object:
+        ticket = object()
+        with self.condition:
+            self._waiters.setdefault(client, deque()).append(ticket)
+        return ticket
+
+    def is_next(self, client: str, ticket: object) -> bool:
+        with self.condition:
+            return self._is_next(client, ticket)
+
+    def wait_turn(self, client: str, ticket: object, timeout: float) -> bool:
+        with self.condition:
+            return self.condition.wait_for(
+                lambda: self._is_next(client, ticket), timeout
+            )
+
+    def _is_next(self, client: str, ticket: object) -> bool:
+        head_client = next(iter(self._waiters), None)
+        return head_client == client and self._waiters[client][0] is ticket
+
+    def leave(self, client: str, ticket: object) -> None:
+        with self.condition:
+            waiters = self._waiters.get(client)
+            if waiters is None:
+                return
+            served = waiters[0] is ticket
+            waiters.remove(ticket)
+            if not waiters:
+                del self._waiters[client]
+            elif served:
+                # Next turn goes to the next client in line.
+                self._waiters.move_to_end(client)
+            self.condition.notify_all()
+
+
+class RateLimiterService:
+    """Token bucket per OFDA route class shared by all workers through Redis.
+
+    A worker takes up to ``OFDA_RATE_LIMIT_RESERVATION`` tokens per Redis
+    round trip and spends them locally; tokens not used within a second are
+    dropped so idle workers do not hold on to the budget. When the bucket
+    is empty, calls wait in a ``FairQueue`` keyed by the client of the
+    current ``rate_limit_scope`` instead of failing, up to the request
+    deadline or ``OFDA_RATE_LIMIT_MAX_WAIT``.
+    """
+
+    key_prefix = "ofda_rate_limit"
+    reservation_ttl = 1.0
+
+    def __init__(self) -> None:
+        self.logger = logger
+        self._lock = threading.Lock()
+        self._script: Any = None
+        self._redis_available: bool | None = None
+        self._local_buckets: dict[str, LocalTokenBucket] = {}
+        self._reserved: dict[str, tuple[int, float]] = {}
+        self._queues: dict[str, FairQueue] = {}
+        self._stats: dict[str, dict[str, float]] = {}
+
+    @property
+    def default_rate(self) -> float:
+        return getattr(settings, "OFDA_RATE_LIMIT", 0)
+
+    @property
+    def route_rates(self) -> dict[str, float]:
+        return parse_mapping(getattr(settings, "OFDA_RATE_LIMITS", []))
+
+    @property
+    def burst(self) -> float:
+        return getattr(settings, "OFDA_RATE_LIMIT_BURST", 0)
+
+    @property
+    def reservation(self) -> int:
+        return max(getattr(settings, "OFDA_RATE_LIMIT_RESERVATION", 5), 1)
+
+    @property
+    def max_wait(self) -> float:
+        return getattr(settings, "OFDA_RATE_LIMIT_MAX_WAIT", 30)
+
+    def rate_for(self, route_class: str) -> float:
+        return self.route_rates.get(route_class, self.default_rate)
+
+    def acquire(self, route: Any) -> None:
+        """Block until the route may be called."""
+        route_class = route.__class__.__name__
+        rate = self.rate_for(route_class)
+        if rate <= 0:
+            return
+        queue = self._queue(route_class)
+        if not len(queue) and self._take_reserved(route_class):
+            self._record(route_class, None)
+            return
+
+        client = _current_client.get() or ""
+        ticket = queue.join(client)
+        started = time.monotonic()
+        throttled = not queue.is_next(client, ticket)
+        try:
+            while True:
+                if not queue.wait_turn(
+                    client, ticket, self._wait_limit(route_class, started)
+                ):
+                    continue
+                wait = self._take(route_class, rate)
+                if wait is None:
+                    break
+                throttled = True
+                time.sleep(min(wait, self._wait_limit(route_class, started)))
+        finally:
+            queue.leave(client, ticket)
+        self._record(route_class, started if throttled else None)
+
+    def try_acquire(self, route: Any) -> bool:
+        """Take a token only if one is available right away."""
+        route_class = route.__class__.__name__
+        rate = self.rate_for(route_class)
+        if rate <= 0:
+            return True
+        if len(self._queue(route_class)):
+            return False
+        if self._take(route_class, rate) is not None:
+            return False
+        self._record(route_class, None)
+        return True
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            stats = {
+                route_class: dict(route_stats)
+                for route_class, route_stats in self._stats.items()
+            }
+        for route_class, route_stats in stats.items():
+            route_stats["rate"] = self.rate_for(route_class)
+            route_stats["queued"] = len(self._queue(route_class))
+        return stats
+
+    def _wait_limit(self, route_class: str, started: float) -> float:
+        deadline = current_deadline()
+        if deadline is not None:
+            deadline.check()
+        remaining = self.max_wait - (time.monotonic() - started)
+        if remaining <= 0:
+            raise RateLimitTimeoutError(
+                f"No {route_class} rate limit token within {self.max_wait}s"
+            )
+        if deadline is not None:
+            return min(deadline.remaining(), remaining)
+        return remaining
+
+    def _take(self, route_class: str, rate: float) -> float | None:
+        """Take a token, or return how long to wait for the next one."""
+        if self._take_reserved(route_class):
+            return None
+        granted, wait = self._take_shared(route_class, rate)
+        if not granted:
+            return wait
+        with self._lock:
+            self._reserved[route_class] = (
+                granted - 1,
+                time.monotonic() + self.reservation_ttl,
+            )
+        return None
+
+    def _take_reserved(self, route_class: str) -> bool:
+        with self._lock:
+            tokens, expires_at = self._reserved.get(route_class, (0, 0.0))
+            if tokens <= 0 or time.monotonic() >= expires_at:
+                return False
+            self._reserved[route_class] = (tokens - 1, expires_at)
+            return True
+
+    def _take_shared(self, route_class: str, rate: float) -> tuple[int, float]:
+        burst = max(self.burst or rate, 1)
+        requested = min(self.reservation, int(burst))
+        script = self._redis_script()
+        if script is None:
+            return self._local_bucket(route_class, rate, burst).take(requested)
+        try:
+            granted, wait = script(
+                keys=[f"{self.key_prefix}:{route_class}"],
+                args=[rate, burst, requested],
+            )
+            return int(granted), float(wait)
+        except Exception as e:
+            # Never stop OFDA calls because Redis is unreachable.
+            self.logger.warning("Rate limiter Redis call failed: %s", e)
+            return 1, 0.0
+
+    def _redis_script(self) -> Any:
+        if self._redis_available is None:
+            try:
+                from django_redis import get_redis_connection
+
+                self._script = get_redis_connection("default").register_script(
+                    TOKEN_BUCKET_SCRIPT
+                )
+                self._redis_available = True
+            except (ImportError, NotImplementedError):
+                # Not a django-redis cache: limit each worker on its own.
+                self._redis_available = False
+        return self._script
+
+    def _local_bucket(
+        self, route_class: str, rate: float, burst: float
+    ) -> LocalTokenBucket:
+        with self._lock:
+            bucket = self._local_buckets.get(route_class)
+            if bucket is None or (bucket.rate, bucket.burst) != (rate, burst):
+                bucket = LocalTokenBucket(rate, burst)
+                self._local_buckets[route_class] = bucket
+            return bucket
+
+    def _queue(self, route_class: str) -> FairQueue:
+        with self._lock:
+            return self._queues.setdefault(route_class, FairQueue())
+
+    def _record(self, route_class: str, queued_since: float | None) -> None:
+        with self._lock:
+            route_stats = self._stats.setdefault(
+                route_class,
+                {"acquired": 0, "queued_calls": 0, "wait_seconds": 0.0},
+            )
+            route_stats["acquired"] += 1
+            if queued_since is not None:
+                route_stats["queued_calls"] += 1
+                route_stats["wait_seconds"] += time.monotonic() - queued_since
+
+
+rate_limiter = RateLimiterService()
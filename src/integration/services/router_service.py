@@ -5,32 +5,84 @@ from urllib.error import HTTPError
 from requests.exceptions import ConnectionError as RequestsConnectionError
 from requests.exceptions import RequestException, Timeout
 
-from src.core.utils.retry import retry_with_backoff
+from src.core.utils.deadline import current_deadline
+from src.core.utils.retry import call_with_retry
+from src.integration.dtos.integration_dtos import (
+    CompactIntegrationResultDTO,
+    IntegrationResultDTO,
+)
+from src.integration.policies import route_policies
 from src.integration.routes.base import BaseRoute
+from src.integration.services.bulkhead_service import bulkheads
+from src.integration.services.circuit_breaker_service import circuit_breaker
+from src.integration.services.cooldown_service import cooldowns
+from src.integration.services.load_balancer_service import load_balancer
+from src.integration.services.rate_limiter_service import rate_limiter
 
 
 class RouterService:
     def __init__(self) -> None:
         self._logger = logging.getLogger(__name__)
 
-    @retry_with_backoff(max_retries=3, backoff_increment=1)
-    def router_process(self, route: BaseRoute) -> Any:
-        try:
-            integration_result = route.integrate()
-            if integration_result.success:
-                return integration_result
-        except HTTPError as exc:
-            self._logger.error(
-                f"Exception when running integration process. Error: {exc}"
-            )
-            raise
-        except (RequestException, RequestsConnectionError, Timeout) as exc:
-            self._logger.error(
-                f"Request exception when running integration process. Error: {exc}"
+    def _check_deadline(self, route: BaseRoute) -> None:
+        deadline = current_deadline()
+        if deadline is not None and deadline.expired:
+            self._logger.warning(
+                f"Deadline exceeded before calling {route.__class__.__name__}"
             )
-            raise
-        except Exception as exc:
-            self._logger.error(
-                f"Unexpected exception when running integration process. Error: {exc}"
-            )
-            raise
+            deadline.check()
+
+    def _choose_endpoint(self, route: BaseRoute) -> None:
+        # Every attempt picks again, so a retry can go to another endpoint,
+        # and endpoints whose circuit is open or that asked us to back off
+        # are skipped.
+        route.endpoint = None
+        route.endpoint = load_balancer.choose(route.endpoint_available)
+
+    def _compact(
+        self, route: BaseRoute, integration_result: IntegrationResultDTO
+    ) -> IntegrationResultDTO | CompactIntegrationResultDTO:
+        # Streamed responses are decoded by the caller from the open
+        # connection, everything else is decoded now and released.
+        if route.stream_response or integration_result.response is None:
+            return integration_result
+        return CompactIntegrationResultDTO.from_result(integration_result)
+
+    def router_process(self, route: BaseRoute) -> Any:
+        # Retries follow the route's policy, see RoutePolicyRegistry.
+        return call_with_retry(
+            lambda: self._process(route),
+            route_policies.for_route(route).retry_policy(),
+            "router_process",
+            self._logger,
+        )
+
+    def _process(self, route: BaseRoute) -> Any:
+        self._check_deadline(route)
+        self._choose_endpoint(route)
+        with circuit_breaker.guard(route), cooldowns.guard(route):
+            rate_limiter.acquire(route)
+            with bulkheads.for_route(route).slot():
+                try:
+                    integration_result = route.integrate()
+                    if integration_result.success:
+                        return self._compact(route, integration_result)
+                except HTTPError as exc:
+                    self._logger.error(
+                        f"Exception when running integration process. Error: {exc}"
+                    )
+                    raise
+                except (
+                    RequestException,
+                    RequestsConnectionError,
+                    Timeout,
+                ) as exc:
+                    self._logger.error(
+                        f"Request exception when running integration process. Error: {exc}"
+                    )
+                    raise
+                except Exception as exc:
+                    self._logger.error(
+                        f"Unexpected exception when running integration process. Error: {exc}"
+                    )
+                    raise
@@ -0,0 +1,150 @@
+import hashlib
+import threading
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from requests.structures import CaseInsensitiveDict
+
+from src.config.logging import hot_path_logger, logger
+from src.integration.codecs import CodecResponse
+from src.integration.services.rate_limiter_service import current_client
+
+
+class ValidatorCacheService:
+    """HTTP validator cache for OFDA GETs.
+
+    Stores ``ETag``/``Last-Modified`` with the body so the next GET can be
+    sent conditionally and a ``304 Not Modified`` answer is served from
+    the stored body. Entries are kept per URL and user (the client of the
+    current ``rate_limit_scope``), since every extraction gets a new
+    token; a stored body is only replayed after OFDA answered 304 to a
+    request carrying the current token. Outside a user scope they are kept
+    per URL and token.
+    """
+
+    key_prefix = "ofda_validators"
+
+    def __init__(self) -> None:
+        self.logger = logger
+        self._lock = threading.Lock()
+        self._counters = {"stored": 0, "revalidated": 0, "modified": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return getattr(settings, "OFDA_CONDITIONAL_GET", True)
+
+    @property
+    def timeout(self) -> int:
+        return getattr(settings, "OFDA_CONDITIONAL_GET_TTL", 86400)
+
+    def conditional_headers(
+        self, url: str, authorization: str | None
+    ) -> tuple[dict[str, str], dict[str, Any] | None]:
+        entry = self._get_entry(url, authorization)
+        if entry is None:
+            return {}, None
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers, entry
+
+    def resolve(
+        self,
+        url: str,
+        authorization: str | None,
+        response: Any,
+        entry: dict[str, Any] | None,
+        timeout: int | None = None,
+    ) -> Any:
+        if response.status_code == 304 and entry is not None:
+            self._count("revalidated")
+            hot_path_logger.debug("Validator cache revalidated %s", url)
+            return self._replay(entry, response)
+
+        if entry is not None:
+            self._count("modified")
+        self._store(url, authorization, response, timeout)
+        return response
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._counters)
+
+    def _store(
+        self,
+        url: str,
+        authorization: str | None,
+        response: Any,
+        timeout: int | None = None,
+    ) -> None:
+        if response.status_code != 200:
+            return
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not isinstance(etag, str):
+            etag = None
+        if not isinstance(last_modified, str):
+            last_modified = None
+        if etag is None and last_modified is None:
+            return
+        content = response.content
+        if not isinstance(content, bytes):
+            return
+
+        entry = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "content": content,
+            "content_type": response.headers.get("Content-Type"),
+        }
+        try:
+            cache.set(
+                self._key(url, authorization),
+                entry,
+                self.timeout if timeout is None else timeout,
+            )
+            self._count("stored")
+        except Exception as e:
+            self.logger.error(f"Failed to store validators for {url}: {e}")
+
+    def _get_entry(
+        self, url: str, authorization: str | None
+    ) -> dict[str, Any] | None:
+        try:
+            return cache.get(self._key(url, authorization))
+        except Exception as e:
+            self.logger.error(f"Failed to read validators for {url}: {e}")
+            return None
+
+    def _replay(self, entry: dict[str, Any], not_modified: Any) -> Any:
+        response = CodecResponse()
+        response.status_code = 200
+        response.reason = "OK (revalidated)"
+        response._content = entry["content"]
+        response.headers = CaseInsensitiveDict(not_modified.headers)
+        if entry.get("content_type"):
+            response.headers["Content-Type"] = entry["content_type"]
+        response.url = not_modified.url
+        response.request = not_modified.request
+        response.elapsed = not_modified.elapsed
+        response.encoding = "utf-8"
+        return response
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    def _key(self, url: str, authorization: str | None) -> str:
+        client = current_client()
+        if client:
+            identity = f"{url}|client:{client}"
+        else:
+            identity = f"{url}|{authorization or ''}"
+        digest = hashlib.sha256(identity.encode()).hexdigest()
+        return f"{self.key_prefix}:{digest}"
+
+
+validator_cache = ValidatorCacheService()
@@ -0,0 +1,89 @@
+import logging
+import threading
+
+import pytest
+
+from src.config.logging import BackgroundLogging, SamplingFilter
+
+
+def make_record(level=logging.INFO):
+    return logging.LogRecord(
+        "core.hot_path", level, __file__, 1, "page %s", (1,), None
+    )
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.threads = set()
+
+    def emit(self, record):
+        self.records.append(record)
+        self.threads.add(threading.get_ident())
+
+
+class TestSamplingFilter:
+    def test_passes_one_in_every_n_records(self):
+        # Arrange
+        sampling_filter = SamplingFilter(rate=0.25)
+
+        # Act
+        passed = [sampling_filter.filter(make_record()) for _ in range(8)]
+
+        # Assert
+        assert passed.count(True) == 2
+
+    def test_never_drops_warnings(self):
+        # Arrange
+        sampling_filter = SamplingFilter(rate=0)
+
+        # Act & Assert
+        assert sampling_filter.filter(make_record(logging.WARNING))
+        assert not sampling_filter.filter(make_record(logging.INFO))
+
+
+class TestBackgroundLogging:
+    @pytest.fixture
+    def configured_logger(self):
+        target = logging.getLogger("test.background_logging")
+        handler = RecordingHandler()
+        target.addHandler(handler)
+        target.setLevel(logging.INFO)
+        target.propagate = False
+        yield target, handler
+        target.handlers = []
+
+    def test_handlers_run_on_listener_thread(self, configured_logger):
+        # Arrange
+        target, handler = configured_logger
+        background = BackgroundLogging()
+
+        # Act
+        background.start()
+        try:
+            target.info("fetched page %s", 3)
+        finally:
+            background.stop()
+
+        # Assert
+        assert [record.getMessage() for record in handler.records] == [
+            "fetched page 3"
+        ]
+        assert threading.get_ident() not in handler.threads
+
+    def test_stop_gives_handlers_back(self, configured_logger):
+        # Arrange
+        target, handler = configured_logger
+        original = list(target.handlers)
+        background = BackgroundLogging()
+
+        # Act
+        background.start()
+        swapped = list(target.handlers)
+        background.stop()
+
+        # Assert
+        assert handler not in swapped
+        assert target.handlers == original
+        assert not background.running
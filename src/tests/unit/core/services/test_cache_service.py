@@ -1,6 +1,6 @@
 import json
 from datetime import datetime
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -190,3 +190,30 @@ class TestCacheService:
         # Act & Assert
         with pytest.raises(TypeError):
             cache_service._json_serializer(object())
+
+    def test_prewarm_connections_without_redis_cache(self):
+        # Arrange
+        cache_service = CacheService()
+
+        # Act
+        result = cache_service.prewarm_connections(2)
+
+        # Assert
+        assert result == 0
+
+    @patch("django_redis.get_redis_connection")
+    def test_prewarm_connections_opens_pooled_connections(
+        self, mock_get_redis_connection
+    ):
+        # Arrange
+        cache_service = CacheService()
+        pool = mock_get_redis_connection.return_value.connection_pool
+        pool.get_connection.side_effect = [MagicMock(), MagicMock()]
+
+        # Act
+        result = cache_service.prewarm_connections(2)
+
+        # Assert
+        assert result == 2
+        assert pool.get_connection.call_count == 2
+        assert pool.release.call_count == 2
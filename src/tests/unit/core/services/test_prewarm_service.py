@@ -0,0 +1,76 @@
+from unittest.mock import patch
+
+from src.core.services.prewarm_service import (
+    HOT_PATH_MODULES,
+    PrewarmService,
+)
+
+
+class TestPrewarmService:
+    def test_prewarm_disabled_by_default(self):
+        # Arrange
+        service = PrewarmService()
+
+        # Act
+        with patch(
+            "src.integration.services.connection_pool_service."
+            "connection_pool.prewarm"
+        ) as mock_prewarm:
+            result = service.prewarm()
+
+        # Assert
+        assert result == {}
+        mock_prewarm.assert_not_called()
+
+    def test_prewarm_opens_connections_and_imports_hot_path(self, settings):
+        # Arrange
+        settings.OFDA_PREWARM_CONNECTIONS = 2
+        settings.OFDA_API_BASE_URL = "http://test-api.com"
+        service = PrewarmService()
+
+        # Act
+        with (
+            patch(
+                "src.integration.services.connection_pool_service."
+                "connection_pool.prewarm",
+                return_value=2,
+            ) as mock_prewarm,
+            patch.object(
+                service.cache_service, "prewarm_connections", return_value=2
+            ) as mock_redis_prewarm,
+        ):
+            result = service.prewarm()
+
+        # Assert
+        assert result == {
+            "modules": len(HOT_PATH_MODULES),
+            "ofda_connections": 2,
+            "redis_connections": 2,
+        }
+        mock_prewarm.assert_called_once_with("http://test-api.com", 2)
+        mock_redis_prewarm.assert_called_once_with(2)
+
+    def test_prewarm_opens_connections_per_bulkhead(self, settings):
+        # Arrange
+        settings.OFDA_PREWARM_CONNECTIONS = 2
+        settings.OFDA_API_BASE_URL = "http://test-api.com"
+        settings.OFDA_BULKHEAD_LIMITS = ["consent=4", "transactions=16"]
+        service = PrewarmService()
+
+        # Act
+        with (
+            patch(
+                "src.integration.services.connection_pool_service."
+                "connection_pool.prewarm",
+                return_value=2,
+            ) as mock_prewarm,
+            patch.object(
+                service.cache_service, "prewarm_connections", return_value=2
+            ),
+        ):
+            result = service.prewarm()
+
+        # Assert
+        assert result["ofda_connections"] == 4
+        mock_prewarm.assert_any_call("http://test-api.com", 2, "consent")
+        mock_prewarm.assert_any_call("http://test-api.com", 2, "transactions")
@@ -0,0 +1,175 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.core.services.single_flight_service import SingleFlightService
+from src.core.utils.deadline import DeadlineExceededError, deadline_scope
+
+
+def run(service, func, identifier="12345678901"):
+    return service.run("extraction", identifier, func, dump=dict, load=dict)
+
+
+class TestSingleFlightService:
+    @pytest.fixture(autouse=True)
+    def locmem_cache(self, settings):
+        settings.CACHES = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "single-flight-tests",
+            }
+        }
+        from django.core.cache import cache
+
+        cache.clear()
+        yield
+        cache.clear()
+
+    @pytest.fixture
+    def single_flight(self, settings):
+        settings.OFDA_SINGLE_FLIGHT = True
+        settings.OFDA_SINGLE_FLIGHT_LEASE_SECONDS = 15
+        settings.OFDA_SINGLE_FLIGHT_MAX_WAIT = 100
+        return SingleFlightService()
+
+    def hold_lease(self, single_flight, identifier="12345678901"):
+        """Take the lease as an owner in another worker would."""
+        from django.core.cache import cache
+
+        key = single_flight._key("extraction", identifier)
+        cache.add(key, "other-worker", single_flight.lease_seconds)
+        return key
+
+    def test_concurrent_calls_share_one_run(self, single_flight):
+        # Arrange
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def extract():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return {"accounts": 3}
+
+        # Act
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            leader = pool.submit(run, single_flight, extract)
+            started.wait(5)
+            waiters = [
+                pool.submit(run, single_flight, extract) for _ in range(3)
+            ]
+            time.sleep(0.2)
+            release.set()
+            results = [leader.result(5)] + [w.result(5) for w in waiters]
+
+        # Assert
+        assert len(calls) == 1
+        assert results == [{"accounts": 3}] * 4
+        stats = single_flight.stats()["extraction"]
+        assert stats["leads"] == 1
+        assert stats["coalesced"] == 3
+
+    def test_other_users_are_not_coalesced(self, single_flight):
+        # Arrange
+        self.hold_lease(single_flight, "other-user")
+
+        # Act
+        result = run(single_flight, lambda: {"accounts": 1})
+
+        # Assert
+        assert result == {"accounts": 1}
+        assert single_flight.stats()["extraction"]["leads"] == 1
+
+    def test_lease_is_renewed_while_the_owner_runs(
+        self, single_flight, settings
+    ):
+        # Arrange
+        settings.OFDA_SINGLE_FLIGHT_LEASE_SECONDS = 1
+        started = threading.Event()
+        calls = []
+
+        def extract():
+            calls.append(1)
+            started.set()
+            time.sleep(1.6)
+            return {"accounts": 3}
+
+        # Act
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(run, single_flight, extract)
+            started.wait(5)
+            waiter = pool.submit(run, single_flight, extract)
+            results = [leader.result(5), waiter.result(5)]
+
+        # Assert
+        assert len(calls) == 1
+        assert results == [{"accounts": 3}] * 2
+
+    def test_waiter_takes_over_an_expired_lease(self, single_flight, settings):
+        # Arrange
+        settings.OFDA_SINGLE_FLIGHT_LEASE_SECONDS = 1
+        self.hold_lease(single_flight)
+
+        # Act
+        result = run(single_flight, lambda: {"accounts": 2})
+
+        # Assert
+        assert result == {"accounts": 2}
+        assert single_flight.stats()["extraction"]["takeovers"] == 1
+
+    def test_waiter_takes_over_when_the_owner_fails(self, single_flight):
+        # Arrange
+        started = threading.Event()
+
+        def failing():
+            started.set()
+            time.sleep(0.2)
+            raise ValueError("Failed to obtain consent")
+
+        # Act
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(run, single_flight, failing)
+            started.wait(5)
+            waiter = pool.submit(run, single_flight, lambda: {"accounts": 1})
+            with pytest.raises(ValueError):
+                leader.result(5)
+            result = waiter.result(5)
+
+        # Assert
+        assert result == {"accounts": 1}
+        assert single_flight.stats()["extraction"]["takeovers"] == 1
+
+    def test_waiter_runs_alone_after_max_wait(self, single_flight, settings):
+        # Arrange
+        settings.OFDA_SINGLE_FLIGHT_MAX_WAIT = 0.1
+        self.hold_lease(single_flight)
+
+        # Act
+        result = run(single_flight, lambda: {"accounts": 1})
+
+        # Assert
+        assert result == {"accounts": 1}
+        assert single_flight.stats()["extraction"]["timeouts"] == 1
+
+    def test_wait_stops_at_the_request_deadline(self, single_flight):
+        # Arrange
+        self.hold_lease(single_flight)
+
+        # Act & Assert
+        with pytest.raises(DeadlineExceededError), deadline_scope(0.1):
+            run(single_flight, lambda: {"accounts": 1})
+
+    def test_disabled_runs_every_call(self, single_flight, settings):
+        # Arrange
+        settings.OFDA_SINGLE_FLIGHT = False
+        self.hold_lease(single_flight)
+
+        # Act
+        result = run(single_flight, lambda: {"accounts": 1})
+
+        # Assert
+        assert result == {"accounts": 1}
+        assert single_flight.stats() == {}
@@ -0,0 +1,71 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.core.utils.deadline import (
+    Deadline,
+    DeadlineExceededError,
+    current_deadline,
+    deadline_scope,
+)
+from src.core.utils.retry import retry_with_backoff
+
+
+class TestDeadline:
+    def test_timeout_is_capped_by_remaining_budget(self):
+        # Arrange
+        deadline = Deadline(5)
+
+        # Act & Assert
+        assert deadline.timeout(cap=30) <= 5
+        assert deadline.timeout(cap=1) == 1
+
+    def test_timeout_raises_when_expired(self):
+        # Arrange
+        deadline = Deadline(0)
+
+        # Act & Assert
+        assert deadline.expired is True
+        with pytest.raises(DeadlineExceededError):
+            deadline.timeout()
+
+    def test_deadline_scope_sets_and_resets_current_deadline(self):
+        # Act
+        with deadline_scope(10) as deadline:
+            inside = current_deadline()
+
+        # Assert
+        assert inside is deadline
+        assert current_deadline() is None
+
+
+class TestRetryWithDeadline:
+    def test_retry_stops_when_budget_cannot_cover_backoff(self):
+        # Arrange
+        func = Mock(side_effect=ConnectionError("boom"))
+        func.__name__ = "func"
+        decorated = retry_with_backoff(max_retries=3, base_delay=5)(func)
+
+        # Act
+        with (
+            patch("src.core.utils.retry.random.uniform", return_value=5),
+            patch("src.core.utils.retry.time.sleep") as mock_sleep,
+            deadline_scope(2),
+            pytest.raises(ConnectionError),
+        ):
+            decorated()
+
+        # Assert
+        func.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    def test_retry_does_not_retry_deadline_exceeded(self):
+        # Arrange
+        func = Mock(side_effect=DeadlineExceededError("late"))
+        func.__name__ = "func"
+        decorated = retry_with_backoff(max_retries=3, base_delay=1)(func)
+
+        # Act & Assert
+        with pytest.raises(DeadlineExceededError):
+            decorated()
+        func.assert_called_once()
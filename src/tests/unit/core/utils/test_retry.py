@@ -0,0 +1,152 @@
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from src.core.utils.retry import (
+    RetryPolicy,
+    current_retry_budget,
+    is_retryable,
+    retry_after,
+    retry_budget_scope,
+    retry_with_backoff,
+)
+
+
+def http_error(status_code, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    return requests.HTTPError(f"{status_code} error", response=response)
+
+
+def failing(*errors):
+    func = Mock(side_effect=list(errors))
+    func.__name__ = "func"
+    return func
+
+
+class TestIsRetryable:
+    @pytest.mark.parametrize(
+        ("exc", "expected"),
+        [
+            (http_error(500), True),
+            (http_error(503), True),
+            (http_error(429), True),
+            (http_error(400), False),
+            (http_error(401), False),
+            (http_error(404), False),
+            (requests.ConnectionError("reset"), True),
+            (requests.Timeout("slow"), True),
+            (ValueError("bad payload"), False),
+        ],
+    )
+    def test_classification(self, exc, expected):
+        # Act & Assert
+        assert is_retryable(exc) is expected
+
+
+class TestRetryAfter:
+    @pytest.mark.parametrize(
+        ("exc", "expected"),
+        [
+            (http_error(429, {"Retry-After": "7"}), 7.0),
+            (http_error(503, {"Retry-After": "1.5"}), 1.5),
+            (http_error(429, {"Retry-After": "soon"}), None),
+            (http_error(429), None),
+            (http_error(500, {"Retry-After": "7"}), None),
+            (requests.ConnectionError("reset"), None),
+        ],
+    )
+    def test_parses_seconds(self, exc, expected):
+        # Act & Assert
+        assert retry_after(exc) == expected
+
+    def test_parses_http_dates(self):
+        # Arrange
+        exc = http_error(503, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+
+        # Act & Assert
+        assert retry_after(exc) == 0.0
+
+
+class TestRetryPolicy:
+    def test_backoff_is_jittered_exponential_and_capped(self):
+        # Arrange
+        policy = RetryPolicy(base_delay=1, max_delay=4)
+
+        # Act
+        with patch(
+            "src.core.utils.retry.random.uniform", side_effect=lambda a, b: b
+        ):
+            caps = [policy.backoff(attempt) for attempt in range(5)]
+
+        # Assert
+        assert caps == [1, 2, 4, 4, 4]
+        assert 0 <= policy.backoff(10) <= 4
+
+
+class TestRetryWithBackoff:
+    def test_client_errors_are_not_retried(self):
+        # Arrange
+        func = failing(http_error(404))
+        decorated = retry_with_backoff(max_retries=3)(func)
+
+        # Act
+        with (
+            patch("src.core.utils.retry.time.sleep") as mock_sleep,
+            pytest.raises(requests.HTTPError),
+        ):
+            decorated()
+
+        # Assert
+        func.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    def test_server_errors_are_retried(self):
+        # Arrange
+        func = failing(http_error(503), http_error(502), "ok")
+        decorated = retry_with_backoff(max_retries=3)(func)
+
+        # Act
+        with patch("src.core.utils.retry.time.sleep") as mock_sleep:
+            result = decorated()
+
+        # Assert
+        assert result == "ok"
+        assert func.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    def test_retry_after_sets_the_minimum_delay(self):
+        # Arrange
+        func = failing(http_error(429, {"Retry-After": "3"}), "ok")
+        decorated = retry_with_backoff(max_retries=3, max_delay=1)(func)
+
+        # Act
+        with patch("src.core.utils.retry.time.sleep") as mock_sleep:
+            result = decorated()
+
+        # Assert
+        assert result == "ok"
+        mock_sleep.assert_called_once_with(3.0)
+
+    def test_retry_budget_is_shared_across_calls(self):
+        # Arrange
+        first = failing(http_error(503), http_error(503))
+        second = failing(http_error(503), "ok")
+
+        # Act
+        with (
+            patch("src.core.utils.retry.time.sleep"),
+            retry_budget_scope(1) as budget,
+        ):
+            with pytest.raises(requests.HTTPError):
+                retry_with_backoff(max_retries=3)(first)()
+            with pytest.raises(requests.HTTPError):
+                retry_with_backoff(max_retries=3)(second)()
+
+        # Assert
+        assert first.call_count == 2
+        second.assert_called_once()
+        assert budget.remaining == 0
+        assert current_retry_budget() is None
@@ -5,6 +5,7 @@ from unittest.mock import Mock, patch
 import pytest
 from ninja.errors import HttpError
 
+from src.core.utils.deadline import DeadlineExceededError
 from src.financial.controllers.extract_financial_data import (
     extract_financial_data,
     health_check,
@@ -74,6 +75,25 @@ class TestExtractFinancialDataController:
             assert exc_info.value.status_code == 400  # noqa: S101
             assert "Validation error" in str(exc_info.value.message)  # noqa: S101
 
+    def test_extract_financial_data_deadline_exceeded(
+        self, request_factory: Any, valid_request_data: dict[str, Any]
+    ) -> None:
+        # Arrange
+        request = request_factory.post("/api/v1/extract-financial-data")
+
+        with patch(
+            "src.financial.controllers.extract_financial_data.DynamicClientService"
+        ) as mock_client_service:
+            mock_client_service.return_value.get_or_create_client.side_effect = DeadlineExceededError(
+                "Request deadline of 100s exceeded"
+            )
+
+            # Act & Assert
+            with pytest.raises(HttpError) as exc_info:
+                extract_financial_data(request, valid_request_data)
+
+            assert exc_info.value.status_code == 504  # noqa: S101
+
     def test_extract_financial_data_extraction_service_error(
         self, request_factory: Any, valid_request_data: dict[str, Any]
     ) -> None:
@@ -232,6 +252,37 @@ class TestHealthCheckController:
             assert result.status == "degraded"  # noqa: S101
             assert result.services["ofda_api"] == "unhealthy"  # noqa: S101
 
+    def test_health_check_reports_open_circuits(
+        self, request_factory: Any
+    ) -> None:
+        # Arrange
+        request = request_factory.get("/api/v1/health")
+        circuits = {
+            "AccountsRoute@ofda.example.com": {
+                "state": "open",
+                "failures": 0,
+                "retry_after": 25,
+            }
+        }
+
+        with (
+            patch(
+                "src.financial.controllers.extract_financial_data.ExtractionService"
+            ),
+            patch(
+                "src.financial.controllers.extract_financial_data.circuit_breaker"
+            ) as mock_breaker,
+        ):
+            mock_breaker.states.return_value = circuits
+
+            # Act
+            result = health_check(request)
+
+            # Assert
+            assert result.status == "degraded"  # noqa: S101
+            assert result.services["ofda_api"] == "degraded"  # noqa: S101
+            assert result.circuit_breakers == circuits  # noqa: S101
+
     def test_health_check_includes_timestamp(
         self, request_factory: Any
     ) -> None:
@@ -284,3 +335,33 @@ class TestHealthCheckController:
                 assert result.status == "healthy"  # noqa: S101
             else:
                 assert result.status in ["degraded", "unhealthy"]  # noqa: S101
+
+
+class TestIntegrationStats:
+    def test_integration_stats_reports_pools_and_transfer(
+        self, request_factory: Any
+    ) -> None:
+        # Arrange
+        from src.financial.controllers.extract_financial_data import (
+            integration_stats,
+        )
+
+        request = request_factory.get("/api/v1/integration/stats")
+        pool_stats = {"http://test-api.com": {"connections_opened": 1}}
+
+        # Act
+        with patch(
+            "src.financial.controllers.extract_financial_data.connection_pool.stats",
+            return_value=pool_stats,
+        ):
+            result = integration_stats(request)
+
+        # Assert
+        assert result.connection_pools == pool_stats  # noqa: S101
+        assert result.json_codec in ("json", "orjson")  # noqa: S101
+        assert isinstance(result.transfer, dict)  # noqa: S101
+        assert set(result.conditional_get) == {  # noqa: S101
+            "stored",
+            "revalidated",
+            "modified",
+        }
@@ -1,5 +1,3 @@
-from unittest.mock import patch
-
 import pytest
 
 from src.financial.routes.accounts import AccountsRoute
@@ -27,10 +25,9 @@ class TestAccountsRoute:
         assert route._page == 1
         assert route._limit == 10
 
-    @patch("src.financial.routes.accounts.settings")
-    def test_get_base_url(self, mock_settings):
+    def test_get_base_url(self, settings):
         # Arrange
-        mock_settings.OFDA_API_BASE_URL = "http://test-api.com"
+        settings.OFDA_API_BASE_URL = "http://test-api.com"
         route = AccountsRoute({})
 
         # Act
@@ -47,7 +44,7 @@ class TestAccountsRoute:
         path = route.get_resource_path()
 
         # Assert
-        assert path == "/account?page=1"
+        assert path == "/account?page=1&limit=10"
 
     # Removed get_data_resource_path tests since method doesn't exist in implementation
 
@@ -1,5 +1,3 @@
-from unittest.mock import patch
-
 import pytest
 
 from src.financial.routes.dynamic_client import DynamicClientRoute
@@ -28,10 +26,9 @@ class TestDynamicClientRoute:
         assert route._organization_type is None
         assert route._client_id == ""
 
-    @patch("src.financial.routes.dynamic_client.settings")
-    def test_get_base_url(self, mock_settings):
+    def test_get_base_url(self, settings):
         # Arrange
-        mock_settings.OFDA_API_BASE_URL = "http://test-api.com"
+        settings.OFDA_API_BASE_URL = "http://test-api.com"
         route = DynamicClientRoute({})
 
         # Act
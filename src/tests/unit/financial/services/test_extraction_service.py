@@ -1,8 +1,13 @@
+import threading
+import time
 from datetime import datetime
 from typing import Any
-from unittest.mock import Mock
+from unittest.mock import Mock, PropertyMock, patch
+
+import pytest
 
 from src.financial.schemas.schemas import FinancialDataResponseSchema
+from src.integration.services.circuit_breaker_service import CircuitOpenError
 
 
 class TestExtractionService:
@@ -64,13 +69,16 @@ class TestExtractionService:
             sample_transactions_response
         )
 
-        mock_dependencies["router"].router_process.side_effect = [
-            accounts_result,
-            balances_result,  # balance for account-123
-            balances_result,  # balance for account-456
-            transactions_result,  # transactions for account-123
-            transactions_result,  # transactions for account-456
-        ]
+        # Balances and transactions of both accounts are fetched
+        # concurrently, so answer by route instead of by call order.
+        results = {
+            "AccountsRoute": accounts_result,
+            "BalancesRoute": balances_result,
+            "TransactionsRoute": transactions_result,
+        }
+        mock_dependencies["router"].router_process.side_effect = lambda route: (
+            results[route.__class__.__name__]
+        )
 
         mock_dependencies["cache"].cache_data.return_value = True
 
@@ -83,7 +91,9 @@ class TestExtractionService:
         assert isinstance(result, FinancialDataResponseSchema)  # noqa: S101
         assert result.user_document == "12345678901"  # noqa: S101
         assert len(result.accounts) > 0  # noqa: S101
-        mock_dependencies["cache"].cache_data.assert_called_once()
+        mock_dependencies["cache"].cache_data.assert_any_call(
+            "extraction", "12345678901", result.model_dump()
+        )
 
     def test_extract_financial_data_consent_failure(
         self, extraction_service: Any, mock_dependencies: dict[str, Any]
@@ -105,6 +115,39 @@ class TestExtractionService:
         assert len(result.accounts) == 0  # noqa: S101
         assert len(result.summary.errors) > 0  # noqa: S101
 
+    def test_extract_financial_data_serves_stale_copy_when_circuit_open(
+        self,
+        extraction_service: Any,
+        mock_dependencies: dict[str, Any],
+        sample_formatted_response: dict[str, Any],
+    ) -> None:
+        # Arrange
+        mock_dependencies["cache"].get_cached_data.side_effect = [
+            None,
+            sample_formatted_response,
+        ]
+        mock_dependencies[
+            "consent"
+        ].get_or_create_consent.side_effect = CircuitOpenError(
+            "ConsentRoute@ofda.example.com", 30
+        )
+
+        # Act
+        result = extraction_service.extract_financial_data(
+            "12345678901", "client_id", "token"
+        )
+
+        # Assert
+        assert len(result.accounts) == len(  # noqa: S101
+            sample_formatted_response["accounts"]
+        )
+        assert "Served from the last successful extraction" in (  # noqa: S101
+            result.summary.errors
+        )
+        mock_dependencies["cache"].get_cached_data.assert_called_with(
+            "extraction_stale", "12345678901"
+        )
+
     def test_extract_accounts_success(
         self,
         extraction_service: Any,
@@ -291,3 +334,692 @@ class TestExtractionService:
         assert len(result.accounts) == 1  # noqa: S101
         assert result.summary.total_accounts == 1  # noqa: S101
         assert result.summary.total_transactions == 1  # noqa: S101
+
+    def test_fetch_paginated_data_skips_pages_after_deadline(
+        self, extraction_service: Any, mock_dependencies: dict[str, Any]
+    ) -> None:
+        # Arrange
+        from src.financial.routes.transactions import TransactionsRoute
+
+        page1_response = {"items": [{"id": "tx-1"}], "has_next": True}
+        successful_result = Mock()
+        successful_result.success = True
+        successful_result.response.json.return_value = page1_response
+        mock_dependencies[
+            "router"
+        ].router_process.return_value = successful_result
+
+        deadline = Mock()
+        type(deadline).expired = PropertyMock(side_effect=[False, True])
+
+        # Act
+        with patch(
+            "src.financial.services.extraction_service.current_deadline",
+            return_value=deadline,
+        ):
+            result = extraction_service._fetch_paginated_data(
+                TransactionsRoute, {"token": "test", "account_id": "acc-1"}
+            )
+
+        # Assert
+        assert result == [{"id": "tx-1"}]  # noqa: S101
+        assert extraction_service.extraction_errors == [  # noqa: S101
+            "Deadline exceeded: skipped TransactionsRoute pages from 2 "
+            "for account acc-1"
+        ]
+
+    def test_iter_paginated_data_streams_items_when_enabled(
+        self, extraction_service: Any, mock_dependencies: dict[str, Any]
+    ) -> None:
+        # Arrange
+        import io
+        import json
+
+        from src.financial.routes.transactions import TransactionsRoute
+
+        pages = [
+            {"items": [{"id": "tx-1"}, {"id": "tx-2"}], "has_next": True},
+            {"items": [{"id": "tx-3"}], "has_next": False},
+        ]
+        results = []
+        for page in pages:
+            result = Mock()
+            result.success = True
+            result.response.raw = io.BytesIO(json.dumps(page).encode())
+            results.append(result)
+        mock_dependencies["router"].router_process.side_effect = results
+        extraction_service.streaming_decode = True
+
+        # Act
+        items = list(
+            extraction_service._iter_paginated_data(
+                TransactionsRoute, {"token": "test", "account_id": "acc-1"}
+            )
+        )
+
+        # Assert
+        assert [item["id"] for item in items] == [  # noqa: S101
+            "tx-1",
+            "tx-2",
+            "tx-3",
+        ]
+        routes = [
+            call.args[0]
+            for call in mock_dependencies[
+                "router"
+            ].router_process.call_args_list
+        ]
+        assert all(route.stream_response for route in routes)  # noqa: S101
+        for result in results:
+            result.response.close.assert_called_once()
+
+    def test_iter_paginated_data_stops_retrying_a_failing_page(
+        self, extraction_service: Any, mock_dependencies: dict[str, Any]
+    ) -> None:
+        # Arrange
+        from src.financial.routes.transactions import TransactionsRoute
+
+        page1_result = Mock()
+        page1_result.success = True
+        page1_result.response.json.return_value = {
+            "items": [{"id": "tx-1"}],
+            "has_next": True,
+        }
+        failed_result = Mock()
+        failed_result.success = False
+        mock_dependencies["router"].router_process.side_effect = [
+            page1_result,
+            failed_result,
+            failed_result,
+        ]
+
+        # Act
+        result = extraction_service._fetch_paginated_data(
+            TransactionsRoute, {"token": "test", "account_id": "acc-1"}
+        )
+
+        # Assert
+        assert result == [{"id": "tx-1"}]  # noqa: S101
+        assert mock_dependencies["router"].router_process.call_count == 3  # noqa: S101
+        assert extraction_service.incomplete is True  # noqa: S101
+        assert extraction_service.extraction_errors == [  # noqa: S101
+            "Missing TransactionsRoute pages from 2 for account acc-1: "
+            "page 2 was not fetched"
+        ]
+
+    def test_iter_paginated_data_stops_at_the_page_limit(
+        self, extraction_service: Any, mock_dependencies: dict[str, Any]
+    ) -> None:
+        # Arrange
+        from src.financial.routes.accounts import AccountsRoute
+
+        result = Mock()
+        result.success = True
+        result.response.json.return_value = {
+            "items": [{"id": "account-1"}],
+            "has_next": True,
+        }
+        mock_dependencies["router"].router_process.return_value = result
+        extraction_service.max_pages = 3
+
+        # Act
+        items = extraction_service._fetch_paginated_data(
+            AccountsRoute, {"token": "test"}
+        )
+
+        # Assert
+        assert len(items) == 3  # noqa: S101
+        assert extraction_service.extraction_errors == [  # noqa: S101
+            "Missing AccountsRoute pages from 4: page limit (3) reached"
+        ]
+
+    def test_iter_paginated_data_resumes_from_checkpoint(
+        self,
+        extraction_service: Any,
+        mock_dependencies: dict[str, Any],
+        settings: Any,
+    ) -> None:
+        # Arrange
+        from django.core.cache import cache
+
+        from src.financial.routes.transactions import TransactionsRoute
+
+        settings.CACHES = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "pagination-checkpoint-tests",
+            }
+        }
+        cache.clear()
+
+        def page(items: list[dict[str, Any]], has_next: bool) -> Mock:
+            result = Mock()
+            result.success = True
+            result.response.json.return_value = {
+                "items": items,
+                "has_next": has_next,
+            }
+            return result
+
+        failed_result = Mock()
+        failed_result.success = False
+        router = mock_dependencies["router"].router_process
+        router.side_effect = [
+            page([{"id": "tx-1"}], True),
+            failed_result,
+            failed_result,
+        ]
+        checkpoint = extraction_service.checkpoint_service.key(
+            TransactionsRoute, "12345678901", "acc-1"
+        )
+
+        def fetch() -> list[dict[str, Any]]:
+            return list(
+                extraction_service._iter_paginated_data(
+                    TransactionsRoute,
+                    {"token": "test", "account_id": "acc-1"},
+                    checkpoint=checkpoint,
+                )
+            )
+
+        first = fetch()
+        router.reset_mock()
+        router.side_effect = [page([{"id": "tx-2"}], False)]
+
+        # Act
+        second = fetch()
+
+        # Assert
+        assert first == [{"id": "tx-1"}]  # noqa: S101
+        assert second == [{"id": "tx-1"}, {"id": "tx-2"}]  # noqa: S101
+        assert router.call_count == 1  # noqa: S101
+        assert router.call_args.args[0]._page == 2  # noqa: S101
+        assert extraction_service.checkpoint_service.load(checkpoint) is None  # noqa: S101
+
+    def test_extract_account_data_runs_accounts_concurrently_in_order(
+        self, extraction_service: Any, mock_dependencies: dict[str, Any]
+    ) -> None:
+        # Arrange
+        consent_data = Mock()
+        consent_data.id = "consent-123"
+        consent_data.token = "consent-token"
+        accounts = [{"id": f"acc-{index}"} for index in range(6)]
+        extraction_service.concurrency = 4
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def router_process(route: Any) -> Mock:
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            account_id = route._account_id
+            # Earlier accounts answer last.
+            time.sleep(0.005 * (6 - int(account_id.split("-")[1])))
+            with lock:
+                in_flight -= 1
+            result = Mock()
+            result.success = True
+            result.response.json.return_value = {
+                "balance": 1.0,
+                "currency": "BRL",
+                "has_next": False,
+                "items": [
+                    {
+                        "id": f"tx-{account_id}",
+                        "transaction_type": "PIX",
+                        "transaction_status": "COMPLETED",
+                        "transaction_amount": 1.0,
+                        "transaction_direction": "CREDIT",
+                        "transaction_description": "",
+                        "transaction_date": "2024-01-01",
+                    }
+                ],
+            }
+            return result
+
+        mock_dependencies["router"].router_process.side_effect = router_process
+
+        # Act
+        balances, transactions = extraction_service._extract_account_data(
+            "12345678901", consent_data, accounts
+        )
+
+        # Assert
+        expected = [account["id"] for account in accounts]
+        assert [b["account_id"] for b in balances] == expected  # noqa: S101
+        assert [t["account_id"] for t in transactions] == expected  # noqa: S101
+        assert 1 < peak <= 4  # noqa: S101
+
+    def test_extract_account_data_raises_first_account_error(
+        self, extraction_service: Any, mock_dependencies: dict[str, Any]
+    ) -> None:
+        # Arrange
+        consent_data = Mock()
+        consent_data.token = "consent-token"
+        failed_result = Mock()
+        failed_result.success = False
+        mock_dependencies["router"].router_process.return_value = failed_result
+
+        # Act / Assert
+        with pytest.raises(ValueError, match="Failed to extract balances"):
+            extraction_service._extract_account_data(
+                "12345678901", consent_data, [{"id": "acc-1"}, {"id": "acc-2"}]
+            )
+
+    def test_iter_paginated_data_prefetches_pages_in_order(
+        self, extraction_service: Any, mock_dependencies: dict[str, Any]
+    ) -> None:
+        # Arrange
+        from src.financial.routes.transactions import TransactionsRoute
+
+        def router_process(route: Any) -> Mock:
+            result = Mock()
+            result.success = True
+            result.response.json.return_value = {
+                "items": [{"id": f"tx-{route._page}"}],
+                "has_next": route._page < 5,
+            }
+            return result
+
+        router = mock_dependencies["router"].router_process
+        router.side_effect = router_process
+        extraction_service.prefetch_pages = 4
+
+        # Act
+        items = extraction_service._fetch_paginated_data(
+            TransactionsRoute, {"token": "test", "account_id": "acc-1"}
+        )
+
+        # Assert
+        assert items == [{"id": f"tx-{page}"} for page in range(1, 6)]  # noqa: S101
+        assert router.call_count > 5  # noqa: S101
+        # Every page was short, so the window shrinks.
+        assert extraction_service._prefetch_windows["TransactionsRoute"] < 4  # noqa: S101
+
+    def test_prefetch_window_shrinks_only_at_the_end_of_the_list(
+        self, extraction_service: Any, mock_dependencies: dict[str, Any]
+    ) -> None:
+        # Arrange
+        from src.financial.routes.transactions import TransactionsRoute
+
+        def router_process(route: Any) -> Mock:
+            # Full pages up to page 5, which is the last one.
+            result = Mock()
+            result.success = True
+            result.response.json.return_value = {
+                "items": [
+                    {"id": f"tx-{route._page}-{number}"}
+                    for number in range(route._limit)
+                ],
+                "has_next": route._page < 5,
+            }
+            return result
+
+        router = mock_dependencies["router"].router_process
+        router.side_effect = router_process
+        extraction_service.prefetch_pages = 4
+        windows = []
+        end_prefetch = extraction_service._end_prefetch
+
+        def record_window(route_name: str, prefetcher: Any) -> None:
+            windows.append(prefetcher.window)
+            end_prefetch(route_name, prefetcher)
+
+        extraction_service._end_prefetch = record_window
+
+        # Act
+        items = extraction_service._fetch_paginated_data(
+            TransactionsRoute, {"token": "test", "account_id": "acc-1"}
+        )
+
+        # Assert
+        assert len({item["id"] for item in items}) == len(items)  # noqa: S101
+        # Full pages kept the window; only the last page halved it,
+        # though pages past it were requested and dropped.
+        assert windows == [2]  # noqa: S101
+        assert extraction_service._prefetch_windows["TransactionsRoute"] == 2  # noqa: S101
+
+    def test_incremental_sync_stops_at_known_transactions(
+        self,
+        extraction_service: Any,
+        mock_dependencies: dict[str, Any],
+        settings: Any,
+    ) -> None:
+        # Arrange
+        from django.core.cache import cache
+
+        settings.CACHES = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "incremental-sync-tests",
+            }
+        }
+        settings.OFDA_INCREMENTAL_SYNC = True
+        cache.clear()
+
+        def page(numbers: list[int], has_next: bool) -> Mock:
+            result = Mock()
+            result.success = True
+            result.response.json.return_value = {
+                "items": [
+                    {
+                        "id": f"tx-{number}",
+                        "transaction_type": "PIX",
+                        "transaction_status": "COMPLETED",
+                        "transaction_amount": 10.0,
+                        "transaction_direction": "out",
+                        "transaction_description": "Payment",
+                        "transaction_date": f"2025-01-{number:02d}T10:00:00Z",
+                    }
+                    for number in numbers
+                ],
+                "has_next": has_next,
+            }
+            return result
+
+        consent_data = Mock()
+        consent_data.id = "consent-123"
+        consent_data.token = "consent-token"
+        accounts = [{"id": "acc-1"}]
+        router = mock_dependencies["router"].router_process
+        router.side_effect = [page([3, 2], True), page([1], False)]
+        extraction_service._extract_transactions(
+            "12345678901", consent_data, accounts
+        )
+        router.reset_mock()
+        router.side_effect = [page([5, 4, 3], True)]
+
+        # Act
+        result = extraction_service._extract_transactions(
+            "12345678901", consent_data, accounts
+        )
+
+        # Assert
+        assert [t["transaction_id"] for t in result] == [  # noqa: S101
+            "tx-5",
+            "tx-4",
+            "tx-3",
+            "tx-2",
+            "tx-1",
+        ]
+        assert router.call_count == 1  # noqa: S101
+        snapshot = extraction_service.transaction_sync.load(
+            extraction_service.transaction_sync.key("12345678901", "acc-1")
+        )
+        assert snapshot["high_water"]["id"] == "tx-5"  # noqa: S101
+        cache.clear()
+
+    def test_incremental_sync_reads_on_past_a_page_out_of_order(
+        self,
+        extraction_service: Any,
+        mock_dependencies: dict[str, Any],
+        settings: Any,
+    ) -> None:
+        # Arrange
+        from django.core.cache import cache
+
+        settings.CACHES = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "incremental-sync-order-tests",
+            }
+        }
+        settings.OFDA_INCREMENTAL_SYNC = True
+        cache.clear()
+
+        def page(numbers: list[int], has_next: bool) -> Mock:
+            result = Mock()
+            result.success = True
+            result.response.json.return_value = {
+                "items": [
+                    {
+                        "id": f"tx-{number}",
+                        "transaction_type": "PIX",
+                        "transaction_status": "COMPLETED",
+                        "transaction_amount": 10.0,
+                        "transaction_direction": "out",
+                        "transaction_description": "Payment",
+                        "transaction_date": f"2025-01-{number:02d}T10:00:00Z",
+                    }
+                    for number in numbers
+                ],
+                "has_next": has_next,
+            }
+            return result
+
+        consent_data = Mock()
+        consent_data.id = "consent-123"
+        consent_data.token = "consent-token"
+        accounts = [{"id": "acc-1"}]
+        router = mock_dependencies["router"].router_process
+        router.side_effect = [page([3, 2], True), page([1], False)]
+        extraction_service._extract_transactions(
+            "12345678901", consent_data, accounts
+        )
+        router.reset_mock()
+        # tx-6 comes after known tx-3, so the page is not newest first
+        # and the next one may still hold new transactions.
+        router.side_effect = [page([5, 3, 6], True), page([4, 2], True)]
+
+        # Act
+        result = extraction_service._extract_transactions(
+            "12345678901", consent_data, accounts
+        )
+
+        # Assert
+        assert [t["transaction_id"] for t in result] == [  # noqa: S101
+            "tx-5",
+            "tx-6",
+            "tx-4",
+            "tx-3",
+            "tx-2",
+            "tx-1",
+        ]
+        assert router.call_count == 2  # noqa: S101
+        snapshot = extraction_service.transaction_sync.load(
+            extraction_service.transaction_sync.key("12345678901", "acc-1")
+        )
+        assert snapshot["high_water"]["id"] == "tx-6"  # noqa: S101
+        cache.clear()
+
+    def test_incremental_sync_saves_only_the_complete_accounts(
+        self,
+        extraction_service: Any,
+        mock_dependencies: dict[str, Any],
+        settings: Any,
+    ) -> None:
+        # Arrange
+        from django.core.cache import cache
+
+        settings.CACHES = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "incremental-sync-tests",
+            }
+        }
+        settings.OFDA_INCREMENTAL_SYNC = True
+        cache.clear()
+
+        def router_process(route: Any) -> Mock:
+            result = Mock()
+            # Every page of acc-2 fails, so its list is cut short.
+            result.success = route._account_id == "acc-1"
+            result.response.json.return_value = {
+                "items": [
+                    {
+                        "id": "tx-1",
+                        "transaction_type": "PIX",
+                        "transaction_status": "COMPLETED",
+                        "transaction_amount": 10.0,
+                        "transaction_direction": "out",
+                        "transaction_description": "Payment",
+                        "transaction_date": "2025-01-01T10:00:00Z",
+                    }
+                ],
+                "has_next": False,
+            }
+            return result
+
+        consent_data = Mock()
+        consent_data.id = "consent-123"
+        consent_data.token = "consent-token"
+        mock_dependencies["router"].router_process.side_effect = router_process
+        extraction_service.concurrency = 1
+
+        # Act
+        result = extraction_service._extract_transactions(
+            "12345678901", consent_data, [{"id": "acc-2"}, {"id": "acc-1"}]
+        )
+
+        # Assert
+        assert [t["account_id"] for t in result] == ["acc-1"]  # noqa: S101
+        sync = extraction_service.transaction_sync
+        assert sync.load(sync.key("12345678901", "acc-1")) is not None  # noqa: S101
+        assert sync.load(sync.key("12345678901", "acc-2")) is None  # noqa: S101
+        assert extraction_service.extraction_errors == [  # noqa: S101
+            (
+                "Missing TransactionsRoute pages from 1 for account acc-2: "
+                "page 1 was not fetched"
+            )
+        ]
+        cache.clear()
+
+    def test_extract_account_data_merges_account_errors_in_order(
+        self, extraction_service: Any, mock_dependencies: dict[str, Any]
+    ) -> None:
+        # Arrange
+        consent_data = Mock()
+        consent_data.id = "consent-123"
+        consent_data.token = "consent-token"
+        accounts = [{"id": f"acc-{index}"} for index in range(6)]
+        extraction_service.concurrency = 4
+
+        def router_process(route: Any) -> Mock:
+            index = int(route._account_id.split("-")[1])
+            # Earlier accounts answer last.
+            time.sleep(0.005 * (6 - index))
+            result = Mock()
+            result.success = True
+            result.response.json.return_value = {
+                "balance": 1.0,
+                "currency": "BRL",
+                "has_next": index % 2 == 0,
+                "items": [
+                    {
+                        "id": f"tx-{route._account_id}",
+                        "transaction_type": "PIX",
+                        "transaction_status": "COMPLETED",
+                        "transaction_amount": 1.0,
+                        "transaction_direction": "CREDIT",
+                        "transaction_description": "",
+                        "transaction_date": "2024-01-01",
+                    }
+                ],
+            }
+            return result
+
+        mock_dependencies["router"].router_process.side_effect = router_process
+        extraction_service.max_pages = 1
+
+        # Act
+        extraction_service._extract_account_data(
+            "12345678901", consent_data, accounts
+        )
+
+        # Assert
+        assert extraction_service.incomplete is True  # noqa: S101
+        assert extraction_service.extraction_errors == [  # noqa: S101
+            f"Missing TransactionsRoute pages from 2 for account acc-{index}: "
+            "page limit (1) reached"
+            for index in (0, 2, 4)
+        ]
+
+    def test_extract_financial_data_resumes_under_a_new_consent(
+        self,
+        extraction_service: Any,
+        mock_dependencies: dict[str, Any],
+        sample_accounts_response: dict[str, Any],
+        sample_balances_response: dict[str, Any],
+        settings: Any,
+    ) -> None:
+        # Arrange
+        from django.core.cache import cache
+
+        settings.CACHES = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "pagination-checkpoint-tests",
+            }
+        }
+        cache.clear()
+        mock_dependencies["cache"].get_cached_data.return_value = None
+
+        def consent(number: int) -> Mock:
+            consent_data = Mock()
+            consent_data.id = f"consent-{number}"
+            consent_data.token = f"consent-token-{number}"
+            return consent_data
+
+        mock_dependencies["consent"].get_or_create_consent.side_effect = [
+            consent(1),
+            consent(2),
+        ]
+        failing_pages = {2}
+        transaction_pages = []
+
+        def router_process(route: Any) -> Mock:
+            result = Mock()
+            result.success = True
+            name = route.__class__.__name__
+            if name == "AccountsRoute":
+                result.response.json.return_value = sample_accounts_response
+            elif name == "BalancesRoute":
+                result.response.json.return_value = sample_balances_response
+            else:
+                transaction_pages.append((route._account_id, route._page))
+                result.success = route._page not in failing_pages
+                result.response.json.return_value = {
+                    "items": [
+                        {
+                            "id": f"{route._account_id}-tx-{route._page}",
+                            "transaction_type": "PIX",
+                            "transaction_status": "COMPLETED",
+                            "transaction_amount": 10.0,
+                            "transaction_direction": "out",
+                            "transaction_description": "Payment",
+                            "transaction_date": "2025-01-01T10:00:00Z",
+                        }
+                    ],
+                    "has_next": route._page < 2,
+                }
+            return result
+
+        mock_dependencies["router"].router_process.side_effect = router_process
+        first = extraction_service.extract_financial_data(
+            "12345678901", "client_id", "token"
+        )
+        failing_pages.clear()
+        transaction_pages.clear()
+
+        # Act
+        second = extraction_service.extract_financial_data(
+            "12345678901", "client_id", "token"
+        )
+
+        # Assert
+        assert first.summary.errors  # noqa: S101
+        assert sorted(transaction_pages) == [  # noqa: S101
+            ("account-123", 2),
+            ("account-456", 2),
+        ]
+        assert second.summary.errors == []  # noqa: S101
+        assert [  # noqa: S101
+            [t.transaction_id for t in account.transactions]
+            for account in second.accounts
+        ] == [
+            ["account-123-tx-1", "account-123-tx-2"],
+            ["account-456-tx-1", "account-456-tx-2"],
+        ]
+        cache.clear()
@@ -0,0 +1,129 @@
+import threading
+import time
+from unittest.mock import Mock
+
+from src.financial.services.page_prefetcher import PagePrefetcher
+
+
+class TestPagePrefetcher:
+    def fetcher(self, requested: list[int], latency: float = 0.0):
+        lock = threading.Lock()
+
+        def fetch(page: int):
+            with lock:
+                requested.append(page)
+            time.sleep(latency)
+            return f"route-{page}", f"result-{page}"
+
+        return fetch
+
+    def test_pages_come_back_in_order_while_next_ones_are_requested(self):
+        # Arrange
+        requested: list[int] = []
+        prefetcher = PagePrefetcher(
+            self.fetcher(requested), window=2, max_window=2, last_page=10
+        )
+
+        # Act
+        first = prefetcher.get(1)
+        second = prefetcher.get(2)
+        in_flight = sorted(prefetcher._futures)
+        dropped = prefetcher.close()
+
+        # Assert
+        assert first == ("route-1", "result-1")
+        assert second == ("route-2", "result-2")
+        assert in_flight == [3, 4]
+        assert prefetcher.hits == 1
+        assert dropped == 2
+
+    def test_prefetching_stops_at_the_last_page(self):
+        # Arrange
+        requested: list[int] = []
+        prefetcher = PagePrefetcher(
+            self.fetcher(requested), window=4, max_window=4, last_page=2
+        )
+
+        # Act
+        prefetcher.get(1)
+        prefetcher.get(2)
+        prefetcher.close()
+
+        # Assert
+        assert sorted(requested) == [1, 2]
+
+    def test_window_grows_with_every_prefetched_page_used(self):
+        # Arrange
+        requested: list[int] = []
+        prefetcher = PagePrefetcher(
+            self.fetcher(requested), window=1, max_window=3, last_page=20
+        )
+
+        # Act
+        for page in range(1, 6):
+            prefetcher.get(page)
+        prefetcher.close()
+
+        # Assert
+        assert prefetcher.window == 3
+
+    def test_shrink_halves_the_window_down_to_one_page(self):
+        # Arrange
+        prefetcher = PagePrefetcher(
+            self.fetcher([]), window=4, max_window=4, last_page=20
+        )
+
+        # Act
+        prefetcher.shrink()
+        halved = prefetcher.window
+        prefetcher.shrink()
+        prefetcher.shrink()
+        prefetcher.close()
+
+        # Assert
+        assert halved == 2
+        assert prefetcher.window == 1
+
+    def test_failed_page_is_requested_again(self):
+        # Arrange
+        calls = Mock(side_effect=[ValueError("boom"), ("route", "result")])
+        prefetcher = PagePrefetcher(
+            lambda page: calls(page), window=1, max_window=1, last_page=1
+        )
+
+        # Act
+        try:
+            prefetcher.get(1)
+        except ValueError:
+            pass
+        result = prefetcher.get(1)
+        prefetcher.close()
+
+        # Assert
+        assert result == ("route", "result")
+        assert calls.call_count == 2
+
+    def test_dropped_pages_close_their_responses(self):
+        # Arrange
+        result = Mock()
+        started = threading.Event()
+        release = threading.Event()
+
+        def fetch(page: int):
+            if page > 1:
+                started.set()
+                release.wait()
+            return "route", result
+
+        prefetcher = PagePrefetcher(fetch, window=1, max_window=1, last_page=5)
+        prefetcher.get(1)
+        started.wait()
+
+        # Act
+        dropped = prefetcher.close()
+        release.set()
+        time.sleep(0.05)
+
+        # Assert
+        assert dropped == 1
+        result.response.close.assert_called_once()
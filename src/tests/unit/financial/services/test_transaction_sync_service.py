@@ -0,0 +1,130 @@
+from typing import Any
+
+import pytest
+
+from src.financial.services.transaction_sync_service import (
+    TransactionSyncService,
+)
+
+
+def transaction(number: int) -> dict[str, Any]:
+    return {
+        "account_id": "acc-1",
+        "transaction_id": f"tx-{number}",
+        "date": f"2025-01-{number:02d}T10:00:00Z",
+    }
+
+
+class TestTransactionSyncService:
+    @pytest.fixture
+    def transaction_sync(self, settings: Any) -> Any:
+        settings.CACHES = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "transaction-sync-tests",
+            }
+        }
+        settings.OFDA_INCREMENTAL_SYNC = True
+        from django.core.cache import cache
+
+        cache.clear()
+        yield TransactionSyncService()
+        cache.clear()
+
+    def test_save_keeps_the_newest_transaction_as_high_water_mark(
+        self, transaction_sync: Any
+    ) -> None:
+        # Arrange
+        key = transaction_sync.key("12345678901", "acc-1")
+
+        # Act
+        transaction_sync.save(key, [transaction(3), transaction(2)])
+
+        # Assert
+        snapshot = transaction_sync.load(key)
+        assert snapshot["high_water"] == {  # noqa: S101
+            "id": "tx-3",
+            "date": "2025-01-03T10:00:00Z",
+        }
+        assert len(snapshot["transactions"]) == 2  # noqa: S101
+
+    def test_save_takes_the_mark_from_the_latest_date_out_of_order(
+        self, transaction_sync: Any
+    ) -> None:
+        # Arrange
+        key = transaction_sync.key("12345678901", "acc-1")
+
+        # Act
+        transaction_sync.save(
+            key, [transaction(2), transaction(4), transaction(3)]
+        )
+
+        # Assert
+        snapshot = transaction_sync.load(key)
+        assert snapshot["high_water"]["id"] == "tx-4"  # noqa: S101
+
+    def test_disabled_neither_saves_nor_loads(
+        self, transaction_sync: Any, settings: Any
+    ) -> None:
+        # Arrange
+        key = transaction_sync.key("12345678901", "acc-1")
+        transaction_sync.save(key, [transaction(3)])
+        settings.OFDA_INCREMENTAL_SYNC = False
+
+        # Act & Assert
+        assert transaction_sync.load(key) is None  # noqa: S101
+        assert not transaction_sync.save(key, [transaction(4)])  # noqa: S101
+
+    def test_known_items_match_by_id_or_older_date(self) -> None:
+        # Arrange
+        snapshot = {
+            "high_water": {"id": "tx-3", "date": "2025-01-03T10:00:00Z"},
+            "transactions": [transaction(3), transaction(2)],
+        }
+
+        # Act
+        known = TransactionSyncService.is_known(snapshot)
+
+        # Assert
+        assert known({"id": "tx-2"})  # noqa: S101
+        assert known(  # noqa: S101
+            {"id": "tx-0", "transaction_date": "2025-01-01T10:00:00Z"}
+        )
+        assert not known(  # noqa: S101
+            {"id": "tx-4", "transaction_date": "2025-01-04T10:00:00Z"}
+        )
+        # Same date as the mark but not seen yet.
+        assert not known(  # noqa: S101
+            {"id": "tx-3b", "transaction_date": "2025-01-03T10:00:00Z"}
+        )
+
+    def test_in_order_expects_dates_newest_first(self) -> None:
+        # Arrange
+        newer = {"id": "tx-4", "transaction_date": "2025-01-04T10:00:00Z"}
+        older = {"id": "tx-3", "transaction_date": "2025-01-03T10:00:00"}
+
+        # Act & Assert
+        assert TransactionSyncService.in_order(newer, older)  # noqa: S101
+        assert not TransactionSyncService.in_order(older, newer)  # noqa: S101
+        assert TransactionSyncService.in_order(older, {"id": "tx-0"})  # noqa: S101
+
+    def test_merge_puts_new_transactions_first_without_duplicates(
+        self,
+    ) -> None:
+        # Arrange
+        snapshot = {
+            "high_water": {"id": "tx-3", "date": "2025-01-03T10:00:00Z"},
+            "transactions": [transaction(3), transaction(2)],
+        }
+
+        # Act
+        merged = TransactionSyncService.merge(
+            [transaction(4), transaction(3)], snapshot
+        )
+
+        # Assert
+        assert [t["transaction_id"] for t in merged] == [  # noqa: S101
+            "tx-4",
+            "tx-3",
+            "tx-2",
+        ]
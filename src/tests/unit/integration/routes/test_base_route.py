@@ -1,8 +1,11 @@
+import time
 from unittest.mock import Mock, patch
 
 import pytest
 import requests
 
+from src.core.utils.deadline import DeadlineExceededError, deadline_scope
+from src.financial.routes.balances import BalancesRoute
 from src.integration.dtos.integration_dtos import IntegrationResultDTO
 from src.integration.enums import RouteMethod
 from src.integration.routes.base import BaseRoute
@@ -47,7 +50,7 @@ class TestBaseRoute:
 
     def test_integrate_success(self, route, mock_response):
         # Arrange
-        with patch("requests.get", return_value=mock_response):
+        with patch("requests.Session.get", return_value=mock_response):
             # Act
             result = route.integrate()
 
@@ -62,7 +65,7 @@ class TestBaseRoute:
         error_response.ok = False
         error_response.status_code = 400
 
-        with patch("requests.get", return_value=error_response):
+        with patch("requests.Session.get", return_value=error_response):
             # Act
             result = route.integrate()
 
@@ -73,7 +76,9 @@ class TestBaseRoute:
 
     def test_execute_post(self, route, mock_response):
         # Arrange
-        with patch("requests.post", return_value=mock_response) as mock_post:
+        with patch(
+            "requests.Session.post", return_value=mock_response
+        ) as mock_post:
             # Act
             response = route.execute_post()
 
@@ -83,7 +88,9 @@ class TestBaseRoute:
 
     def test_execute_put(self, route, mock_response):
         # Arrange
-        with patch("requests.put", return_value=mock_response) as mock_put:
+        with patch(
+            "requests.Session.put", return_value=mock_response
+        ) as mock_put:
             # Act
             response = route.execute_put()
 
@@ -94,7 +101,7 @@ class TestBaseRoute:
     def test_execute_delete(self, route, mock_response):
         # Arrange
         with patch(
-            "requests.delete", return_value=mock_response
+            "requests.Session.delete", return_value=mock_response
         ) as mock_delete:
             # Act
             response = route.execute_delete()
@@ -109,7 +116,9 @@ class TestBaseRoute:
             return_value={"Authorization": "Bearer token"}
         )
 
-        with patch("requests.get", return_value=mock_response) as mock_get:
+        with patch(
+            "requests.Session.get", return_value=mock_response
+        ) as mock_get:
             # Act
             route.execute_get()
 
@@ -118,9 +127,215 @@ class TestBaseRoute:
             assert "headers" in call_kwargs
             assert call_kwargs["headers"]["Authorization"] == "Bearer token"
 
+    def test_execute_request_uses_remaining_deadline_as_timeout(
+        self, route, mock_response
+    ):
+        # Arrange
+        with (
+            patch(
+                "requests.Session.get", return_value=mock_response
+            ) as mock_get,
+            deadline_scope(2),
+        ):
+            # Act
+            route.execute_get()
+
+        # Assert
+        assert 0 < mock_get.call_args[1]["timeout"] <= 2
+
+    def test_execute_request_uses_policy_timeout(
+        self, route, mock_response, settings
+    ):
+        # Arrange
+        settings.OFDA_ROUTE_POLICIES = ["TestableRoute.timeout=7"]
+
+        with patch(
+            "requests.Session.get", return_value=mock_response
+        ) as mock_get:
+            # Act
+            route.execute_get()
+
+        # Assert
+        assert mock_get.call_args[1]["timeout"] == 7
+
+    def test_policy_can_turn_off_validator_cache(self, route, settings):
+        # Arrange
+        settings.OFDA_CONDITIONAL_GET = True
+        settings.OFDA_ROUTE_POLICIES = ["TestableRoute.cache_ttl=0"]
+
+        # Act / Assert
+        assert route.uses_validator_cache() is False
+
+    def test_only_hedged_routes_are_hedged(self, route, mock_response):
+        # Arrange
+        with (
+            patch("requests.Session.get", return_value=mock_response),
+            patch("src.integration.routes.base.hedging") as mock_hedging,
+        ):
+            # Act
+            route.execute_get()
+            BalancesRoute(
+                data={"account_id": "1", "operation": RouteMethod.GET}
+            ).execute_get()
+
+        # Assert
+        mock_hedging.run.assert_called_once()
+
+    def test_hedge_goes_to_another_endpoint_in_its_own_slot(
+        self, mock_response, settings
+    ):
+        # Arrange
+        from src.integration.services.bulkhead_service import bulkheads
+        from src.integration.services.hedging_service import HedgingService
+
+        settings.OFDA_HEDGING = True
+        settings.OFDA_HEDGE_MAX_RATIO = 1.0
+        settings.OFDA_RATE_LIMIT = 0
+        settings.OFDA_CONDITIONAL_GET = False
+        settings.OFDA_API_BASE_URLS = ["http://ofda-a", "http://ofda-b"]
+        hedging = HedgingService()
+        for _ in range(20):
+            hedging.record_latency("BalancesRoute", 0.01)
+        slow_response = Mock()
+        slow_response.raise_for_status.return_value = None
+        urls = []
+
+        def get(url, **kwargs):
+            urls.append(url)
+            if url.startswith("http://ofda-a"):
+                time.sleep(0.3)
+                return slow_response
+            return mock_response
+
+        route = BalancesRoute(
+            data={"account_id": "1", "operation": RouteMethod.GET}
+        )
+        route.endpoint = "http://ofda-a"
+        slots = bulkheads.for_route(route).stats()["calls"]
+
+        with (
+            patch("requests.Session.get", side_effect=get),
+            patch("src.integration.routes.base.hedging", hedging),
+        ):
+            # Act
+            response = route.execute_get()
+
+        # Assert
+        assert response is mock_response
+        assert [url.split("/")[2] for url in urls] == ["ofda-a", "ofda-b"]
+        assert bulkheads.for_route(route).stats()["calls"] == slots + 1
+        assert route.endpoint == "http://ofda-b"
+
+    def hedged_route(self, settings, endpoints):
+        from src.integration.services.hedging_service import HedgingService
+
+        settings.OFDA_HEDGING = True
+        settings.OFDA_HEDGE_MAX_RATIO = 1.0
+        settings.OFDA_RATE_LIMIT = 0
+        settings.OFDA_CONDITIONAL_GET = False
+        settings.OFDA_API_BASE_URLS = endpoints
+        hedging = HedgingService()
+        for _ in range(20):
+            hedging.record_latency("BalancesRoute", 0.01)
+        route = BalancesRoute(
+            data={"account_id": "1", "operation": RouteMethod.GET}
+        )
+        route.endpoint = endpoints[0]
+        return route, hedging
+
+    def test_hedge_skips_endpoints_with_an_open_circuit(
+        self, mock_response, settings
+    ):
+        # Arrange
+        route, hedging = self.hedged_route(
+            settings, ["http://ofda-a", "http://ofda-b", "http://ofda-c"]
+        )
+        urls = []
+
+        def get(url, **kwargs):
+            urls.append(url)
+            if url.startswith("http://ofda-a"):
+                time.sleep(0.3)
+            return mock_response
+
+        with (
+            patch("requests.Session.get", side_effect=get),
+            patch("src.integration.routes.base.hedging", hedging),
+            patch(
+                "src.integration.routes.base.circuit_breaker.is_open",
+                side_effect=lambda route, url: url == "http://ofda-b",
+            ),
+        ):
+            # Act
+            route.execute_get()
+
+        # Assert
+        assert [url.split("/")[2] for url in urls] == ["ofda-a", "ofda-c"]
+
+    def test_failed_hedge_counts_against_its_own_endpoint(
+        self, mock_response, settings
+    ):
+        # Arrange
+        from django.core.cache import cache
+
+        from src.integration.services.circuit_breaker_service import (
+            circuit_breaker,
+        )
+
+        settings.CACHES = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "hedge-tests",
+            }
+        }
+        settings.OFDA_CIRCUIT_BREAKER = True
+        route, hedging = self.hedged_route(
+            settings, ["http://ofda-a", "http://ofda-b"]
+        )
+        failed = Mock()
+        failed.status_code = 503
+        failed.raise_for_status.side_effect = requests.HTTPError(
+            "503 Server Error", response=failed
+        )
+
+        def get(url, **kwargs):
+            if url.startswith("http://ofda-a"):
+                time.sleep(0.3)
+                return mock_response
+            return failed
+
+        with (
+            patch("requests.Session.get", side_effect=get),
+            patch("src.integration.routes.base.hedging", hedging),
+        ):
+            # Act
+            response = route.execute_get()
+            states = circuit_breaker.states()
+        cache.clear()
+
+        # Assert
+        assert response is mock_response
+        assert route.endpoint == "http://ofda-a"
+        assert states["BalancesRoute@ofda-b"]["failures"] == 1
+        primary = states.get("BalancesRoute@ofda-a", {"failures": 0})
+        assert primary["failures"] == 0
+
+    def test_execute_request_fails_fast_after_deadline(self, route):
+        # Arrange
+        with (
+            patch("requests.Session.get") as mock_get,
+            deadline_scope(0),
+        ):
+            # Act & Assert
+            with pytest.raises(DeadlineExceededError):
+                route.execute_get()
+            mock_get.assert_not_called()
+
     def test_execute_request_with_json_payload(self, route, mock_response):
         # Arrange
-        with patch("requests.post", return_value=mock_response) as mock_post:
+        with patch(
+            "requests.Session.post", return_value=mock_response
+        ) as mock_post:
             # Act
             route.execute_post()
 
@@ -132,7 +347,7 @@ class TestBaseRoute:
     def test_execute_request_network_error(self, route):
         # Arrange
         with patch(
-            "requests.get",
+            "requests.Session.get",
             side_effect=requests.ConnectionError("Network error"),
         ):
             # Act & Assert
@@ -0,0 +1,100 @@
+import threading
+import time
+
+import pytest
+
+from src.integration.services.bulkhead_service import BulkheadService
+from src.integration.services.concurrency_limiter_service import (
+    BulkheadFullError,
+)
+
+
+class TransactionsRoute:
+    traffic_class = "transactions"
+
+
+class ConsentRoute:
+    traffic_class = "consent"
+
+
+class TestBulkheadService:
+    @pytest.fixture
+    def bulkheads(self, settings):
+        settings.OFDA_ADAPTIVE_CONCURRENCY = True
+        settings.OFDA_CONCURRENCY_INITIAL_LIMIT = 20
+        settings.OFDA_CONCURRENCY_MAX_LIMIT = 100
+        settings.OFDA_BULKHEAD_LIMITS = ["consent=2", "transactions=1"]
+        settings.OFDA_BULKHEAD_QUEUE_TIMEOUTS = ["transactions=0.05"]
+        return BulkheadService()
+
+    def hold_slot(self, limiter):
+        holding = threading.Event()
+        release = threading.Event()
+
+        def hold():
+            with limiter.slot():
+                holding.set()
+                release.wait()
+
+        thread = threading.Thread(target=hold)
+        thread.start()
+        holding.wait()
+        return thread, release
+
+    def test_limits_come_from_settings(self, bulkheads):
+        # Act
+        consent = bulkheads.for_route(ConsentRoute())
+        transactions = bulkheads.for_route(TransactionsRoute())
+        default = bulkheads.get("default")
+
+        # Assert
+        assert consent.limit == 2
+        assert transactions.limit == 1
+        assert transactions.queue_timeout == 0.05
+        assert consent.queue_timeout is None
+        assert default.limit == 20
+        assert bulkheads.for_route(ConsentRoute()) is consent
+
+    def test_saturated_class_does_not_block_another(self, bulkheads):
+        # Arrange
+        transactions = bulkheads.for_route(TransactionsRoute())
+        thread, release = self.hold_slot(transactions)
+
+        # Act
+        started = time.monotonic()
+        try:
+            with bulkheads.for_route(ConsentRoute()).slot():
+                elapsed = time.monotonic() - started
+        finally:
+            release.set()
+            thread.join()
+
+        # Assert
+        assert elapsed < 0.05
+
+    def test_queue_timeout_rejects_the_call(self, bulkheads):
+        # Arrange
+        transactions = bulkheads.for_route(TransactionsRoute())
+        thread, release = self.hold_slot(transactions)
+
+        # Act / Assert
+        try:
+            with pytest.raises(BulkheadFullError), transactions.slot():
+                pass
+        finally:
+            release.set()
+            thread.join()
+        assert bulkheads.stats()["transactions"]["rejected"] == 1
+
+    def test_stats_are_listed_per_class(self, bulkheads):
+        # Arrange
+        with bulkheads.for_route(ConsentRoute()).slot():
+            pass
+
+        # Act
+        stats = bulkheads.stats()
+
+        # Assert
+        assert list(stats) == ["consent"]
+        assert stats["consent"]["calls"] == 1
+        assert stats["consent"]["max_limit"] == 2
@@ -0,0 +1,218 @@
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from src.integration.services.circuit_breaker_service import (
+    CircuitBreakerService,
+    CircuitOpenError,
+)
+from src.integration.services.router_service import RouterService
+
+
+class AccountsRoute:
+    def get_base_url(self):
+        return "https://ofda.example.com/v1"
+
+
+def server_error(status_code=503):
+    response = Mock()
+    response.status_code = status_code
+    return requests.HTTPError(f"{status_code} Server Error", response=response)
+
+
+class TestCircuitBreakerService:
+    @pytest.fixture(autouse=True)
+    def locmem_cache(self, settings):
+        settings.CACHES = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "circuit-breaker-tests",
+            }
+        }
+        settings.OFDA_CIRCUIT_BREAKER = True
+        settings.OFDA_CIRCUIT_FAILURE_THRESHOLD = 3
+        settings.OFDA_CIRCUIT_OPEN_SECONDS = 30
+        yield
+        from django.core.cache import cache
+
+        cache.clear()
+
+    @pytest.fixture
+    def breaker(self):
+        return CircuitBreakerService()
+
+    def fail(self, breaker, route, exc):
+        with pytest.raises(type(exc)), breaker.guard(route):
+            raise exc
+
+    def expire_open_period(self, breaker, route):
+        from django.core.cache import cache
+
+        circuit = breaker.circuit_name(route)
+        cache.delete(breaker._key(circuit, "open_until"))
+        # As seen once the worker's local view of the circuit is refreshed.
+        breaker._read_state(circuit, refresh=True)
+
+    def test_opens_after_threshold_failures(self, breaker):
+        # Arrange
+        route = AccountsRoute()
+
+        # Act
+        for _ in range(3):
+            self.fail(breaker, route, server_error())
+
+        # Assert
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_call(route)
+        assert exc_info.value.circuit == "AccountsRoute@ofda.example.com"
+        states = breaker.states()
+        assert states["AccountsRoute@ofda.example.com"]["state"] == "open"
+
+    def test_open_circuit_is_shared_between_workers(self, breaker):
+        # Arrange
+        route = AccountsRoute()
+        other_worker = CircuitBreakerService()
+
+        # Act
+        for _ in range(3):
+            self.fail(breaker, route, server_error())
+
+        # Assert
+        with pytest.raises(CircuitOpenError):
+            other_worker.before_call(route)
+        states = other_worker.states()
+        assert states["AccountsRoute@ofda.example.com"]["state"] == "open"
+
+    def test_client_errors_do_not_count(self, breaker):
+        # Arrange
+        route = AccountsRoute()
+
+        # Act
+        for _ in range(5):
+            self.fail(breaker, route, server_error(404))
+
+        # Assert
+        circuit, state = breaker.before_call(route)
+        assert state == "closed"
+        assert breaker.states()[circuit]["failures"] == 0
+
+    def test_half_open_lets_one_probe_through_and_closes(self, breaker):
+        # Arrange
+        route = AccountsRoute()
+        for _ in range(3):
+            self.fail(breaker, route, server_error())
+
+        self.expire_open_period(breaker, route)
+
+        # Act
+        circuit, state = breaker.before_call(route)
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call(route)
+        breaker.record_success(circuit, state)
+
+        # Assert
+        assert state == "half_open"
+        assert breaker.states()[circuit]["state"] == "closed"
+
+    def test_failed_probe_opens_the_circuit_again(self, breaker):
+        # Arrange
+        route = AccountsRoute()
+        for _ in range(3):
+            self.fail(breaker, route, server_error())
+
+        self.expire_open_period(breaker, route)
+
+        # Act
+        circuit, state = breaker.before_call(route)
+        breaker.record_failure(circuit, state, server_error())
+
+        # Assert
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call(route)
+
+    def test_client_error_of_the_probe_hands_it_to_the_next_call(
+        self, breaker
+    ):
+        # Arrange
+        route = AccountsRoute()
+        for _ in range(3):
+            self.fail(breaker, route, server_error())
+
+        self.expire_open_period(breaker, route)
+
+        # Act
+        self.fail(breaker, route, server_error(404))
+        _, state = breaker.before_call(route)
+
+        # Assert
+        assert state == "half_open"
+
+    def test_state_is_read_from_the_cache_once_per_refresh_interval(
+        self, breaker
+    ):
+        # Arrange
+        route = AccountsRoute()
+
+        # Act
+        with patch(
+            "src.integration.services.circuit_breaker_service.cache"
+        ) as cache:
+            cache.get_many.return_value = {}
+            for _ in range(5):
+                breaker.is_open(route)
+                breaker.before_call(route)
+
+        # Assert
+        assert cache.get_many.call_count == 1
+
+    def test_cache_errors_leave_the_circuit_closed(self, breaker):
+        # Arrange
+        route = AccountsRoute()
+
+        # Act
+        with patch(
+            "src.integration.services.circuit_breaker_service.cache"
+        ) as cache:
+            cache.get_many.side_effect = ConnectionError("redis down")
+            cache.incr.side_effect = ConnectionError("redis down")
+            for _ in range(5):
+                self.fail(breaker, route, server_error())
+            circuit, state = breaker.before_call(route)
+
+        # Assert
+        assert state == "closed"
+
+    def test_disabled_breaker_never_opens(self, breaker, settings):
+        # Arrange
+        settings.OFDA_CIRCUIT_BREAKER = False
+        route = AccountsRoute()
+
+        # Act
+        for _ in range(5):
+            self.fail(breaker, route, server_error())
+
+        # Assert
+        assert breaker.before_call(route) == (None, "closed")
+
+    def test_router_fails_fast_while_open(self, breaker):
+        # Arrange
+        route = Mock()
+        route.__class__ = AccountsRoute
+        route.get_base_url.return_value = "https://ofda.example.com/v1"
+        route.integrate.side_effect = requests.ConnectionError("refused")
+        router_service = RouterService()
+
+        # Act
+        with (
+            patch(
+                "src.integration.services.router_service.circuit_breaker",
+                breaker,
+            ),
+            patch("src.core.utils.retry.time.sleep"),
+        ):
+            with pytest.raises(CircuitOpenError):
+                router_service.router_process(route)
+
+        # Assert
+        assert route.integrate.call_count == 3
@@ -0,0 +1,149 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from src.core.utils.deadline import DeadlineExceededError, deadline_scope
+from src.integration.services.concurrency_limiter_service import (
+    ConcurrencyLimiterService,
+)
+
+
+class TestConcurrencyLimiterService:
+    @pytest.fixture
+    def limiter(self, settings):
+        settings.OFDA_ADAPTIVE_CONCURRENCY = True
+        settings.OFDA_CONCURRENCY_INITIAL_LIMIT = 4
+        settings.OFDA_CONCURRENCY_MIN_LIMIT = 1
+        settings.OFDA_CONCURRENCY_MAX_LIMIT = 8
+        settings.OFDA_CONCURRENCY_LATENCY_TOLERANCE = 2.0
+        return ConcurrencyLimiterService()
+
+    def run_calls(self, limiter, calls, concurrency, latency):
+        def worker():
+            for _ in range(calls):
+                with limiter.slot():
+                    time.sleep(latency)
+
+        threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def test_limit_grows_while_fully_used_and_fast(self, limiter, settings):
+        # Arrange
+        settings.OFDA_CONCURRENCY_LATENCY_TOLERANCE = 100
+
+        # Act
+        self.run_calls(limiter, calls=10, concurrency=6, latency=0.002)
+
+        # Assert
+        stats = limiter.stats()
+        assert stats["limit"] > 4
+        assert stats["increases"] > 0
+        assert stats["in_flight"] == 0
+
+    def test_limit_does_not_grow_when_unused(self, limiter, settings):
+        # Arrange
+        settings.OFDA_CONCURRENCY_LATENCY_TOLERANCE = 100
+
+        # Act
+        self.run_calls(limiter, calls=20, concurrency=1, latency=0.001)
+
+        # Assert
+        assert limiter.limit == 4
+
+    def test_retryable_errors_cut_the_limit(self, limiter):
+        # Arrange
+        response = requests.Response()
+        response.status_code = 503
+
+        # Act
+        with (
+            pytest.raises(requests.HTTPError),
+            limiter.slot(),
+        ):
+            raise requests.HTTPError(response=response)
+
+        # Assert
+        assert limiter.limit == 3
+        assert limiter.stats()["decreases"] == 1
+
+    def test_client_errors_leave_the_limit_alone(self, limiter):
+        # Arrange
+        response = requests.Response()
+        response.status_code = 404
+
+        # Act
+        with (
+            pytest.raises(requests.HTTPError),
+            limiter.slot(),
+        ):
+            raise requests.HTTPError(response=response)
+
+        # Assert
+        assert limiter.limit == 4
+
+    def test_slow_answers_cut_the_limit(self, limiter):
+        # Arrange
+        self.run_calls(limiter, calls=10, concurrency=1, latency=0.001)
+
+        # Act
+        with limiter.slot():
+            time.sleep(0.02)
+
+        # Assert
+        assert limiter.limit == 3
+
+    def test_calls_over_the_limit_wait_for_a_slot(self, limiter, settings):
+        # Arrange
+        settings.OFDA_CONCURRENCY_INITIAL_LIMIT = 2
+        limiter = ConcurrencyLimiterService()
+        peak = 0
+        lock = threading.Lock()
+
+        def call():
+            nonlocal peak
+            with limiter.slot():
+                with lock:
+                    peak = max(peak, limiter.stats()["in_flight"])
+                time.sleep(0.01)
+
+        # Act
+        threads = [threading.Thread(target=call) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert peak <= 3
+        assert limiter.stats()["queued"] > 0
+
+    def test_waiting_stops_at_the_deadline(self, limiter, settings):
+        # Arrange
+        settings.OFDA_CONCURRENCY_INITIAL_LIMIT = 1
+        limiter = ConcurrencyLimiterService()
+        release = threading.Event()
+
+        def hold_slot():
+            with limiter.slot():
+                release.wait()
+
+        holder = threading.Thread(target=hold_slot)
+        holder.start()
+        time.sleep(0.01)
+
+        # Act / Assert
+        try:
+            with (
+                deadline_scope(0.05),
+                pytest.raises(DeadlineExceededError),
+                limiter.slot(),
+            ):
+                pass
+        finally:
+            release.set()
+            holder.join()
@@ -0,0 +1,149 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from src.integration.services.connection_pool_service import (
+    ConnectionPoolService,
+)
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestConnectionPoolService:
+    @pytest.fixture
+    def pool_service(self):
+        service = ConnectionPoolService()
+        yield service
+        service.close_all()
+
+    @pytest.fixture
+    def local_server(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        thread = threading.Thread(
+            target=server.serve_forever, args=(0.05,), daemon=True
+        )
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+        server.shutdown()
+        server.server_close()
+
+    def test_get_session_reuses_session_per_host(self, pool_service):
+        # Act
+        first = pool_service.get_session("http://test-api.com/account")
+        second = pool_service.get_session("http://test-api.com/consent/")
+        other = pool_service.get_session("http://other-api.com/account")
+
+        # Assert
+        assert first is second
+        assert first is not other
+
+    def test_traffic_classes_get_their_own_sized_session(
+        self, pool_service, settings
+    ):
+        # Arrange
+        settings.OFDA_BULKHEAD_LIMITS = ["transactions=16"]
+        settings.OFDA_HTTP_POOL_MAXSIZE = 10
+
+        # Act
+        default = pool_service.get_session("http://test-api.com/account")
+        transactions = pool_service.get_session(
+            "http://test-api.com/transactions", "transactions"
+        )
+        consent = pool_service.get_session(
+            "http://test-api.com/consent", "consent"
+        )
+
+        # Assert
+        assert transactions is not default
+        assert consent is not default
+        assert transactions.get_adapter("http://")._pool_maxsize == 16
+        assert consent.get_adapter("http://")._pool_maxsize == 10
+        assert set(pool_service.stats()) == {
+            "http://test-api.com",
+            "http://test-api.com [consent]",
+            "http://test-api.com [transactions]",
+        }
+
+    def test_get_session_resets_pools_after_fork(self, pool_service):
+        # Arrange
+        session = pool_service.get_session("http://test-api.com/account")
+
+        # Act
+        with patch(
+            "src.integration.services.connection_pool_service.os.getpid",
+            return_value=pool_service._pid + 1,
+        ):
+            forked_session = pool_service.get_session(
+                "http://test-api.com/account"
+            )
+
+        # Assert
+        assert forked_session is not session
+
+    def test_stats_counts_reused_connections(self, pool_service, local_server):
+        # Arrange
+        session = pool_service.get_session(local_server)
+
+        # Act
+        for _ in range(5):
+            session.get(f"{local_server}/account").raise_for_status()
+        stats = pool_service.stats()
+
+        # Assert
+        host_stats = stats[local_server]
+        assert host_stats["requests"] == 5
+        assert host_stats["connections_opened"] == 1
+        assert host_stats["connections_reused"] == 4
+
+    def test_prewarm_opens_connections_reused_by_requests(
+        self, pool_service, local_server
+    ):
+        # Act
+        opened = pool_service.prewarm(local_server, 2)
+        session = pool_service.get_session(local_server)
+        for _ in range(3):
+            session.get(f"{local_server}/account").raise_for_status()
+        stats = pool_service.stats()
+
+        # Assert
+        assert opened == 2
+        assert stats[local_server]["connections_opened"] == 2
+        assert stats[local_server]["requests"] == 3
+
+    def test_prewarm_is_capped_by_pool_maxsize(
+        self, pool_service, local_server, settings
+    ):
+        # Arrange
+        settings.OFDA_HTTP_POOL_MAXSIZE = 1
+
+        # Act
+        opened = pool_service.prewarm(local_server, 5)
+
+        # Assert
+        assert opened == 1
+
+    def test_prewarm_unreachable_host_opens_nothing(self, pool_service):
+        # Act
+        opened = pool_service.prewarm("http://127.0.0.1:9", 2)
+
+        # Assert
+        assert opened == 0
+
+    def test_stats_empty_without_sessions(self, pool_service):
+        # Act & Assert
+        assert pool_service.stats() == {}
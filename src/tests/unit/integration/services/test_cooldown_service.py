@@ -0,0 +1,118 @@
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from src.core.utils.deadline import deadline_scope
+from src.integration.services.cooldown_service import (
+    CooldownError,
+    CooldownService,
+)
+
+
+class BalancesRoute:
+    def get_base_url(self):
+        return "https://ofda.example.com/v1"
+
+
+def throttled(retry_after="2", status_code=429):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers["Retry-After"] = retry_after
+    return requests.HTTPError(f"{status_code} error", response=response)
+
+
+class TestCooldownService:
+    @pytest.fixture(autouse=True)
+    def locmem_cache(self, settings):
+        settings.CACHES = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "cooldown-tests",
+            }
+        }
+        from django.core.cache import cache
+
+        cache.clear()
+        yield
+        cache.clear()
+
+    @pytest.fixture
+    def cooldowns(self, settings):
+        settings.OFDA_RETRY_AFTER_COOLDOWN = True
+        settings.OFDA_COOLDOWN_MAX_SECONDS = 300
+        settings.OFDA_COOLDOWN_MAX_WAIT = 30
+        return CooldownService()
+
+    def test_retry_after_starts_a_cooldown(self, cooldowns):
+        # Act
+        with (
+            pytest.raises(requests.HTTPError),
+            cooldowns.guard(BalancesRoute()),
+        ):
+            raise throttled("2")
+
+        # Assert
+        assert 1 < cooldowns.remaining(BalancesRoute()) <= 2
+        assert (
+            cooldowns.stats()["BalancesRoute@ofda.example.com"]["cooldowns"]
+            == 1
+        )
+
+    def test_cooldown_is_shared_between_workers(self, cooldowns):
+        # Arrange
+        other_worker = CooldownService()
+
+        # Act
+        cooldowns.record(BalancesRoute(), throttled("5", 503))
+
+        # Assert
+        assert other_worker.remaining(BalancesRoute()) > 4
+
+    def test_errors_without_retry_after_are_ignored(self, cooldowns):
+        # Act
+        cooldowns.record(BalancesRoute(), throttled("2", 500))
+        cooldowns.record(BalancesRoute(), requests.ConnectionError())
+
+        # Assert
+        assert cooldowns.remaining(BalancesRoute()) == 0
+
+    def test_calls_wait_out_the_cooldown(self, cooldowns):
+        # Arrange
+        cooldowns.record(BalancesRoute(), throttled("2"))
+
+        # Act
+        with patch(
+            "src.integration.services.cooldown_service.time.sleep"
+        ) as mock_sleep:
+            with cooldowns.guard(BalancesRoute()):
+                pass
+
+        # Assert
+        assert 1 < mock_sleep.call_args.args[0] <= 2
+        stats = cooldowns.stats()["BalancesRoute@ofda.example.com"]
+        assert stats["waits"] == 1
+
+    def test_waits_longer_than_the_deadline_fail_fast(self, cooldowns):
+        # Arrange
+        cooldowns.record(BalancesRoute(), throttled("20"))
+
+        # Act / Assert
+        with (
+            deadline_scope(1),
+            pytest.raises(CooldownError),
+            cooldowns.guard(BalancesRoute()),
+        ):
+            pass
+        stats = cooldowns.stats()["BalancesRoute@ofda.example.com"]
+        assert stats["rejected"] == 1
+
+    def test_cooldown_is_capped(self, cooldowns, settings):
+        # Arrange
+        settings.OFDA_COOLDOWN_MAX_SECONDS = 10
+
+        # Act
+        cooldowns.record(BalancesRoute(), throttled("3600"))
+
+        # Assert
+        assert cooldowns.remaining(BalancesRoute()) <= 10
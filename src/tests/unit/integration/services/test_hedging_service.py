@@ -0,0 +1,156 @@
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.integration.services.hedging_service import HedgingService
+
+
+class BalancesRoute:
+    pass
+
+
+class TestHedgingService:
+    @pytest.fixture
+    def hedging(self, settings):
+        settings.OFDA_HEDGING = True
+        settings.OFDA_HEDGE_PERCENTILE = 95
+        settings.OFDA_HEDGE_MAX_RATIO = 1.0
+        settings.OFDA_RATE_LIMIT = 0
+        service = HedgingService()
+        for _ in range(20):
+            service.record_latency("BalancesRoute", 0.01)
+        return service
+
+    def slow_then_fast(self, responses):
+        calls = []
+        lock = threading.Lock()
+
+        def call():
+            with lock:
+                calls.append(len(calls))
+                attempt = len(calls) - 1
+            if attempt == 0:
+                time.sleep(0.3)
+            return responses[attempt]
+
+        return call, calls
+
+    def test_disabled_calls_directly(self, hedging, settings):
+        # Arrange
+        settings.OFDA_HEDGING = False
+        call = Mock(return_value="response")
+
+        # Act
+        result = hedging.run(BalancesRoute(), call)
+
+        # Assert
+        assert result == "response"
+        assert hedging.stats() == {}
+
+    def test_no_hedge_until_latencies_are_known(self, settings):
+        # Arrange
+        settings.OFDA_HEDGING = True
+        service = HedgingService()
+        call = Mock(return_value="response")
+
+        # Act
+        result = service.run(BalancesRoute(), call)
+
+        # Assert
+        assert result == "response"
+        assert service.delay("BalancesRoute") is None
+        assert service.stats()["BalancesRoute"]["hedged"] == 0
+
+    def test_slow_call_is_hedged_and_loser_closed(self, hedging):
+        # Arrange
+        slow, fast = Mock(), Mock()
+        call, calls = self.slow_then_fast([slow, fast])
+
+        # Act
+        started = time.monotonic()
+        result = hedging.run(BalancesRoute(), call)
+        elapsed = time.monotonic() - started
+        time.sleep(0.4)
+
+        # Assert
+        assert result is fast
+        assert elapsed < 0.2
+        assert len(calls) == 2
+        slow.close.assert_called_once()
+        fast.close.assert_not_called()
+        stats = hedging.stats()["BalancesRoute"]
+        assert stats["hedged"] == 1
+        assert stats["hedge_wins"] == 1
+
+    def test_hedges_are_capped_by_the_ratio(self, hedging, settings):
+        # Arrange
+        settings.OFDA_HEDGE_MAX_RATIO = 0.05
+        call, calls = self.slow_then_fast([Mock(), Mock()])
+
+        # Act
+        hedging.run(BalancesRoute(), call)
+
+        # Assert
+        assert len(calls) == 1
+        assert hedging.stats()["BalancesRoute"]["hedged"] == 0
+
+    def test_failed_attempt_falls_back_to_the_other(self, hedging):
+        # Arrange
+        attempts = []
+
+        def call():
+            attempts.append(len(attempts))
+            if len(attempts) == 1:
+                time.sleep(0.05)
+                raise ConnectionError("reset")
+            time.sleep(0.1)
+            return "response"
+
+        # Act
+        result = hedging.run(BalancesRoute(), call)
+
+        # Assert
+        assert result == "response"
+        assert len(attempts) == 2
+
+    def test_error_of_the_first_call_is_raised_when_both_fail(self, hedging):
+        # Arrange
+        def call():
+            time.sleep(0.3)
+            raise ConnectionError("primary")
+
+        def hedge_call():
+            raise ConnectionError("hedge")
+
+        # Act & Assert
+        with pytest.raises(ConnectionError, match="primary"):
+            hedging.run(BalancesRoute(), call, hedge_call)
+
+    def test_hedge_call_sends_the_second_copy(self, hedging):
+        # Arrange
+        call, calls = self.slow_then_fast(["slow"])
+
+        # Act
+        result = hedging.run(BalancesRoute(), call, lambda: "hedge")
+
+        # Assert
+        assert result == "hedge"
+        assert len(calls) == 1
+
+    def test_calls_do_not_queue_behind_hedges(self, hedging, settings):
+        # Arrange
+        settings.OFDA_HEDGE_MAX_WORKERS = 1
+        release = threading.Event()
+        hedging._get_hedge_executor().submit(release.wait, 5)
+
+        # Act
+        started = time.monotonic()
+        result = hedging.run(BalancesRoute(), lambda: "response")
+        elapsed = time.monotonic() - started
+        release.set()
+
+        # Assert
+        assert result == "response"
+        assert elapsed < 1
@@ -0,0 +1,132 @@
+import time
+
+import pytest
+import requests
+
+from src.integration.services.load_balancer_service import (
+    LoadBalancerService,
+)
+
+FAST = "http://fast.example.com"
+SLOW = "http://slow.example.com"
+
+
+def server_error():
+    response = requests.Response()
+    response.status_code = 503
+    return requests.HTTPError("503 error", response=response)
+
+
+class TestLoadBalancerService:
+    @pytest.fixture
+    def balancer(self, settings):
+        settings.OFDA_API_BASE_URLS = [FAST, SLOW]
+        settings.OFDA_LB_EJECT_FAILURES = 2
+        settings.OFDA_LB_EJECT_SECONDS = 30
+        settings.OFDA_LB_SLOW_START_SECONDS = 30
+        return LoadBalancerService()
+
+    def call(self, balancer, url, latency=0.0, error=None):
+        try:
+            with balancer.track(f"{url}/account"):
+                time.sleep(latency)
+                if error is not None:
+                    raise error
+        except Exception:  # noqa: S110 - failures are what is measured
+            pass
+
+    def test_single_url_is_used_as_is(self, settings):
+        # Arrange
+        settings.OFDA_API_BASE_URLS = []
+        settings.OFDA_API_BASE_URL = "http://only.example.com"
+        balancer = LoadBalancerService()
+
+        # Act
+        url = balancer.choose()
+        self.call(balancer, url)
+
+        # Assert
+        assert url == "http://only.example.com"
+        assert balancer.stats() == {}
+
+    def test_prefers_the_faster_endpoint(self, balancer):
+        # Arrange
+        self.call(balancer, FAST, latency=0.001)
+        self.call(balancer, SLOW, latency=0.03)
+
+        # Act
+        choices = [balancer.choose() for _ in range(20)]
+
+        # Assert
+        assert set(choices) == {FAST}
+
+    def test_prefers_the_endpoint_with_fewer_calls_in_flight(self, balancer):
+        # Arrange
+        self.call(balancer, FAST, latency=0.001)
+        self.call(balancer, SLOW, latency=0.001)
+
+        # Act
+        with balancer.track(f"{FAST}/account"), balancer.track(FAST):
+            choice = balancer.choose()
+
+        # Assert
+        assert choice == SLOW
+
+    def test_failing_endpoint_is_ejected(self, balancer):
+        # Act
+        self.call(balancer, SLOW, error=server_error())
+        self.call(balancer, SLOW, error=server_error())
+
+        # Assert
+        assert {balancer.choose() for _ in range(10)} == {FAST}
+        stats = balancer.stats()[SLOW]
+        assert stats["ejected"] is True
+        assert stats["failures"] == 2
+
+    def test_client_errors_do_not_eject(self, balancer):
+        # Arrange
+        response = requests.Response()
+        response.status_code = 404
+        not_found = requests.HTTPError("404 error", response=response)
+
+        # Act
+        for _ in range(3):
+            self.call(balancer, SLOW, error=not_found)
+
+        # Assert
+        assert balancer.stats()[SLOW]["ejected"] is False
+
+    def test_last_endpoint_is_never_ejected(self, balancer):
+        # Arrange
+        for _ in range(2):
+            self.call(balancer, SLOW, error=server_error())
+
+        # Act
+        for _ in range(2):
+            self.call(balancer, FAST, error=server_error())
+
+        # Assert
+        assert balancer.stats()[FAST]["ejected"] is False
+        assert balancer.choose() == FAST
+
+    def test_readmitted_endpoint_starts_slowly(self, balancer, settings):
+        # Arrange
+        settings.OFDA_LB_EJECT_SECONDS = 0.01
+        for _ in range(2):
+            self.call(balancer, SLOW, error=server_error())
+
+        # Act
+        time.sleep(0.02)
+        stats = balancer.stats()[SLOW]
+
+        # Assert
+        assert stats["ejected"] is False
+        assert stats["ejections"] == 1
+        assert 0 < stats["weight"] < 1
+
+    def test_unavailable_endpoints_are_skipped(self, balancer):
+        # Act
+        choices = {balancer.choose(lambda url: url != FAST) for _ in range(10)}
+
+        # Assert
+        assert choices == {SLOW}
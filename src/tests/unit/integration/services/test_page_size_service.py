@@ -0,0 +1,92 @@
+import pytest
+
+from src.integration.services.page_size_service import PageSizeService
+
+
+class TestPageSizeService:
+    @pytest.fixture
+    def page_sizes(self, settings):
+        settings.OFDA_ROUTE_POLICIES = []
+        settings.OFDA_PAGE_SIZE = 100
+        settings.OFDA_PAGE_SIZE_MIN = 10
+        settings.OFDA_PAGE_SIZE_MAX = 500
+        settings.OFDA_PAGE_TARGET_SECONDS = 1.0
+        settings.OFDA_PAGE_MAX_BYTES = 1000
+        return PageSizeService()
+
+    def test_fast_full_page_doubles_the_size(self, page_sizes):
+        # Act
+        page_sizes.record("TransactionsRoute", 100, 100, 0.2, 300)
+
+        # Assert
+        assert page_sizes.size("TransactionsRoute") == 200
+        assert page_sizes.stats()["TransactionsRoute"] == {
+            "size": 200,
+            "pages": 1,
+            "increases": 1,
+            "decreases": 0,
+        }
+
+    def test_short_or_moderate_pages_keep_the_size(self, page_sizes):
+        # Act
+        page_sizes.record("TransactionsRoute", 100, 40, 0.1, 100)
+        page_sizes.record("TransactionsRoute", 100, 100, 0.8, 300)
+        page_sizes.record("TransactionsRoute", 100, 100, 0.2, 800)
+
+        # Assert
+        assert page_sizes.size("TransactionsRoute") == 100
+        assert page_sizes.stats()["TransactionsRoute"]["pages"] == 3
+
+    @pytest.mark.parametrize(
+        "seconds, content_bytes", [(1.5, 300), (0.2, 2000)]
+    )
+    def test_slow_or_large_page_halves_the_size(
+        self, page_sizes, seconds, content_bytes
+    ):
+        # Act
+        page_sizes.record(
+            "TransactionsRoute", 100, 100, seconds, content_bytes
+        )
+
+        # Assert
+        assert page_sizes.size("TransactionsRoute") == 50
+        assert page_sizes.stats()["TransactionsRoute"]["decreases"] == 1
+
+    def test_size_stays_within_bounds(self, page_sizes, settings):
+        # Arrange
+        settings.OFDA_PAGE_SIZE_MAX = 150
+
+        # Act
+        page_sizes.record("TransactionsRoute", 100, 100, 0.1, None)
+        page_sizes.record("TransactionsRoute", 150, 150, 0.1, None)
+        page_sizes.record("AccountsRoute", 100, 100, 5.0, None)
+        page_sizes.record("AccountsRoute", 50, 50, 5.0, None)
+        page_sizes.record("AccountsRoute", 25, 25, 5.0, None)
+        page_sizes.record("AccountsRoute", 12, 12, 5.0, None)
+
+        # Assert
+        assert page_sizes.size("TransactionsRoute") == 150
+        assert page_sizes.size("AccountsRoute") == 10
+
+    def test_pages_of_older_lists_do_not_resize_again(self, page_sizes):
+        # Arrange
+        page_sizes.record("TransactionsRoute", 100, 100, 0.1, None)
+
+        # Act
+        page_sizes.record("TransactionsRoute", 100, 100, 0.1, None)
+        page_sizes.record("TransactionsRoute", 100, 100, 5.0, None)
+
+        # Assert
+        assert page_sizes.size("TransactionsRoute") == 200
+        assert page_sizes.stats()["TransactionsRoute"]["increases"] == 1
+
+    def test_policy_page_size_pins_the_size(self, page_sizes, settings):
+        # Arrange
+        settings.OFDA_ROUTE_POLICIES = ["TransactionsRoute.page_size=25"]
+
+        # Act
+        page_sizes.record("TransactionsRoute", 25, 25, 0.1, None)
+
+        # Assert
+        assert page_sizes.size("TransactionsRoute") == 25
+        assert page_sizes.stats() == {}
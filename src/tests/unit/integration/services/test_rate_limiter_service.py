@@ -0,0 +1,161 @@
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.utils.deadline import DeadlineExceededError, deadline_scope
+from src.integration.services.rate_limiter_service import (
+    FairQueue,
+    RateLimiterService,
+    RateLimitTimeoutError,
+)
+
+
+class AccountsRoute:
+    pass
+
+
+class TransactionsRoute:
+    pass
+
+
+class TestFairQueue:
+    def test_clients_take_turns(self):
+        # Arrange
+        queue = FairQueue()
+        tickets = [
+            ("user-a", queue.join("user-a")),
+            ("user-a", queue.join("user-a")),
+            ("user-a", queue.join("user-a")),
+            ("user-b", queue.join("user-b")),
+        ]
+
+        # Act
+        served = []
+        while len(queue):
+            client, ticket = next(
+                (client, ticket)
+                for client, ticket in tickets
+                if queue.is_next(client, ticket)
+            )
+            served.append(client)
+            queue.leave(client, ticket)
+            tickets.remove((client, ticket))
+
+        # Assert
+        assert served == ["user-a", "user-b", "user-a", "user-a"]
+
+
+class TestRateLimiterService:
+    @pytest.fixture
+    def limiter(self, settings):
+        settings.OFDA_RATE_LIMIT = 20
+        settings.OFDA_RATE_LIMITS = []
+        settings.OFDA_RATE_LIMIT_BURST = 2
+        settings.OFDA_RATE_LIMIT_RESERVATION = 1
+        settings.OFDA_RATE_LIMIT_MAX_WAIT = 5
+        limiter = RateLimiterService()
+        limiter._redis_available = False
+        return limiter
+
+    def test_disabled_limiter_does_not_count_calls(self, limiter, settings):
+        # Arrange
+        settings.OFDA_RATE_LIMIT = 0
+
+        # Act
+        limiter.acquire(AccountsRoute())
+
+        # Assert
+        assert limiter.stats() == {}
+
+    def test_calls_over_the_burst_wait_for_a_token(self, limiter):
+        # Act
+        for _ in range(3):
+            limiter.acquire(AccountsRoute())
+
+        # Assert
+        stats = limiter.stats()["AccountsRoute"]
+        assert stats["acquired"] == 3
+        assert stats["queued_calls"] == 1
+        assert stats["wait_seconds"] == pytest.approx(0.05, abs=0.04)
+
+    def test_route_class_rates_override_the_default(self, limiter, settings):
+        # Arrange
+        settings.OFDA_RATE_LIMITS = ["TransactionsRoute=0"]
+
+        # Act
+        for _ in range(5):
+            limiter.acquire(TransactionsRoute())
+
+        # Assert
+        assert limiter.rate_for("TransactionsRoute") == 0
+        assert limiter.rate_for("AccountsRoute") == 20
+        assert "TransactionsRoute" not in limiter.stats()
+
+    def test_gives_up_after_max_wait(self, limiter, settings):
+        # Arrange
+        settings.OFDA_RATE_LIMIT = 0.01
+        settings.OFDA_RATE_LIMIT_BURST = 1
+        settings.OFDA_RATE_LIMIT_MAX_WAIT = 0.05
+        limiter.acquire(AccountsRoute())
+
+        # Act / Assert
+        with pytest.raises(RateLimitTimeoutError):
+            limiter.acquire(AccountsRoute())
+
+    def test_waits_no_longer_than_the_deadline(self, limiter, settings):
+        # Arrange
+        settings.OFDA_RATE_LIMIT = 0.01
+        settings.OFDA_RATE_LIMIT_BURST = 1
+        limiter.acquire(AccountsRoute())
+
+        # Act / Assert
+        with deadline_scope(0.05), pytest.raises(DeadlineExceededError):
+            limiter.acquire(AccountsRoute())
+
+    def test_max_wait_applies_within_a_longer_deadline(
+        self, limiter, settings
+    ):
+        # Arrange
+        settings.OFDA_RATE_LIMIT = 0.01
+        settings.OFDA_RATE_LIMIT_BURST = 1
+        settings.OFDA_RATE_LIMIT_MAX_WAIT = 0.05
+        limiter.acquire(AccountsRoute())
+
+        # Act
+        started = time.monotonic()
+        with deadline_scope(10), pytest.raises(RateLimitTimeoutError):
+            limiter.acquire(AccountsRoute())
+
+        # Assert
+        assert time.monotonic() - started < 1
+
+    def test_reserves_tokens_from_redis(self, limiter, settings):
+        # Arrange
+        settings.OFDA_RATE_LIMIT_RESERVATION = 5
+        settings.OFDA_RATE_LIMIT_BURST = 10
+        script = Mock(return_value=[5, b"0"])
+        limiter._redis_available = True
+        limiter._script = script
+
+        # Act
+        for _ in range(5):
+            limiter.acquire(AccountsRoute())
+
+        # Assert
+        script.assert_called_once_with(
+            keys=["ofda_rate_limit:AccountsRoute"], args=[20, 10, 5]
+        )
+        assert limiter.stats()["AccountsRoute"]["acquired"] == 5
+
+    def test_redis_errors_let_calls_through(self, limiter):
+        # Arrange
+        limiter._redis_available = True
+        limiter._script = Mock(side_effect=ConnectionError("redis down"))
+
+        # Act
+        for _ in range(3):
+            limiter.acquire(AccountsRoute())
+
+        # Assert
+        assert limiter.stats()["AccountsRoute"]["queued_calls"] == 0
@@ -0,0 +1,56 @@
+from unittest.mock import Mock
+
+import pytest
+
+from src.integration.dtos.integration_dtos import (
+    CompactIntegrationResultDTO,
+    IntegrationResultDTO,
+)
+from src.integration.services.router_service import RouterService
+
+
+class TestRouterService:
+    @pytest.fixture
+    def router_service(self):
+        return RouterService()
+
+    @pytest.fixture
+    def response(self):
+        response = Mock()
+        response.status_code = 200
+        response.headers = {"Content-Type": "application/json"}
+        response.json.return_value = {"items": []}
+        response.url = "http://test-api.com/account"
+        return response
+
+    def test_router_process_returns_compact_result(
+        self, router_service, response
+    ):
+        # Arrange
+        route = Mock()
+        route.stream_response = False
+        route.integrate.return_value = IntegrationResultDTO(
+            success=True, response=response
+        )
+
+        # Act
+        result = router_service.router_process(route)
+
+        # Assert
+        assert isinstance(result, CompactIntegrationResultDTO)
+        assert result.response.json() == {"items": []}
+
+    def test_router_process_keeps_streamed_response(
+        self, router_service, response
+    ):
+        # Arrange
+        route = Mock()
+        route.stream_response = True
+        expected = IntegrationResultDTO(success=True, response=response)
+        route.integrate.return_value = expected
+
+        # Act
+        result = router_service.router_process(route)
+
+        # Assert
+        assert result is expected
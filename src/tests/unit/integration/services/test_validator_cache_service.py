@@ -0,0 +1,162 @@
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import ClassVar
+from unittest.mock import patch
+
+import pytest
+
+from src.integration.enums import RouteMethod
+from src.integration.routes.base import BaseRoute
+from src.integration.services.connection_pool_service import (
+    ConnectionPoolService,
+)
+from src.integration.services.rate_limiter_service import rate_limit_scope
+from src.integration.services.validator_cache_service import (
+    ValidatorCacheService,
+)
+
+BALANCE = {"balance": 1500.75, "currency": "BRL"}
+
+
+class ValidatorHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests_seen: ClassVar[list[dict[str, str]]] = []
+
+    def do_GET(self):
+        body = json.dumps(BALANCE).encode()
+        etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+        self.requests_seen.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class BalanceRoute(BaseRoute):
+    def __init__(self, base_url, token):
+        super().__init__()
+        self._base_url = base_url
+        self._token = token
+
+    def get_base_url(self):
+        return self._base_url
+
+    def get_resource_path(self):
+        return "/account/acc-1/balance"
+
+    def get_authorization_header(self):
+        return {"Authorization": self._token}
+
+    def set_method(self):
+        self.method = RouteMethod.GET
+
+
+class TestValidatorCacheService:
+    @pytest.fixture(autouse=True)
+    def locmem_cache(self, settings):
+        settings.CACHES = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "validator-cache-tests",
+            }
+        }
+        settings.OFDA_CONDITIONAL_GET = True
+        yield
+        from django.core.cache import cache
+
+        cache.clear()
+
+    @pytest.fixture
+    def local_server(self):
+        ValidatorHandler.requests_seen = []
+        server = ThreadingHTTPServer(("127.0.0.1", 0), ValidatorHandler)
+        thread = threading.Thread(
+            target=server.serve_forever, args=(0.05,), daemon=True
+        )
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+        server.shutdown()
+        server.server_close()
+
+    @pytest.fixture
+    def services(self):
+        pool_service = ConnectionPoolService()
+        cache_service = ValidatorCacheService()
+        with (
+            patch("src.integration.routes.base.connection_pool", pool_service),
+            patch(
+                "src.integration.routes.base.validator_cache", cache_service
+            ),
+        ):
+            yield cache_service
+        pool_service.close_all()
+
+    def test_second_get_is_served_from_304(self, local_server, services):
+        # Act
+        first = BalanceRoute(local_server, "token-a").integrate()
+        second = BalanceRoute(local_server, "token-a").integrate()
+
+        # Assert
+        assert first.response.json() == BALANCE
+        assert second.success is True
+        assert second.response.status_code == 200
+        assert second.response.json() == BALANCE
+        assert "If-None-Match" in ValidatorHandler.requests_seen[1]
+        assert services.stats() == {
+            "stored": 1,
+            "revalidated": 1,
+            "modified": 0,
+        }
+
+    def test_validators_are_scoped_per_token(self, local_server, services):
+        # Act
+        BalanceRoute(local_server, "token-a").integrate()
+        BalanceRoute(local_server, "token-b").integrate()
+
+        # Assert
+        assert "If-None-Match" not in ValidatorHandler.requests_seen[1]
+        assert services.stats()["revalidated"] == 0
+
+    def test_validators_survive_token_rotation_for_one_user(
+        self, local_server, services
+    ):
+        # Act
+        with rate_limit_scope("12345678901"):
+            BalanceRoute(local_server, "token-a").integrate()
+            second = BalanceRoute(local_server, "token-b").integrate()
+        with rate_limit_scope("10987654321"):
+            BalanceRoute(local_server, "token-c").integrate()
+
+        # Assert
+        assert "If-None-Match" in ValidatorHandler.requests_seen[1]
+        assert ValidatorHandler.requests_seen[1]["Authorization"] == "token-b"
+        assert second.response.json() == BALANCE
+        assert "If-None-Match" not in ValidatorHandler.requests_seen[2]
+        assert services.stats()["revalidated"] == 1
+
+    def test_disabled_cache_sends_plain_get(
+        self, local_server, services, settings
+    ):
+        # Arrange
+        settings.OFDA_CONDITIONAL_GET = False
+
+        # Act
+        BalanceRoute(local_server, "token-a").integrate()
+        BalanceRoute(local_server, "token-a").integrate()
+
+        # Assert
+        assert "If-None-Match" not in ValidatorHandler.requests_seen[1]
+        assert services.stats()["stored"] == 0
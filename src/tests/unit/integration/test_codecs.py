@@ -0,0 +1,124 @@
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from src.integration.codecs import (
+    CodecResponse,
+    JSONCodec,
+    OrjsonCodec,
+    TransferStats,
+    get_accept_encoding,
+    get_json_codec,
+)
+from src.integration.services.connection_pool_service import (
+    ConnectionPoolService,
+)
+
+PAGE = {"items": [{"description": "repetitive text " * 20}] * 50}
+
+
+class GzipHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps(PAGE).encode()
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            self.send_response(200)
+            self.send_header("Content-Encoding", "gzip")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestJSONCodec:
+    def test_auto_prefers_orjson_when_available(self, settings):
+        # Arrange
+        settings.OFDA_JSON_CODEC = "auto"
+
+        # Act & Assert
+        with patch("src.integration.codecs.orjson", object()):
+            assert isinstance(get_json_codec(), OrjsonCodec)
+
+    def test_falls_back_to_stdlib_without_orjson(self, settings):
+        # Arrange
+        settings.OFDA_JSON_CODEC = "auto"
+
+        # Act & Assert
+        with patch("src.integration.codecs.orjson", None):
+            codec = get_json_codec()
+        assert type(codec) is JSONCodec
+        assert codec.loads(b'{"a": 1}') == {"a": 1}
+
+    def test_stdlib_codec_can_be_forced(self, settings):
+        # Arrange
+        settings.OFDA_JSON_CODEC = "json"
+
+        # Act & Assert
+        assert type(get_json_codec()) is JSONCodec
+
+
+class TestAcceptEncoding:
+    def test_keeps_preference_order_of_supported_encodings(self, settings):
+        # Arrange
+        settings.OFDA_ACCEPT_ENCODINGS = ["zstd", "br", "gzip"]
+
+        # Act
+        with patch("src.integration.codecs.ACCEPT_ENCODING", "gzip,br"):
+            accept_encoding = get_accept_encoding()
+
+        # Assert
+        assert accept_encoding == "br, gzip"
+
+    def test_identity_when_nothing_is_supported(self, settings):
+        # Arrange
+        settings.OFDA_ACCEPT_ENCODINGS = ["zstd"]
+
+        # Act & Assert
+        with patch("src.integration.codecs.ACCEPT_ENCODING", "gzip"):
+            assert get_accept_encoding() == "identity"
+
+
+class TestCompressedTransfer:
+    @pytest.fixture
+    def local_server(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), GzipHandler)
+        thread = threading.Thread(
+            target=server.serve_forever, args=(0.05,), daemon=True
+        )
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+        server.shutdown()
+        server.server_close()
+
+    def test_gzip_response_is_decoded_and_measured(self, local_server):
+        # Arrange
+        pool_service = ConnectionPoolService()
+        stats = TransferStats()
+        session = pool_service.get_session(local_server)
+
+        # Act
+        response = session.get(
+            f"{local_server}/page", headers={"Accept-Encoding": "gzip"}
+        )
+        stats.record_response("TransactionsRoute", response)
+        pool_service.close_all()
+
+        # Assert
+        assert isinstance(response, CodecResponse)
+        assert response.json() == PAGE
+        route_stats = stats.snapshot()["TransactionsRoute"]
+        assert route_stats["responses"] == 1
+        assert route_stats["decoded_bytes"] == len(json.dumps(PAGE))
+        assert route_stats["wire_bytes"] < route_stats["decoded_bytes"]
+        assert route_stats["compression_ratio"] > 1
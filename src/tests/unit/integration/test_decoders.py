@@ -0,0 +1,96 @@
+import io
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.integration.decoders import DecodedPage, StreamedPage
+
+
+def make_streamed_response(document):
+    body = json.dumps(document).encode()
+    response = Mock()
+    response.raw = io.BytesIO(body)
+    response.content = body
+    return response
+
+
+class TestStreamedPage:
+    @pytest.mark.parametrize(
+        "document",
+        [
+            {"items": [{"id": "tx-1"}, {"id": "tx-2"}], "has_next": True},
+            {"has_next": True, "items": [{"id": "tx-1"}, {"id": "tx-2"}]},
+        ],
+    )
+    def test_yields_items_and_reads_has_next(self, document):
+        # Arrange
+        response = make_streamed_response(document)
+        page = StreamedPage(response)
+
+        # Act
+        items = list(page)
+
+        # Assert
+        assert items == [{"id": "tx-1"}, {"id": "tx-2"}]
+        assert page.is_paginated is True
+        assert page.has_next is True
+        response.close.assert_called_once()
+
+    def test_preserves_nested_item_structure(self):
+        # Arrange
+        item = {
+            "id": "tx-1",
+            "transaction_amount": 10.5,
+            "tags": ["a", {"b": [1, 2]}],
+            "meta": {"items": [1]},
+        }
+        response = make_streamed_response({"items": [item]})
+        page = StreamedPage(response)
+
+        # Act
+        items = list(page)
+
+        # Assert
+        assert items == [item]
+        assert page.has_next is False
+
+    def test_yields_whole_document_when_not_paginated(self):
+        # Arrange
+        document = {"balance": 1500.75, "currency": "BRL"}
+        page = StreamedPage(make_streamed_response(document))
+
+        # Act & Assert
+        assert list(page) == [document]
+        assert page.is_paginated is False
+
+    def test_falls_back_to_buffered_decode_without_ijson(self):
+        # Arrange
+        document = {"items": [{"id": "tx-1"}], "has_next": True}
+        page = StreamedPage(make_streamed_response(document))
+
+        # Act
+        with patch("src.integration.decoders.ijson", None):
+            items = list(page)
+
+        # Assert
+        assert items == [{"id": "tx-1"}]
+        assert page.has_next is True
+
+
+class TestDecodedPage:
+    def test_paginated_document(self):
+        # Arrange
+        page = DecodedPage({"items": [{"id": "a"}], "has_next": True})
+
+        # Act & Assert
+        assert list(page) == [{"id": "a"}]
+        assert page.has_next is True
+
+    def test_single_item_document(self):
+        # Arrange
+        page = DecodedPage({"balance": 1})
+
+        # Act & Assert
+        assert list(page) == [{"balance": 1}]
+        assert page.has_next is False
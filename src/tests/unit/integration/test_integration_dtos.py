@@ -0,0 +1,82 @@
+import json
+from datetime import timedelta
+from unittest.mock import Mock
+
+import pytest
+from requests import Response
+
+from src.integration.dtos.integration_dtos import (
+    CompactIntegrationResultDTO,
+    IntegrationResultDTO,
+)
+
+
+def make_response(content, status_code=200, headers=None):
+    response = Response()
+    response.status_code = status_code
+    response.reason = "OK"
+    response.url = "http://test-api.com/account"
+    response.elapsed = timedelta(milliseconds=120)
+    response.headers.update(headers or {})
+    response._content = content
+    response.raw = Mock()
+    return response
+
+
+class TestCompactIntegrationResultDTO:
+    def test_from_result_keeps_decoded_body_and_releases_response(self):
+        # Arrange
+        response = make_response(
+            json.dumps({"items": [1, 2]}).encode(),
+            headers={
+                "Content-Type": "application/json",
+                "ETag": '"v1"',
+                "X-Request-Id": "abc",
+            },
+        )
+        result = IntegrationResultDTO(
+            success=True, request=Mock(), response=response
+        )
+
+        # Act
+        compact = CompactIntegrationResultDTO.from_result(result)
+
+        # Assert
+        assert compact.success is True
+        assert compact.body == {"items": [1, 2]}
+        assert compact.content is None
+        assert compact.headers == {
+            "Content-Type": "application/json",
+            "ETag": '"v1"',
+        }
+        assert not hasattr(compact, "__dict__")
+        response.raw.release_conn.assert_called_once()
+
+    def test_response_adapter_matches_response_api(self):
+        # Arrange
+        response = make_response(b'{"balance": 10}', headers={"ETag": "x"})
+
+        # Act
+        adapter = CompactIntegrationResultDTO.from_result(
+            IntegrationResultDTO(success=True, response=response)
+        ).response
+
+        # Assert
+        assert adapter.json() == response.json()
+        assert adapter.ok is True
+        assert adapter.status_code == 200
+        assert adapter.headers["etag"] == "x"
+        assert adapter.elapsed == timedelta(milliseconds=120)
+        assert adapter.url == "http://test-api.com/account"
+
+    def test_non_json_body_raises_like_the_response(self):
+        # Arrange
+        response = make_response(b"<html>maintenance</html>")
+        compact = CompactIntegrationResultDTO.from_result(
+            IntegrationResultDTO(success=True, response=response)
+        )
+
+        # Act & Assert
+        assert compact.content == b"<html>maintenance</html>"
+        with pytest.raises(ValueError):
+            compact.response.json()
@@ -0,0 +1,110 @@
+import pytest
+
+from src.core.utils.retry import RetryPolicy
+from src.financial.routes.accounts import AccountsRoute
+from src.financial.routes.transactions import TransactionsRoute
+from src.integration.enums import PaginationStyle
+from src.integration.policies import (
+    DEFAULT_POLICY,
+    RoutePolicy,
+    RoutePolicyRegistry,
+    route_policies,
+)
+
+
+class TestRoutePolicyRegistry:
+    @pytest.fixture
+    def registry(self, settings):
+        settings.OFDA_ROUTE_POLICIES = []
+        registry = RoutePolicyRegistry()
+        registry.register(
+            "TransactionsRoute",
+            RoutePolicy(
+                traffic_class="transactions",
+                hedge=True,
+                pagination=PaginationStyle.PAGE,
+            ),
+        )
+        return registry
+
+    def test_routes_register_their_declared_policy(self, settings):
+        # Arrange
+        settings.OFDA_ROUTE_POLICIES = []
+
+        # Act
+        policy = route_policies.for_route(TransactionsRoute(data={}))
+
+        # Assert
+        assert policy is TransactionsRoute.policy
+        assert policy.traffic_class == "transactions"
+        assert policy.pagination == PaginationStyle.PAGE
+        assert AccountsRoute(data={}).traffic_class == "accounts"
+
+    def test_undeclared_routes_get_the_default_policy(self, registry):
+        # Act
+        policy = registry.get("UnknownRoute")
+
+        # Assert
+        assert policy == DEFAULT_POLICY
+
+    def test_settings_override_single_fields(self, registry, settings):
+        # Arrange
+        settings.OFDA_ROUTE_POLICIES = [
+            "TransactionsRoute.timeout=60",
+            "TransactionsRoute.hedge=false",
+            "TransactionsRoute.cache_ttl=0",
+            "BalancesRoute.max_retries=1",
+        ]
+
+        # Act
+        policy = registry.get("TransactionsRoute")
+
+        # Assert
+        assert policy.timeout == 60
+        assert policy.hedge is False
+        assert policy.cache_ttl == 0
+        assert policy.max_retries == 3
+        assert policy.traffic_class == "transactions"
+
+    def test_overrides_follow_settings_changes(self, registry, settings):
+        # Arrange
+        settings.OFDA_ROUTE_POLICIES = ["TransactionsRoute.max_retries=1"]
+        assert registry.get("TransactionsRoute").max_retries == 1
+
+        # Act
+        settings.OFDA_ROUTE_POLICIES = []
+
+        # Assert
+        assert registry.get("TransactionsRoute").max_retries == 3
+
+    def test_unknown_field_is_rejected(self, registry, settings):
+        # Arrange
+        settings.OFDA_ROUTE_POLICIES = ["TransactionsRoute.retries=1"]
+
+        # Act / Assert
+        with pytest.raises(ValueError, match="retries"):
+            registry.get("TransactionsRoute")
+
+    def test_table_lists_active_policies(self, registry, settings):
+        # Arrange
+        settings.OFDA_ROUTE_POLICIES = ["TransactionsRoute.timeout=none"]
+
+        # Act
+        table = registry.table()
+
+        # Assert
+        assert list(table) == ["TransactionsRoute"]
+        assert table["TransactionsRoute"]["timeout"] is None
+        assert table["TransactionsRoute"]["pagination"] == "page"
+
+    def test_retry_policy_uses_route_rules(self):
+        # Act
+        retry_policy = RoutePolicy(
+            max_retries=1, retry_base_delay=0.2, retry_max_delay=2
+        ).retry_policy()
+
+        # Assert
+        assert isinstance(retry_policy, RetryPolicy)
+        assert retry_policy.max_retries == 1
+        assert retry_policy.base_delay == 0.2
+        assert retry_policy.max_delay == 2